@@ -0,0 +1,121 @@
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import weakref
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Import cache module in a way that works both as a package and as a script
+try:
+    from . import cache as disk_cache  # type: ignore
+except Exception:
+    try:
+        from backend import cache as disk_cache  # type: ignore
+    except Exception:
+        import cache as disk_cache  # type: ignore
+
+log = logging.getLogger("bindicator.addresses")
+
+# Address lists for a postcode almost never change, so entries live for weeks
+_TTL_DAYS = float(os.getenv("BINDICATOR_ADDRESS_TTL_DAYS", "30"))
+
+_store_lock = threading.Lock()
+_store: Optional[disk_cache.CacheBackend] = None
+# One lock per postcode so concurrent misses share a single upstream lookup
+# (asyncio locks, used only from the app's event loop). Weak values: a postcode's
+# lock goes away once no lookup for it is running or waiting.
+_async_key_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+_stats_lock = threading.Lock()
+STATS: Dict[str, int] = {"hits": 0, "misses": 0, "refreshes": 0, "shared": 0, "failures": 0}
+
+
+def _get_store() -> disk_cache.CacheBackend:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                store = disk_cache.create_backend("addresses")
+                store.load()
+                _store = store
+    return _store
+
+
+def close() -> None:
+    global _store
+    with _store_lock:
+        store, _store = _store, None
+    if store is not None:
+        store.close()
+
+
+atexit.register(close)
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        STATS[name] += 1
+
+
+def _fresh(record: Optional[Dict[str, Any]]) -> bool:
+    if not record or not isinstance(record.get("addresses"), list):
+        return False
+    fetched = disk_cache._parse_ts(record.get("fetched_at"))
+    if fetched is None:
+        return False
+    return datetime.now(timezone.utc) - fetched < timedelta(days=_TTL_DAYS)
+
+
+def _cached(record: Optional[Dict[str, Any]]) -> Optional[List[Dict[str, str]]]:
+    return list(record["addresses"]) if _fresh(record) else None
+
+
+def _store_addresses(store: disk_cache.CacheBackend, key: str, found: List[Any]) -> List[Dict[str, str]]:
+    addresses = [{"uprn": str(a["uprn"]), "address": str(a["address"])} for a in found]
+    if addresses:
+        store.put(key, {"addresses": addresses, "fetched_at": datetime.now(timezone.utc).isoformat()})
+        log.info("[addresses] Indexed %s addresses for %s", len(addresses), key)
+    return addresses
+
+
+async def lookup_async(
+    postcode: str,
+    fetch: Callable[[str], Awaitable[List[Dict[str, str]]]],
+    *,
+    refresh: bool = False,
+) -> List[Dict[str, str]]:
+    """Return ``[{"uprn", "address"}, ...]`` for a postcode, from the index when fresh.
+
+    On a miss (or ``refresh=True``) ``await fetch(postcode)`` runs once per postcode even
+    if several requests arrive together; the others wait and reuse its result. Empty
+    results are returned but not stored.
+    """
+    key = disk_cache._pretty_postcode(postcode)
+    store = _get_store()
+    if not refresh:
+        hit = _cached(store.get(key))
+        if hit is not None:
+            _count("hits")
+            return hit
+
+    lock = _async_key_locks.setdefault(key, asyncio.Lock())
+    contended = lock.locked()
+    async with lock:
+        hit = _cached(store.get(key)) if contended else None
+        if hit is not None:
+            _count("shared")
+            return hit
+        _count("refreshes" if refresh else "misses")
+        try:
+            found = await fetch(postcode)
+        except Exception:
+            _count("failures")
+            raise
+        return _store_addresses(store, key, found)
+
+
+def stats() -> Dict[str, Any]:
+    with _stats_lock:
+        counters = dict(STATS)
+    return {"entries": _get_store().count(), "ttlDays": _TTL_DAYS, **counters}
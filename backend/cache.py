@@ -1,21 +1,23 @@
+import atexit
 import json
+import logging
 import os
 import threading
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+import time
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 _DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 _CACHE_FILE = os.path.join(_DATA_DIR, "cache.json")
+_JOURNAL_ENABLED = os.getenv("BINDICATOR_CACHE_JOURNAL", "true").lower() in {"1", "true", "yes", "on"}
+_COMPACT_BYTES = int(os.getenv("BINDICATOR_CACHE_COMPACT_BYTES", str(4 * 1024 * 1024)))
+# Write-behind window for the JSON backend; 0 persists synchronously on every write
+_FLUSH_MS = int(os.getenv("BINDICATOR_CACHE_FLUSH_MS", "250"))
 
-_lock = threading.Lock()
-_cache: Dict[str, Dict[str, Any]] = {}
+log = logging.getLogger("bindicator.cache")
 
-
-def _ensure_paths() -> None:
-    os.makedirs(_DATA_DIR, exist_ok=True)
-    if not os.path.exists(_CACHE_FILE):
-        with open(_CACHE_FILE, "w", encoding="utf-8") as f:
-            f.write("{}")
+_backend_lock = threading.Lock()
+_backend: Optional["CacheBackend"] = None
 
 
 def _pretty_postcode(pc: str) -> str:
@@ -43,80 +45,557 @@ def _normalize_key(key: str) -> str:
     return _pretty_postcode(k)
 
 
-def load_cache() -> None:
-    global _cache
-    _ensure_paths()
+def _key_kind(key: str) -> str:
+    """'uprn' for UPRN entries, 'pc' for everything else (postcodes stored without prefix)."""
+    return "uprn" if key.lower().startswith("uprn:") else "pc"
+
+
+def _scope_matches(key: str, scope: str) -> bool:
+    """Scope semantics shared by all backends: 'uprn:', 'pc:' or a raw key prefix."""
+    scope_lower = scope.lower()
+    if scope_lower.startswith("uprn:"):
+        return _key_kind(key) == "uprn"
+    if scope_lower.startswith("pc:"):
+        return _key_kind(key) == "pc"
+    return key.lower().startswith(scope_lower)
+
+
+def _parse_ts(ts: Any) -> Optional[datetime]:
     try:
-        with open(_CACHE_FILE, "r", encoding="utf-8") as f:
-            _cache = json.load(f) or {}
-            if not isinstance(_cache, dict):
-                _cache = {}
-    except FileNotFoundError:
-        _cache = {}
+        return datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
     except Exception:
-        # If the cache file is corrupted, start fresh
-        _cache = {}
+        return None
+
+
+class CacheBackend:
+    """Storage behind the module-level cache functions.
+
+    Records are plain dicts shaped like ``{"data": {...}, "fetched_at": iso, "mixed_routes": ...}``.
+    Backends never mutate a record after storing it; callers always replace whole records.
+    """
+
+    name = "base"
+
+    def load(self) -> None:
+        """Prepare the store (open files/connections, replay journals)."""
+
+    def flush(self, *, fsync: bool = False) -> None:
+        """Persist anything buffered in memory."""
+
+    def close(self) -> None:
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Backend-specific counters for /api/health."""
+        return {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def put(self, key: str, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def update(self, key: str, fn: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        """Atomically replace ``key`` with ``fn(existing or {})`` and return the new record."""
+        raise NotImplementedError
+
+    def delete(self, keys: Iterable[str]) -> int:
+        raise NotImplementedError
+
+    def delete_scope(self, scope: str) -> int:
+        raise NotImplementedError
+
+    def items(self) -> Dict[str, Dict[str, Any]]:
+        raise NotImplementedError
+
+    def count(self, scope: Optional[str] = None) -> int:
+        raise NotImplementedError
+
+    def keys(self, limit: int) -> List[str]:
+        raise NotImplementedError
+
+    def mixed_routes(self) -> Dict[str, Dict[str, Any]]:
+        """Entries flagged with ``mixed_routes=True``."""
+        raise NotImplementedError
+
+    def remove_fetched_before(self, cutoff: datetime) -> int:
+        """Drop entries fetched before ``cutoff`` or with an unreadable timestamp.
+
+        Entries without any ``fetched_at`` (verification-only records) are kept.
+        """
+        raise NotImplementedError
 
 
-def save_cache() -> None:
-    _ensure_paths()
-    tmp = _CACHE_FILE + ".tmp"
-    with _lock:
+def _read_journal(path: str) -> List[Dict[str, Any]]:
+    ops: List[Dict[str, Any]] = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    op = json.loads(line)
+                except ValueError:
+                    # A torn last line after a crash; everything before it is intact
+                    continue
+                if isinstance(op, dict):
+                    ops.append(op)
+    except FileNotFoundError:
+        pass
+    return ops
+
+
+class JsonFileBackend(CacheBackend):
+    """Process-local dict mirrored into a JSON snapshot file.
+
+    Journal mode: each mutation is appended to ``<name>.journal`` as one JSON line
+    and replayed on load. Once the journal passes ``compact_bytes`` it is folded
+    back into the snapshot by a background thread. While a compaction is writing
+    the new snapshot, the journal it covers lives at ``<name>.journal.compacting``.
+
+    Write-behind: with ``flush_ms > 0`` mutations only update memory and mark the
+    store dirty; a single flusher thread persists them at most every ``flush_ms``
+    (journal lines, or one snapshot rewrite when the journal is off).
+    """
+
+    name = "json"
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        journal: bool = True,
+        compact_bytes: int = 4 * 1024 * 1024,
+        flush_ms: int = 0,
+    ):
+        self.path = path
+        self.journal_path = os.path.splitext(path)[0] + ".journal"
+        self.pending_path = self.journal_path + ".compacting"
+        self.journal = journal
+        self.compact_bytes = compact_bytes
+        self.flush_ms = max(0, flush_ms)
+        self._lock = threading.RLock()
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._journal_fh: Optional[IO[bytes]] = None
+        self._journal_bytes = 0
+        # Serialises snapshot writers so an older copy never lands after a newer one.
+        # Always taken before _lock, never while holding it.
+        self._compact_lock = threading.Lock()
+        self._compact_running = False
+        # Journal lines encoded at write time, so a flush is just one append
+        self._pending_lines: List[str] = []
+        self._dirty = False
+        self._wakeup = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._stopping = False
+        self._flushes = 0
+        self._last_flush_ms = 0.0
+
+    def _ensure_paths(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if not os.path.exists(self.path):
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write("{}")
+
+    def _apply(self, op: Dict[str, Any]) -> None:
+        """Apply one journal record to memory. Caller holds _lock."""
+        kind = op.get("op")
+        key = op.get("key")
+        if not isinstance(key, str):
+            return
+        if kind == "set" and isinstance(op.get("value"), dict):
+            self._data[key] = op["value"]
+        elif kind == "del":
+            self._data.pop(key, None)
+
+    def load(self) -> None:
+        """Load the snapshot and replay any journal records written since."""
+        self._ensure_paths()
+        with self._lock:
+            self._close_journal()
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f) or {}
+                self._data = data if isinstance(data, dict) else {}
+            except FileNotFoundError:
+                self._data = {}
+            except Exception:
+                # If the cache file is corrupted, start fresh
+                self._data = {}
+            # Records are full values, so replaying a journal the snapshot already
+            # covers (crash mid-compaction) is harmless.
+            for path in (self.pending_path, self.journal_path):
+                for op in _read_journal(path):
+                    self._apply(op)
+            leftover = os.path.exists(self.pending_path)
+            self._journal_bytes = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+        if not self.journal and (leftover or self._journal_bytes):
+            # Journal switched off since the last run: fold it in and drop it
+            self.save()
+            with self._lock:
+                for path in (self.pending_path, self.journal_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+                self._journal_bytes = 0
+        elif leftover or self._journal_bytes > self.compact_bytes:
+            self.compact()
+
+    def _write_snapshot(self, data: Dict[str, Dict[str, Any]], *, fsync: bool = False) -> None:
+        tmp = self.path + ".tmp"
         with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(_cache, f, ensure_ascii=False, indent=2)
-        os.replace(tmp, _CACHE_FILE)
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def save(self, *, fsync: bool = False) -> None:
+        """Persist the whole store. In journal mode this is a compaction."""
+        self._ensure_paths()
+        if self.journal:
+            self.compact(fsync=fsync)
+            return
+        with self._compact_lock:
+            with self._lock:
+                snapshot = dict(self._data)
+                self._dirty = False
+            self._write_snapshot(snapshot, fsync=fsync)
+
+    def flush(self, *, fsync: bool = False) -> None:
+        """Persist buffered write-behind changes now (optionally fsync'd)."""
+        started = time.perf_counter()
+        needs_compaction = False
+        if self.journal:
+            with self._lock:
+                lines, self._pending_lines = self._pending_lines, []
+                if lines or (fsync and self._journal_fh is not None):
+                    self._append_journal("".join(lines), fsync=fsync)
+                needs_compaction = self._journal_bytes > self.compact_bytes
+        elif self._dirty or fsync:
+            self.save(fsync=fsync)
+        else:
+            return
+        self._flushes += 1
+        self._last_flush_ms = (time.perf_counter() - started) * 1000.0
+        if needs_compaction:
+            self._compact_in_background()
+
+    def close(self) -> None:
+        """Stop the flusher and persist everything still buffered (fsync'd)."""
+        self._stopping = True
+        self._wakeup.set()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join(timeout=5.0)
+        self.flush(fsync=True)
+        with self._lock:
+            self._close_journal()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "journal": self.journal,
+                "journalBytes": self._journal_bytes,
+                "flushMs": self.flush_ms,
+                "pendingOps": len(self._pending_lines),
+                "dirty": self._dirty or bool(self._pending_lines),
+                "flushes": self._flushes,
+                "lastFlushMs": round(self._last_flush_ms, 3),
+            }
+
+    def _flush_loop(self) -> None:
+        interval = self.flush_ms / 1000.0
+        while not self._stopping:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopping:
+                break
+            try:
+                self.flush()
+            except Exception:
+                log.exception("Cache flush failed for %s", self.path)
+            # Coalesce: anything written while we sleep goes out in the next flush
+            time.sleep(interval)
+
+    def _schedule_flush(self) -> None:
+        if self._flusher is None:
+            with self._lock:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(target=self._flush_loop, name="cache-flush", daemon=True)
+                    self._flusher.start()
+        self._wakeup.set()
+
+    def _close_journal(self) -> None:
+        if self._journal_fh is not None:
+            try:
+                self._journal_fh.close()
+            finally:
+                self._journal_fh = None
+
+    @staticmethod
+    def _encode(op: Dict[str, Any]) -> str:
+        return json.dumps(op, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    def _append_journal(self, payload: str, *, fsync: bool = False) -> None:
+        """Append encoded records to the journal. Caller holds _lock so order matches memory."""
+        if self._journal_fh is None:
+            self._ensure_paths()
+            # Binary, so _journal_bytes counts what lands on disk (non-ASCII text, no newline translation)
+            self._journal_fh = open(self.journal_path, "ab")
+        data = payload.encode("utf-8")
+        self._journal_fh.write(data)
+        self._journal_fh.flush()
+        if fsync:
+            os.fsync(self._journal_fh.fileno())
+        self._journal_bytes += len(data)
+
+    def _stage(self, ops: List[Dict[str, Any]]) -> Optional[str]:
+        """Apply mutations to memory and buffer or journal them. Caller holds _lock.
+
+        Returns what is left for _persist() to do once _lock is released ("save",
+        "compact" or None): snapshot writers take _compact_lock before _lock, so they
+        must never be started from inside it.
+        """
+        if not ops:
+            return None
+        for op in ops:
+            self._apply(op)
+        if self.flush_ms and not self._stopping:
+            if self.journal:
+                self._pending_lines.extend(self._encode(op) for op in ops)
+            else:
+                self._dirty = True
+            self._schedule_flush()
+            return None
+        if not self.journal:
+            self._dirty = True
+            return "save"
+        self._append_journal("".join(self._encode(op) for op in ops))
+        return "compact" if self._journal_bytes > self.compact_bytes else None
+
+    def _persist(self, pending: Optional[str]) -> None:
+        """Finish a _stage() outside _lock."""
+        if pending == "save":
+            self.save()
+        elif pending == "compact":
+            self._compact_in_background()
+
+    def _commit(self, ops: List[Dict[str, Any]]) -> None:
+        """Apply mutations to memory and persist them (journal append or snapshot)."""
+        with self._lock:
+            pending = self._stage(ops)
+        self._persist(pending)
+
+    def compact(self, *, fsync: bool = False) -> None:
+        """Fold the journal into a fresh snapshot.
+
+        Writers are only blocked while the in-memory dict is copied and the journal
+        is rotated; the snapshot itself is serialised outside _lock.
+        """
+        self._ensure_paths()
+        with self._compact_lock:
+            with self._lock:
+                snapshot = dict(self._data)
+                self._close_journal()
+                if os.path.exists(self.journal_path):
+                    if os.path.exists(self.pending_path):
+                        with open(self.journal_path, "r", encoding="utf-8") as src, open(
+                            self.pending_path, "a", encoding="utf-8"
+                        ) as dst:
+                            dst.write(src.read())
+                        os.remove(self.journal_path)
+                    else:
+                        os.replace(self.journal_path, self.pending_path)
+                self._journal_bytes = 0
+            self._write_snapshot(snapshot, fsync=fsync)
+            if os.path.exists(self.pending_path):
+                os.remove(self.pending_path)
+
+    def _compact_in_background(self) -> None:
+        with self._lock:
+            if self._compact_running:
+                return
+            self._compact_running = True
+
+        def _run() -> None:
+            try:
+                self.compact()
+            except Exception:
+                log.exception("Cache compaction failed for %s", self.path)
+            finally:
+                with self._lock:
+                    self._compact_running = False
+
+        threading.Thread(target=_run, name="cache-compact", daemon=True).start()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._data.get(key)
+
+    def put(self, key: str, record: Dict[str, Any]) -> None:
+        self._commit([{"op": "set", "key": key, "value": record}])
+
+    def update(self, key: str, fn: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        with self._lock:
+            # Copy rather than mutate in place: a compaction may be serialising the old dict
+            record = fn(dict(self._data.get(key) or {}))
+            pending = self._stage([{"op": "set", "key": key, "value": record}])
+        self._persist(pending)
+        return record
+
+    def delete(self, keys: Iterable[str]) -> int:
+        with self._lock:
+            present = [k for k in keys if k in self._data]
+            pending = self._stage([{"op": "del", "key": k} for k in present])
+        self._persist(pending)
+        return len(present)
+
+    def delete_scope(self, scope: str) -> int:
+        with self._lock:
+            keys = [k for k in self._data if _scope_matches(k, scope)]
+        return self.delete(keys)
+
+    def items(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return dict(self._data)
+
+    def count(self, scope: Optional[str] = None) -> int:
+        with self._lock:
+            if not scope:
+                return len(self._data)
+            return sum(1 for k in self._data if _scope_matches(k, scope))
+
+    def keys(self, limit: int) -> List[str]:
+        with self._lock:
+            return list(self._data.keys())[: max(0, limit)]
+
+    def mixed_routes(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {k: v for k, v in self._data.items() if v.get("mixed_routes") is True}
+
+    def remove_fetched_before(self, cutoff: datetime) -> int:
+        with self._lock:
+            stale = []
+            for k, item in self._data.items():
+                if not isinstance(item, dict):
+                    stale.append(k)
+                    continue
+                raw = item.get("fetched_at")
+                if not isinstance(raw, str):
+                    # Verification-only entries carry no fetch timestamp; keep them
+                    continue
+                ts = _parse_ts(raw)
+                if ts is None or ts < cutoff:
+                    stale.append(k)
+        return self.delete(stale)
+
+
+def create_backend(name: str = "cache") -> CacheBackend:
+    """Build the configured backend for a named store (``cache``, ...).
+
+    ``BINDICATOR_CACHE_BACKEND`` selects ``json`` (default) or ``sqlite``. JSON stores
+    live at ``data/<name>.json``; SQLite stores are tables in one shared database
+    (``BINDICATOR_CACHE_DB``, default ``data/cache.sqlite3``).
+    """
+    kind = os.getenv("BINDICATOR_CACHE_BACKEND", "json").lower()
+    if kind == "sqlite":
+        try:
+            from .cache_sqlite import SQLiteBackend  # type: ignore
+        except ImportError:
+            from cache_sqlite import SQLiteBackend  # type: ignore
+        db_path = os.getenv("BINDICATOR_CACHE_DB", os.path.join(_DATA_DIR, "cache.sqlite3"))
+        return SQLiteBackend(db_path, table=name)
+    if kind != "json":
+        log.warning("Unknown BINDICATOR_CACHE_BACKEND=%r; using json", kind)
+    path = _CACHE_FILE if name == "cache" else os.path.join(_DATA_DIR, f"{name}.json")
+    return JsonFileBackend(path, journal=_JOURNAL_ENABLED, compact_bytes=_COMPACT_BYTES, flush_ms=_FLUSH_MS)
+
+
+def get_backend() -> CacheBackend:
+    """Return the active backend, creating and loading it on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                backend = create_backend()
+                backend.load()
+                _backend = backend
+    return _backend
+
+
+def set_backend(backend: CacheBackend) -> None:
+    """Swap in a specific backend (tools, benchmarks). The caller loads it."""
+    global _backend
+    with _backend_lock:
+        old, _backend = _backend, backend
+    if old is not None and old is not backend:
+        old.close()
+
+
+def load_cache() -> None:
+    """(Re)open the configured backend and load its contents."""
+    backend = create_backend()
+    backend.load()
+    set_backend(backend)
+
+
+def flush_cache(*, fsync: bool = False) -> None:
+    """Push buffered write-behind changes to disk now."""
+    if _backend is not None:
+        _backend.flush(fsync=fsync)
+
+
+def close_cache() -> None:
+    """Flush (with fsync) and release the active backend. Safe to call more than once."""
+    global _backend
+    with _backend_lock:
+        backend, _backend = _backend, None
+    if backend is not None:
+        backend.close()
+
+
+def cache_stats() -> Dict[str, Any]:
+    backend = get_backend()
+    return {"backend": backend.name, **backend.stats()}
 
 
 def get_cached(postcode: str) -> Optional[Dict[str, Any]]:
     key = _pretty_postcode(postcode)
-    with _lock:
-        item = _cache.get(key)
-        if not item or not isinstance(item, dict):
-            return None
-        return {"key": key, **item}
+    item = get_backend().get(key)
+    if not item or not isinstance(item, dict):
+        return None
+    return {"key": key, **item}
 
 
 def get_cached_key(key: str) -> Optional[Dict[str, Any]]:
     norm = _normalize_key(key)
-    with _lock:
-        item = _cache.get(norm)
-        if not item or not isinstance(item, dict):
-            return None
-        return {"key": norm, **item}
+    item = get_backend().get(norm)
+    if not item or not isinstance(item, dict):
+        return None
+    return {"key": norm, **item}
+
+
+def _merge_record(data: Dict[str, Any], extras: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build(existing: Dict[str, Any]) -> Dict[str, Any]:
+        # preserve existing mixed_routes metadata unless explicitly provided
+        return {
+            "data": data,
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "mixed_routes": extras.get("mixed_routes", existing.get("mixed_routes", None)),
+            "mixed_routes_checked": extras.get("mixed_routes_checked", existing.get("mixed_routes_checked", False)),
+            "mixed_routes_checked_at": extras.get("mixed_routes_checked_at", existing.get("mixed_routes_checked_at")),
+            "mixed_routes_details": extras.get("mixed_routes_details", existing.get("mixed_routes_details")),
+            # Full parsed schedule: [{"date": iso, "bins": [...]}, ...]
+            "schedule": extras.get("schedule"),
+        }
+
+    return _build
 
 
 def update_cache(postcode: str, data: Dict[str, Any], **extras: Any) -> None:
-    key = _pretty_postcode(postcode)
-    # preserve existing mixed_routes metadata unless explicitly provided
-    existing = _cache.get(key) or {}
-    record = {
-        "data": data,
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
-        "mixed_routes": extras.get("mixed_routes", existing.get("mixed_routes", None)),
-        "mixed_routes_checked": extras.get("mixed_routes_checked", existing.get("mixed_routes_checked", False)),
-        "mixed_routes_checked_at": extras.get("mixed_routes_checked_at", existing.get("mixed_routes_checked_at")),
-        "mixed_routes_details": extras.get("mixed_routes_details", existing.get("mixed_routes_details")),
-    }
-    with _lock:
-        _cache[key] = record
-    save_cache()
+    get_backend().update(_pretty_postcode(postcode), _merge_record(data, extras))
 
 
 def update_cache_key(key: str, data: Dict[str, Any], **extras: Any) -> None:
-    norm = _normalize_key(key)
-    # preserve existing mixed_routes metadata unless explicitly provided
-    existing = _cache.get(norm) or {}
-    record = {
-        "data": data,
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
-        "mixed_routes": extras.get("mixed_routes", existing.get("mixed_routes", None)),
-        "mixed_routes_checked": extras.get("mixed_routes_checked", existing.get("mixed_routes_checked", False)),
-        "mixed_routes_checked_at": extras.get("mixed_routes_checked_at", existing.get("mixed_routes_checked_at")),
-        "mixed_routes_details": extras.get("mixed_routes_details", existing.get("mixed_routes_details")),
-    }
-    with _lock:
-        _cache[norm] = record
-    save_cache()
+    get_backend().update(_normalize_key(key), _merge_record(data, extras))
 
 
 def clean_old_entries(max_days: int = 30) -> int:
@@ -124,57 +603,213 @@ def clean_old_entries(max_days: int = 30) -> int:
     if max_days <= 0:
         return 0
     today = datetime.now(timezone.utc).date()
-    rem = 0
-    with _lock:
-        keys = list(_cache.keys())
-        for k in keys:
-            try:
-                ts = _cache[k].get("fetched_at")
-                d = datetime.fromisoformat(ts.replace("Z", "+00:00")).date() if isinstance(ts, str) else today
-                if (today - d).days > max_days:
-                    _cache.pop(k, None)
-                    rem += 1
-            except Exception:
-                _cache.pop(k, None)
-                rem += 1
-    if rem:
-        save_cache()
-    return rem
+    cutoff = datetime(today.year, today.month, today.day, tzinfo=timezone.utc) - timedelta(days=max_days)
+    return get_backend().remove_fetched_before(cutoff)
 
 
-def is_same_day_cached(postcode: str) -> bool:
-    item = get_cached(postcode)
-    if not item:
-        return False
-    ts = item.get("fetched_at")
+POLICIES = ("same_day", "collection_date")
+_policy_lock = threading.Lock()
+POLICY_STATS: Dict[str, Dict[str, int]] = {p: {"hits": 0, "misses": 0} for p in POLICIES}
+# Expired entries served stale (counted as misses above) while a refresh runs
+STALE_STATS: Dict[str, int] = {"served": 0}
+
+
+def active_policy() -> str:
+    """Validity policy from ``BINDICATOR_CACHE_POLICY`` (``collection_date`` by default)."""
+    policy = os.getenv("BINDICATOR_CACHE_POLICY", "collection_date").lower()
+    return policy if policy in POLICIES else "collection_date"
+
+
+def _env_float(name: str, default: float) -> float:
+    """A float setting from the environment; ``default`` if unset or malformed."""
     try:
-        cached_day = datetime.fromisoformat(str(ts).replace("Z", "+00:00")).date()
-    except Exception:
-        return False
-    return cached_day == datetime.now(timezone.utc).date()
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _policy_hours(name: str, default: float) -> float:
+    """A duration setting in hours."""
+    return _env_float(name, default)
+
+
+def _collection_cutoff(d: date) -> datetime:
+    """Moment a collection day stops counting as upcoming: end of day (UTC) minus the margin."""
+    margin = timedelta(hours=_policy_hours("BINDICATOR_CACHE_MARGIN_HOURS", 0.0))
+    return datetime.combine(d + timedelta(days=1), dtime.min, timezone.utc) - margin
+
+
+def _schedule_rows(item: Dict[str, Any]) -> List[Tuple[date, List[str]]]:
+    rows = []
+    for row in item.get("schedule") or []:
+        try:
+            rows.append((date.fromisoformat(str(row.get("date"))), list(row.get("bins") or [])))
+        except (AttributeError, ValueError):
+            continue
+    return sorted(rows)
+
+
+def upcoming_collections(item: Dict[str, Any], *, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Stored schedule rows that have not passed yet, soonest first."""
+    now = now or datetime.now(timezone.utc)
+    return [
+        {"date": d.isoformat(), "day": d.strftime("%A"), "bins": bins}
+        for d, bins in _schedule_rows(item)
+        if now < _collection_cutoff(d)
+    ]
 
 
-def is_same_day_cached_key(key: str) -> bool:
-    item = get_cached_key(key)
+def current_data(item: Dict[str, Any], *, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Copy of the cached response data, moved on to the next known collection once the stored one has passed."""
+    data = dict(item.get("data") or {})
+    upcoming = upcoming_collections(item, now=now)
+    if upcoming and upcoming[0]["date"] != data.get("nextCollectionDate"):
+        nxt = upcoming[0]
+        data.update({
+            "nextCollectionDate": nxt["date"],
+            "nextCollectionDay": nxt["day"],
+            "bins": nxt["bins"],
+            "noCollections": False,
+        })
+    return data
+
+
+def entry_expires_at(item: Dict[str, Any], policy: Optional[str] = None) -> Optional[datetime]:
+    """When a cached entry stops being served, or None if it is unusable.
+
+    - ``same_day``: the next UTC midnight after ``fetched_at``.
+    - ``collection_date``: the end (UTC) of the last known collection date (the stored
+      schedule, else ``nextCollectionDate``), minus ``BINDICATOR_CACHE_MARGIN_HOURS`` and
+      capped at ``BINDICATOR_CACHE_MAX_AGE_HOURS`` after the fetch. Entries without a
+      date (no collections) fall back to same-day.
+    """
+    policy = policy or active_policy()
+    fetched = _parse_ts(item.get("fetched_at")) if isinstance(item, dict) else None
+    if fetched is None:
+        return None
+    if fetched.tzinfo is None:
+        fetched = fetched.replace(tzinfo=timezone.utc)
+    same_day = datetime.combine(fetched.astimezone(timezone.utc).date() + timedelta(days=1), dtime.min, timezone.utc)
+    if policy != "collection_date":
+        return same_day
+    rows = _schedule_rows(item)
+    if rows:
+        last_date = rows[-1][0]
+    else:
+        data = item.get("data") if isinstance(item.get("data"), dict) else {}
+        try:
+            last_date = date.fromisoformat(str(data.get("nextCollectionDate")))
+        except ValueError:
+            return same_day
+    max_age = timedelta(hours=_policy_hours("BINDICATOR_CACHE_MAX_AGE_HOURS", 672.0))
+    return min(_collection_cutoff(last_date), fetched + max_age)
+
+
+def is_entry_valid(item: Optional[Dict[str, Any]], policy: Optional[str] = None, *, now: Optional[datetime] = None) -> bool:
     if not item:
         return False
-    ts = item.get("fetched_at")
-    try:
-        cached_day = datetime.fromisoformat(str(ts).replace("Z", "+00:00")).date()
-    except Exception:
-        return False
-    return cached_day == datetime.now(timezone.utc).date()
+    expires = entry_expires_at(item, policy)
+    return expires is not None and (now or datetime.now(timezone.utc)) < expires
+
+
+def _lookup_valid(item: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Apply the active policy to a cache read and count the outcome under every policy.
+
+    Counting the inactive policies too shows what switching would do to the hit rate.
+    """
+    now = datetime.now(timezone.utc)
+    verdicts = {p: is_entry_valid(item, p, now=now) for p in POLICIES}
+    count_lookup(verdicts)
+    return item if verdicts[active_policy()] else None
+
+
+def count_lookup(verdicts: Dict[str, bool]) -> None:
+    """Add one lookup to the per-policy hit/miss counters."""
+    with _policy_lock:
+        for p, ok in verdicts.items():
+            POLICY_STATS[p]["hits" if ok else "misses"] += 1
+
+
+def hit_window(item: Dict[str, Any], *, now: Optional[datetime] = None) -> Tuple[float, Dict[str, bool]]:
+    """(until, verdicts) for a valid entry: every policy's verdict and the entry's
+    current_data() stay the same until ``until`` (epoch seconds), so a response
+    rendered from it now can be reused until then."""
+    now = now or datetime.now(timezone.utc)
+    verdicts = {p: is_entry_valid(item, p, now=now) for p in POLICIES}
+    edges = [entry_expires_at(item, p) for p, ok in verdicts.items() if ok]
+    upcoming = [d for d, _ in _schedule_rows(item) if now < _collection_cutoff(d)]
+    if upcoming:
+        # current_data() moves on to the next date once this one passes
+        edges.append(_collection_cutoff(upcoming[0]))
+    until = min((e for e in edges if e is not None), default=now)
+    return until.timestamp(), verdicts
+
+
+def peek(key: str) -> Optional[Dict[str, Any]]:
+    """Stored record for ``key`` exactly as stored (no normalisation, no copy, no counting)."""
+    return get_backend().get(key)
+
+
+def stale_grace() -> timedelta:
+    """How long past expiry an entry may still be served stale (``BINDICATOR_CACHE_STALE_GRACE_HOURS``, 0 = off)."""
+    return timedelta(hours=max(0.0, _policy_hours("BINDICATOR_CACHE_STALE_GRACE_HOURS", 48.0)))
+
+
+def _lookup_servable(item: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """(entry, stale): like _lookup_valid, but an expired entry still inside the stale
+    grace window is returned with ``stale=True`` instead of as a miss."""
+    valid = _lookup_valid(item)
+    if valid is not None:
+        return valid, False
+    grace = stale_grace()
+    if item and grace:
+        expires = entry_expires_at(item)
+        if expires is not None and datetime.now(timezone.utc) < expires + grace:
+            with _policy_lock:
+                STALE_STATS["served"] += 1
+            return item, True
+    return None, False
+
+
+def get_servable_cached(postcode: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """Postcode entry if valid, or stale within the grace window; see _lookup_servable."""
+    return _lookup_servable(get_cached(postcode))
+
+
+def get_servable_cached_key(key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """Entry for ``key`` if valid, or stale within the grace window; see _lookup_servable."""
+    return _lookup_servable(get_cached_key(key))
+
+
+def policy_stats() -> Dict[str, Any]:
+    with _policy_lock:
+        return {
+            "active": active_policy(),
+            "stats": {p: dict(v) for p, v in POLICY_STATS.items()},
+            "staleGraceHours": stale_grace().total_seconds() / 3600,
+            "staleServed": STALE_STATS["served"],
+        }
 
 
 def iter_cached_postcodes() -> Dict[str, Dict[str, Any]]:
-    with _lock:
-        return dict(_cache)
+    return get_backend().items()
+
+
+def count_entries(scope: Optional[str] = None) -> int:
+    """Number of entries, optionally limited to a scope ('uprn:' or 'pc:')."""
+    return get_backend().count(scope)
+
+
+def list_keys(limit: int = 10) -> List[str]:
+    return get_backend().keys(limit)
+
+
+def iter_mixed_routes() -> Dict[str, Dict[str, Any]]:
+    return get_backend().mixed_routes()
 
 
 def get_entry(postcode: str) -> Optional[Dict[str, Any]]:
-    key = _pretty_postcode(postcode)
-    with _lock:
-        return _cache.get(key)
+    return get_backend().get(_pretty_postcode(postcode))
 
 
 def delete_key(key: str) -> bool:
@@ -186,21 +821,13 @@ def delete_key(key: str) -> bool:
     Returns True if a key was removed.
     """
     norm = _normalize_key(key)
-    removed = False
-    with _lock:
-        if norm in _cache:
-            _cache.pop(norm, None)
-            removed = True
-        else:
-            # Support deleting postcode entries addressed as 'pc:<pretty>'
-            if norm.lower().startswith("pc:"):
-                pretty = _pretty_postcode(norm.split(":", 1)[1])
-                if pretty in _cache:
-                    _cache.pop(pretty, None)
-                    removed = True
-    if removed:
-        save_cache()
-    return removed
+    backend = get_backend()
+    if backend.delete([norm]):
+        return True
+    # Support deleting postcode entries addressed as 'pc:<pretty>'
+    if norm.lower().startswith("pc:"):
+        return bool(backend.delete([_pretty_postcode(norm.split(":", 1)[1])]))
+    return False
 
 
 def delete_scope(prefix: str) -> int:
@@ -208,23 +835,10 @@ def delete_scope(prefix: str) -> int:
     prefix may be 'uprn:' or 'pc:'.
     - 'uprn:' removes keys starting with 'uprn:'.
     - 'pc:' removes all keys that are NOT 'uprn:' (i.e., postcode entries stored without prefix).
+    - '' removes everything.
     Returns number of removed entries.
     """
-    prefix_lower = prefix.lower()
-    removed = 0
-    with _lock:
-        if prefix_lower.startswith("uprn:"):
-            keys = [k for k in list(_cache.keys()) if k.lower().startswith("uprn:")]
-        elif prefix_lower.startswith("pc:"):
-            keys = [k for k in list(_cache.keys()) if not k.lower().startswith("uprn:")]
-        else:
-            keys = [k for k in list(_cache.keys()) if k.lower().startswith(prefix_lower)]
-        for k in keys:
-            _cache.pop(k, None)
-            removed += 1
-    if removed:
-        save_cache()
-    return removed
+    return get_backend().delete_scope(prefix)
 
 
 def update_verification(
@@ -233,15 +847,14 @@ def update_verification(
     mixed_routes: bool,
     details: Optional[Dict[str, Any]] = None,
 ) -> None:
-    key = _pretty_postcode(postcode)
-    with _lock:
-        entry = _cache.get(key) or {}
+    def _mark(entry: Dict[str, Any]) -> Dict[str, Any]:
         entry["mixed_routes"] = mixed_routes
         entry["mixed_routes_details"] = details or {}
         entry["mixed_routes_checked"] = True
         entry["mixed_routes_checked_at"] = datetime.now(timezone.utc).isoformat()
-        _cache[key] = entry
-    save_cache()
+        return entry
+
+    get_backend().update(_pretty_postcode(postcode), _mark)
 
 
 def should_throttle_verify(postcode: str, *, hours: int = 24) -> bool:
@@ -259,3 +872,274 @@ def should_throttle_verify(postcode: str, *, hours: int = 24) -> bool:
         return False
     delta = datetime.now(timezone.utc) - checked
     return delta.total_seconds() < hours * 3600
+
+
+# --- Access tracking ---
+#
+# Every lookup bumps a per-key score that halves every BINDICATOR_ACCESS_HALF_LIFE_HOURS,
+# so the score is roughly "requests in the last half-life or so". Scores live in memory
+# and are persisted to the ``access`` store (next to the cache) every
+# _ACCESS_FLUSH_SECONDS and on shutdown. The prefetch scheduler uses them to refresh the
+# hottest stale entries first and to evict entries that have gone cold.
+
+_ACCESS_HALF_LIFE_HOURS = max(0.1, _policy_hours("BINDICATOR_ACCESS_HALF_LIFE_HOURS", 72.0))
+# Below this decayed score an entry is cold: one request ~10 days ago with the default half-life
+_ACCESS_COLD_SCORE = _env_float("BINDICATOR_ACCESS_COLD_SCORE", 0.1)
+_ACCESS_FLUSH_SECONDS = 60.0
+
+_access_lock = threading.Lock()
+_access_store: Optional[CacheBackend] = None
+# key -> {"hits": total lookups, "score": decayed score at last_access, "last_access": epoch seconds}
+_access: Dict[str, Dict[str, float]] = {}
+_access_dirty: Set[str] = set()
+_access_flushed = 0.0
+
+
+def _access_key(key: str) -> str:
+    """Key the entry is stored under: 'uprn:<id>' or the pretty postcode ('pc:' dropped)."""
+    norm = _normalize_key(key)
+    return _pretty_postcode(norm[3:]) if norm.lower().startswith("pc:") else norm
+
+
+def _decay(score: float, since: float, now: float) -> float:
+    return score * 0.5 ** (max(0.0, now - since) / (_ACCESS_HALF_LIFE_HOURS * 3600.0))
+
+
+def _access_records() -> Dict[str, Dict[str, float]]:
+    """The in-memory access table, loaded from the ``access`` store on first use. Caller holds _access_lock."""
+    global _access_store, _access_flushed
+    if _access_store is None:
+        store = create_backend("access")
+        store.load()
+        for key, rec in store.items().items():
+            try:
+                _access[key] = {
+                    "hits": int(rec.get("hits", 0)),
+                    "score": float(rec["score"]),
+                    "last_access": float(rec["last_access"]),
+                }
+            except (KeyError, TypeError, ValueError):
+                continue
+        _access_store = store
+        _access_flushed = time.monotonic()
+    return _access
+
+
+def record_access(key: str) -> None:
+    """Count one lookup of ``key`` (accepts the same aliases as delete_key)."""
+    key = _access_key(key)
+    if not key:
+        return
+    now = time.time()
+    with _access_lock:
+        records = _access_records()
+        rec = records.get(key)
+        if rec is None:
+            records[key] = {"hits": 1, "score": 1.0, "last_access": now}
+        else:
+            rec["score"] = _decay(rec["score"], rec["last_access"], now) + 1.0
+            rec["hits"] += 1
+            rec["last_access"] = now
+        _access_dirty.add(key)
+        due = time.monotonic() - _access_flushed >= _ACCESS_FLUSH_SECONDS
+    if due:
+        flush_access()
+
+
+def flush_access() -> None:
+    """Persist scores changed since the last flush."""
+    global _access_flushed
+    with _access_lock:
+        store = _access_store
+        if store is None:
+            return
+        changed = {k: dict(_access[k]) for k in _access_dirty if k in _access}
+        gone = [k for k in _access_dirty if k not in _access]
+        _access_dirty.clear()
+        _access_flushed = time.monotonic()
+    for key, rec in changed.items():
+        store.put(key, rec)
+    if gone:
+        store.delete(gone)
+
+
+def close_access() -> None:
+    global _access_store
+    flush_access()
+    with _access_lock:
+        store, _access_store = _access_store, None
+        _access.clear()
+    if store is not None:
+        store.close()
+
+
+def access_scores(items: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
+    """Current decayed score for each cached entry in ``items``.
+
+    Entries with no recorded lookups (cached before tracking started) count as one
+    lookup at their fetch time; a record is seeded for them so a later refresh does
+    not make them look recently used.
+    """
+    now = time.time()
+    scores: Dict[str, float] = {}
+    with _access_lock:
+        records = _access_records()
+        for key, item in items.items():
+            rec = records.get(key)
+            if rec is None:
+                fetched = _parse_ts(item.get("fetched_at")) if isinstance(item, dict) else None
+                if fetched is not None and fetched.tzinfo is None:
+                    fetched = fetched.replace(tzinfo=timezone.utc)
+                at = fetched.timestamp() if fetched is not None else 0.0
+                rec = records[key] = {"hits": 0, "score": _decay(1.0, at, now), "last_access": now}
+                _access_dirty.add(key)
+            scores[key] = _decay(rec["score"], rec["last_access"], now)
+    return scores
+
+
+def is_cold(score: float) -> bool:
+    return score < _ACCESS_COLD_SCORE
+
+
+def evict(keys: Iterable[str]) -> int:
+    """Delete cache entries together with their access records. Returns entries removed."""
+    keys = list(keys)
+    with _access_lock:
+        for key in keys:
+            if _access.pop(key, None) is not None:
+                _access_dirty.add(key)
+    removed = get_backend().delete(keys)
+    flush_access()
+    return removed
+
+
+def prune_access(cached: Iterable[str]) -> int:
+    """Forget cold access records for keys that are no longer cached (typos, evicted entries)."""
+    present = set(cached)
+    now = time.time()
+    with _access_lock:
+        records = _access_records()
+        gone = [
+            k for k, rec in records.items()
+            if k not in present and is_cold(_decay(rec["score"], rec["last_access"], now))
+        ]
+        for key in gone:
+            del records[key]
+        _access_dirty.update(gone)
+    if gone:
+        flush_access()
+    return len(gone)
+
+
+def access_stats(top: int = 10) -> Dict[str, Any]:
+    now = time.time()
+    with _access_lock:
+        records = _access_records()
+        scored = sorted(
+            ((k, _decay(r["score"], r["last_access"], now), r) for k, r in records.items()),
+            key=lambda t: t[1],
+            reverse=True,
+        )
+        pending = len(_access_dirty)
+    return {
+        "tracked": len(scored),
+        "cold": sum(1 for _, score, _ in scored if is_cold(score)),
+        "halfLifeHours": _ACCESS_HALF_LIFE_HOURS,
+        "coldScore": _ACCESS_COLD_SCORE,
+        "pendingWrites": pending,
+        "hottest": [
+            {
+                "key": k,
+                "score": round(score, 2),
+                "hits": int(r["hits"]),
+                "lastAccessAt": datetime.fromtimestamp(r["last_access"], timezone.utc).isoformat(),
+            }
+            for k, score, r in scored[: max(0, top)]
+        ],
+    }
+
+
+# --- Negative cache ---
+#
+# Failed lookups are remembered in the ``negative`` store, keyed like the cache itself,
+# so a repeat of a lookup that just failed is answered without going upstream. Each
+# outcome has its own TTL in seconds:
+#   no_addresses   (BINDICATOR_NEGATIVE_TTL_NO_ADDRESSES, 6 h): the postcode lists no addresses
+#   no_collections (BINDICATOR_NEGATIVE_TTL_NO_COLLECTIONS, 1 h): no collection table on the page
+#   upstream_error (BINDICATOR_NEGATIVE_TTL_UPSTREAM_ERROR, 60 s): RBWM failed or timed out
+
+NEGATIVE_TTLS: Dict[str, float] = {
+    "no_addresses": _env_float("BINDICATOR_NEGATIVE_TTL_NO_ADDRESSES", 6 * 3600.0),
+    "no_collections": _env_float("BINDICATOR_NEGATIVE_TTL_NO_COLLECTIONS", 3600.0),
+    "upstream_error": _env_float("BINDICATOR_NEGATIVE_TTL_UPSTREAM_ERROR", 60.0),
+}
+_negative_lock = threading.Lock()
+_negative_store: Optional[CacheBackend] = None
+NEGATIVE_STATS: Dict[str, Dict[str, int]] = {o: {"stored": 0, "hits": 0} for o in NEGATIVE_TTLS}
+
+
+def _negative() -> CacheBackend:
+    """The ``negative`` store, opened on first use with expired entries dropped."""
+    global _negative_store
+    if _negative_store is None:
+        with _negative_lock:
+            if _negative_store is None:
+                store = create_backend("negative")
+                store.load()
+                now = time.time()
+                store.delete([k for k, rec in store.items().items() if float(rec.get("expires", 0)) <= now])
+                _negative_store = store
+    return _negative_store
+
+
+def get_negative(key: str) -> Optional[Dict[str, Any]]:
+    """Unexpired failure recorded for ``key`` (``{"outcome", "status", "detail", "expires"}``), else None."""
+    rec = _negative().get(_access_key(key))
+    if not rec or float(rec.get("expires", 0)) <= time.time():
+        return None
+    with _negative_lock:
+        NEGATIVE_STATS.setdefault(rec.get("outcome", "upstream_error"), {"stored": 0, "hits": 0})["hits"] += 1
+    return rec
+
+
+def put_negative(key: str, outcome: str, *, status: int, detail: str) -> None:
+    """Remember a failed lookup for its outcome's TTL (no-op when that TTL is 0)."""
+    ttl = NEGATIVE_TTLS.get(outcome, 0.0)
+    if ttl <= 0:
+        return
+    _negative().put(
+        _access_key(key),
+        {"outcome": outcome, "status": status, "detail": detail, "expires": time.time() + ttl},
+    )
+    with _negative_lock:
+        NEGATIVE_STATS[outcome]["stored"] += 1
+
+
+def clear_negative(key: str) -> None:
+    """Forget a recorded failure (the key has just been fetched successfully)."""
+    _negative().delete([_access_key(key)])
+
+
+def close_negative() -> None:
+    global _negative_store
+    with _negative_lock:
+        store, _negative_store = _negative_store, None
+    if store is not None:
+        store.close()
+
+
+def negative_stats() -> Dict[str, Any]:
+    now = time.time()
+    live = sum(1 for rec in _negative().items().values() if float(rec.get("expires", 0)) > now)
+    with _negative_lock:
+        return {
+            "entries": live,
+            "ttlSeconds": dict(NEGATIVE_TTLS),
+            "outcomes": {o: dict(v) for o, v in NEGATIVE_STATS.items()},
+        }
+
+
+# Never lose write-behind changes on a clean interpreter exit
+atexit.register(close_cache)
+atexit.register(close_access)
+atexit.register(close_negative)
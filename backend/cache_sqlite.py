@@ -0,0 +1,167 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    from .cache import CacheBackend, _key_kind, _parse_ts  # type: ignore
+except ImportError:
+    from cache import CacheBackend, _key_kind, _parse_ts  # type: ignore
+
+
+def _fetched_epoch(record: Dict[str, Any]) -> Optional[float]:
+    """Indexed copy of ``fetched_at``: NULL when absent, 0 when unreadable (so sweeps drop it)."""
+    raw = record.get("fetched_at")
+    if not isinstance(raw, str):
+        return None
+    ts = _parse_ts(raw)
+    return ts.timestamp() if ts is not None else 0.0
+
+
+class SQLiteBackend(CacheBackend):
+    """Cache store in a SQLite database (WAL mode), safe to share between worker processes.
+
+    Each record is kept as a JSON blob next to a few indexed columns: ``kind``
+    ('uprn' or 'pc') for scope operations, ``fetched_at`` (epoch seconds) for
+    expiry sweeps and a partial index on ``mixed_routes`` for the health summary.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, *, table: str = "cache"):
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table):
+            raise ValueError(f"Invalid cache table name: {table!r}")
+        self.path = path
+        self.table = table
+        self._local = threading.local()
+        # Every thread's connection, so close() can close (and checkpoint) them all.
+        # close() bumps the generation; a thread holding an older connection reconnects.
+        self._conns_lock = threading.Lock()
+        self._conns: List[sqlite3.Connection] = []
+        self._generation = 0
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.generation != self._generation:
+            # Used only by this thread; check_same_thread is off so close() can run anywhere
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=30000")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conns_lock:
+                self._conns.append(conn)
+                self._local.generation = self._generation
+            self._local.conn = conn
+        return conn
+
+    def load(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        t = self.table
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {t} ("
+            " key TEXT PRIMARY KEY,"
+            " kind TEXT NOT NULL,"
+            " fetched_at REAL,"
+            " mixed_routes INTEGER NOT NULL DEFAULT 0,"
+            " record TEXT NOT NULL)"
+        )
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {t}_kind ON {t}(kind)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {t}_fetched_at ON {t}(fetched_at)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {t}_mixed ON {t}(key) WHERE mixed_routes = 1")
+
+    def close(self) -> None:
+        """Close every thread's connection (the last one out checkpoints the WAL)."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+            self._generation += 1
+        self._local.conn = None
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def _write(self, conn: sqlite3.Connection, key: str, record: Dict[str, Any]) -> None:
+        conn.execute(
+            f"INSERT INTO {self.table} (key, kind, fetched_at, mixed_routes, record) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET kind=excluded.kind, fetched_at=excluded.fetched_at,"
+            " mixed_routes=excluded.mixed_routes, record=excluded.record",
+            (
+                key,
+                _key_kind(key),
+                _fetched_epoch(record),
+                1 if record.get("mixed_routes") is True else 0,
+                json.dumps(record, ensure_ascii=False, separators=(",", ":")),
+            ),
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(f"SELECT record FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, record: Dict[str, Any]) -> None:
+        self._write(self._conn(), key, record)
+
+    def update(self, key: str, fn: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        conn = self._conn()
+        # IMMEDIATE takes the write lock up front so concurrent workers cannot
+        # interleave their read-modify-write cycles on the same key.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(f"SELECT record FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            record = fn(json.loads(row[0]) if row else {})
+            self._write(conn, key, record)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return record
+
+    @staticmethod
+    def _scope_where(scope: str) -> tuple[str, tuple]:
+        """WHERE clause for a scope ('uprn:', 'pc:', raw key prefix, or '' for everything)."""
+        scope_lower = scope.lower()
+        if scope_lower.startswith("uprn:"):
+            return " WHERE kind = 'uprn'", ()
+        if scope_lower.startswith("pc:"):
+            return " WHERE kind = 'pc'", ()
+        if not scope:
+            return "", ()
+        escaped = scope.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return " WHERE key LIKE ? ESCAPE '\\'", (escaped + "%",)
+
+    def _changes(self, sql: str, params: Iterable[Any] = ()) -> int:
+        return self._conn().execute(sql, tuple(params)).rowcount
+
+    def delete(self, keys: Iterable[str]) -> int:
+        conn = self._conn()
+        before = conn.total_changes
+        conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", [(k,) for k in keys])
+        return conn.total_changes - before
+
+    def delete_scope(self, scope: str) -> int:
+        sql, params = self._scope_where(scope)
+        return self._changes(f"DELETE FROM {self.table}{sql}", params)
+
+    def items(self) -> Dict[str, Dict[str, Any]]:
+        rows = self._conn().execute(f"SELECT key, record FROM {self.table}").fetchall()
+        return {k: json.loads(rec) for k, rec in rows}
+
+    def count(self, scope: Optional[str] = None) -> int:
+        sql, params = self._scope_where(scope or "")
+        return int(self._conn().execute(f"SELECT COUNT(*) FROM {self.table}{sql}", params).fetchone()[0])
+
+    def keys(self, limit: int) -> List[str]:
+        rows = self._conn().execute(f"SELECT key FROM {self.table} LIMIT ?", (max(0, limit),)).fetchall()
+        return [r[0] for r in rows]
+
+    def mixed_routes(self) -> Dict[str, Dict[str, Any]]:
+        rows = self._conn().execute(f"SELECT key, record FROM {self.table} WHERE mixed_routes = 1").fetchall()
+        return {k: json.loads(rec) for k, rec in rows}
+
+    def remove_fetched_before(self, cutoff: datetime) -> int:
+        return self._changes(f"DELETE FROM {self.table} WHERE fetched_at < ?", (cutoff.timestamp(),))
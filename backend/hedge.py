@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+log = logging.getLogger("bindicator.hedge")
+
+T = TypeVar("T")
+
+# Total time one upstream lookup may take across both paths
+_DEADLINE_SECONDS = float(os.getenv("BINDICATOR_FETCH_DEADLINE", "25"))
+# How long the primary (HTTP) path gets on its own before the fallback is started too
+_HEDGE_DELAY_SECONDS = float(os.getenv("BINDICATOR_HEDGE_DELAY", "3"))
+
+_stats_lock = threading.Lock()
+STATS: Dict[str, int] = {"races": 0, "hedged": 0, "deadline": 0, "failed": 0}
+
+
+class DeadlineExceeded(RuntimeError):
+    """Neither path produced a result within the deadline."""
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        STATS[name] = STATS.get(name, 0) + 1
+
+
+def _consume(task: "asyncio.Task[Any]") -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+async def race(
+    label: str,
+    primary: Tuple[str, Callable[[], Awaitable[T]]],
+    fallback: Tuple[str, Callable[[], Awaitable[T]]],
+    *,
+    deadline: Optional[float] = None,
+    hedge_delay: Optional[float] = None,
+    fatal: Tuple[Type[BaseException], ...] = (),
+) -> T:
+    """Run ``primary``; start ``fallback`` too if primary fails or is still running after
+    ``hedge_delay``. Returns the first successful result and cancels the other path.
+
+    Raises DeadlineExceeded when nothing succeeds within ``deadline`` seconds, the
+    fallback's error when both paths fail, or immediately on an error in ``fatal``.
+    """
+    deadline = _DEADLINE_SECONDS if deadline is None else deadline
+    hedge_delay = _HEDGE_DELAY_SECONDS if hedge_delay is None else hedge_delay
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    ends_at = started + deadline
+    hedge_at = started + hedge_delay
+    names: Dict["asyncio.Task[T]", str] = {}
+    last_error: Optional[BaseException] = None
+    _count("races")
+
+    def launch(path: Tuple[str, Callable[[], Awaitable[T]]]) -> None:
+        task = asyncio.ensure_future(path[1]())
+        task.add_done_callback(_consume)
+        names[task] = path[0]
+
+    launch(primary)
+    try:
+        while True:
+            now = loop.time()
+            pending = [t for t in names if not t.done()]
+            fallback_started = len(names) > 1
+            if not fallback_started and (not pending or now >= hedge_at):
+                if pending:
+                    _count("hedged")
+                    log.info("[hedge] %s: %s slow after %.1fs; starting %s", label, primary[0], now - started, fallback[0])
+                launch(fallback)
+                continue
+            if not pending:
+                _count("failed")
+                raise last_error or RuntimeError(f"{label}: all upstream paths failed")
+            if now >= ends_at:
+                _count("deadline")
+                raise DeadlineExceeded(f"{label}: no upstream result within {deadline:g}s")
+            wait_until = ends_at if fallback_started else min(hedge_at, ends_at)
+            done, _ = await asyncio.wait(pending, timeout=wait_until - now, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                exc = task.exception()
+                if exc is None:
+                    _count(f"won_{names[task]}")
+                    log.info("[hedge] %s: %s won in %.2fs", label, names[task], loop.time() - started)
+                    return task.result()
+                if isinstance(exc, fatal):
+                    raise exc
+                last_error = exc
+                log.warning("[hedge] %s: %s path failed: %r", label, names[task], exc, exc_info=exc)
+    finally:
+        for task in names:
+            if not task.done():
+                task.cancel()
+
+
+def stats() -> Dict[str, Any]:
+    with _stats_lock:
+        counters: Dict[str, Any] = dict(STATS)
+    return {"deadlineSeconds": _DEADLINE_SECONDS, "hedgeDelaySeconds": _HEDGE_DELAY_SECONDS, **counters}
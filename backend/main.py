@@ -3,14 +3,15 @@ from fastapi.middleware.cors import CORSMiddleware
 from datetime import date, timedelta, datetime, timezone
 from pydantic import BaseModel, Field, ConfigDict
 from enum import Enum
-from typing import List, Dict
+from typing import AsyncIterator, Dict, List, Tuple
 import os
-import threading
+import json
+import time
 import asyncio
 import logging
-from fastapi.responses import JSONResponse
-import time
-import random
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from collections import OrderedDict
+from contextlib import aclosing, asynccontextmanager
 # Import cache module in a way that works both when running as a script
 # (python backend/main.py) and as a package (uvicorn backend.main:app)
 try:
@@ -20,6 +21,55 @@ except Exception:
         from backend import cache as disk_cache  # type: ignore
     except Exception:
         import cache as disk_cache  # type: ignore
+try:
+    from . import hedge  # type: ignore
+except Exception:
+    try:
+        from backend import hedge  # type: ignore
+    except Exception:
+        import hedge  # type: ignore
+try:
+    from . import singleflight  # type: ignore
+except Exception:
+    try:
+        from backend import singleflight  # type: ignore
+    except Exception:
+        import singleflight  # type: ignore
+try:
+    from . import address_index  # type: ignore
+except Exception:
+    try:
+        from backend import address_index  # type: ignore
+    except Exception:
+        import address_index  # type: ignore
+try:
+    from . import prefetch  # type: ignore
+except Exception:
+    try:
+        from backend import prefetch  # type: ignore
+    except Exception:
+        import prefetch  # type: ignore
+try:
+    from . import postcodes  # type: ignore
+except Exception:
+    try:
+        from backend import postcodes  # type: ignore
+    except Exception:
+        import postcodes  # type: ignore
+try:
+    from . import verify_queue  # type: ignore
+except Exception:
+    try:
+        from backend import verify_queue  # type: ignore
+    except Exception:
+        import verify_queue  # type: ignore
+try:
+    from .scraper import browser_pool, governor, http_client as rbwm_http  # type: ignore
+except Exception:
+    try:
+        from backend.scraper import browser_pool, governor, http_client as rbwm_http  # type: ignore
+    except Exception:
+        from scraper import browser_pool, governor, http_client as rbwm_http  # type: ignore
 
 
 # Logging setup with timestamps
@@ -31,11 +81,43 @@ logging.basicConfig(
 )
 log = logging.getLogger("bindicator")
 
-app = FastAPI(title="Bindicator API", version="0.1.0")
 
-# Prefetch telemetry
-LAST_PREFETCH_AT: datetime | None = None
-PREFETCH_STATS: Dict[str, int] = {"attempted": 0, "refreshed": 0, "failed": 0}
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Open the cache here too so `uvicorn backend.main:app` serves what is already on disk
+    try:
+        disk_cache.get_backend()
+    except Exception:
+        log.exception("Failed to load disk cache on startup")
+    rbwm_http.start()
+    datasource = os.getenv("BINDICATOR_DATASOURCE", "mock").lower()
+    if datasource == "rbwm" and os.getenv("RBWM_HTTP_WARMUP", "true").lower() in {"1", "true", "yes", "on"}:
+        await rbwm_http.warm_up_async()
+    if datasource == "rbwm":
+        # Playwright fallbacks reuse a warm browser instead of launching one per call
+        await browser_pool.start()
+        # Mixed-route checks for postcodes seen by /api/bins run in the background
+        await verify_queue.start(_verify_and_record)
+    # Refresh stale entries at startup and daily at BINDICATOR_PREFETCH_AT
+    prefetch.start(_prefetch_refresh, include_uprn=datasource == "rbwm")
+    try:
+        yield
+    finally:
+        await prefetch.stop()
+        await verify_queue.stop()
+        await _stop_revalidating()
+        await browser_pool.close()
+        await rbwm_http.aclose()
+        address_index.close()
+        disk_cache.close_access()
+        disk_cache.close_negative()
+        disk_cache.close_cache()
+
+
+app = FastAPI(title="Bindicator API", version="0.1.0", lifespan=lifespan)
+
+# Concurrent /api/bins misses for the same key share one upstream fetch and cache write
+_bins_flight = singleflight.SingleFlight("bins")
 
 # CORS for local dev (frontend on Vite dev server)
 app.add_middleware(
@@ -47,32 +129,56 @@ app.add_middleware(
 )
 
 
+def _safe_stats(fn) -> Dict:
+    """Health sub-section that never takes the whole endpoint down."""
+    try:
+        return fn()
+    except Exception:
+        log.exception("Health stats failed")
+        return {"error": "unavailable"}
+
+
 @app.get("/api/health")
 def health():
     # Summarize disk cache state
     try:
-        cached = disk_cache.iter_cached_postcodes()
+        entries = disk_cache.count_entries()
+        sample_keys = disk_cache.list_keys(10)
+        flagged = disk_cache.iter_mixed_routes()
     except Exception:
-        cached = {}
+        log.exception("Health cache summary failed")
+        entries, sample_keys, flagged = 0, [], {}
     mixed = []
-    for k, v in cached.items():
-        if v.get("mixed_routes") is True:
-            mixed.append({
-                "postcode": k,
-                "checked_at": v.get("mixed_routes_checked_at"),
-                "addresses": list((v.get("mixed_routes_details") or {}).keys()),
-            })
-    postcodes = list(cached.keys())[:10]
+    for k, v in flagged.items():
+        mixed.append({
+            "postcode": k,
+            "checked_at": v.get("mixed_routes_checked_at"),
+            "addresses": list((v.get("mixed_routes_details") or {}).keys()),
+        })
     return {
         "status": "ok",
         "datasource": os.getenv("BINDICATOR_DATASOURCE", "mock").lower(),
         "cache": {
-            "entries": len(cached),
-            "postcodes": postcodes,
+            "store": disk_cache.cache_stats(),
+            "entries": entries,
+            "postcodes": sample_keys,
             "mixed_routes": mixed,
-            "lastPrefetchAt": LAST_PREFETCH_AT.isoformat() if LAST_PREFETCH_AT else None,
-            "prefetchStats": PREFETCH_STATS,
+            "lastPrefetchAt": prefetch.last_run_at(),
+            "prefetchStats": _safe_stats(prefetch.stats),
+            "policy": disk_cache.policy_stats(),
+            "revalidating": sorted(_revalidating),
+            "prerendered": {"entries": len(_hit_bytes), "max": _HIT_BYTES_MAX, **HIT_BYTES_STATS},
+            "access": _safe_stats(disk_cache.access_stats),
+            "negative": _safe_stats(disk_cache.negative_stats),
         },
+        "addresses": _safe_stats(address_index.stats),
+        "http": _safe_stats(rbwm_http.pool_stats),
+        "browser": _safe_stats(browser_pool.stats),
+        "governor": _safe_stats(governor.stats),
+        "hedge": _safe_stats(hedge.stats),
+        "singleflight": _safe_stats(_bins_flight.stats),
+        "verify": _safe_stats(verify_queue.stats),
+        "postcodes": _safe_stats(postcodes.stats),
     }
 
 
@@ -115,11 +221,18 @@ class BinType(str, Enum):
     black = "black"    # Rubbish
 
 
+class CollectionDay(BaseModel):
+    collection_date: date
+    bins: List[BinType]
+
+
 class ScraperResult(BaseModel):
     """Contract for the scraper output before transformation to API shape."""
     postcode: str
     next_collection_date: date | None
     bins: List[BinType]
+    # Every known collection (date + bins), oldest first; cached so later dates are served locally
+    schedule: List[CollectionDay] = []
     # Optional raw fields to aid debugging can be added later (e.g., raw_html)
 
 
@@ -137,43 +250,56 @@ class BinResponse(BaseModel):
     mixed_routes: bool | None = Field(default=None, alias="mixed_routes")
     addresses: List[str] | None = None
     no_collections: bool = Field(default=False, alias="noCollections")
+    # Served past its expiry (stale-while-revalidate); a background refresh is under way
+    stale: bool = False
 
 
 def _normalize_postcode(pc: str) -> str:
     return pc.strip().replace(" ", "").upper()
 
 
+def _postcode_error(postcode: str) -> HTTPException | None:
+    """Local gate run before any upstream work: 400 unless ``postcode`` is a well-formed
+    UK postcode, 404 in rbwm mode if it is outside the RBWM coverage list."""
+    rbwm_mode = os.getenv("BINDICATOR_DATASOURCE", "mock").lower() == "rbwm"
+    _, reason = postcodes.check(postcode, coverage=rbwm_mode)
+    if reason == "invalid":
+        return HTTPException(status_code=400, detail=f"Not a valid UK postcode: {postcode.strip()!r}")
+    if reason == "outside":
+        return HTTPException(
+            status_code=404, detail=f"{postcode.strip().upper()} is outside the Royal Borough of Windsor and Maidenhead"
+        )
+    return None
+
+
+def _check_postcode(postcode: str) -> None:
+    failed = _postcode_error(postcode)
+    if failed is not None:
+        raise failed
+
+
 def _weekday_name(d: date) -> str:
     return d.strftime("%A")
 
 
-def scrape_rbwm_schedule(postcode: str) -> ScraperResult:
-    """RBWM provider wrapper: uses Playwright when datasource is set to 'rbwm'.
-    Falls back to mock if not configured or on error.
-    """
-    datasource = os.getenv("BINDICATOR_DATASOURCE", "mock").lower()
-    key = _normalize_postcode(postcode)
-    if datasource == "rbwm":
+def _rbwm_scraper():
+    """The RBWM scraper module, imported both as a package and as a script."""
+    try:
+        from .scraper import rbwm  # type: ignore
+    except Exception:
         try:
-            # Import in a way that works both as package and as script
-            try:
-                from backend.scraper.rbwm import fetch_rbwm_schedule_autoselect as _async_fetch  # type: ignore
-            except Exception:
-                import sys as _sys, os as _os
-                # Ensure backend/ is on sys.path to import sibling package 'scraper'
-                backend_dir = _os.path.dirname(__file__)
-                if backend_dir not in _sys.path:
-                    _sys.path.insert(0, backend_dir)
-                from scraper.rbwm import fetch_rbwm_schedule_autoselect as _async_fetch  # type: ignore
-
-            # Run async Playwright scraper in this sync context
-            return asyncio.run(_async_fetch(key))
+            from backend.scraper import rbwm  # type: ignore
         except Exception:
-            # In RBWM mode, do not fall back to mock — surface an upstream failure
-            log.exception("RBWM postcode scrape failed")
-            raise
+            import sys as _sys, os as _os
+            # Ensure backend/ is on sys.path to import sibling package 'scraper'
+            backend_dir = _os.path.dirname(__file__)
+            if backend_dir not in _sys.path:
+                _sys.path.insert(0, backend_dir)
+            from scraper import rbwm  # type: ignore
+    return rbwm
+
 
-    # Mock fallback
+def _mock_schedule(key: str) -> ScraperResult:
     # If key is empty or doesn't end with a digit, choose a deterministic default
     if key and key[-1].isdigit():
         even = int(key[-1]) % 2 == 0
@@ -182,9 +308,32 @@ def scrape_rbwm_schedule(postcode: str) -> ScraperResult:
         even = (date.today().toordinal() % 2 == 0)
     today = date.today()
     next_collection = today + timedelta(days=(2 if even else 3))
-    # Mock follows RBWM rule: always blue + (black or green)
+    # Mock follows RBWM rule: always blue + (black or green), alternating weekly
     bins = [BinType.blue, (BinType.black if even else BinType.green)]
-    return ScraperResult(postcode=key, next_collection_date=next_collection, bins=bins)
+    schedule = [
+        CollectionDay(
+            collection_date=next_collection + timedelta(weeks=w),
+            bins=[BinType.blue, (BinType.black if (w % 2 == 0) == even else BinType.green)],
+        )
+        for w in range(6)
+    ]
+    return ScraperResult(postcode=key, next_collection_date=next_collection, bins=bins, schedule=schedule)
+
+
+async def scrape_rbwm_schedule_async(postcode: str) -> ScraperResult:
+    """RBWM provider wrapper: uses Playwright when datasource is set to 'rbwm'.
+    Falls back to mock if not configured.
+    """
+    datasource = os.getenv("BINDICATOR_DATASOURCE", "mock").lower()
+    key = _normalize_postcode(postcode)
+    if datasource == "rbwm":
+        try:
+            return await _rbwm_scraper().fetch_rbwm_schedule_autoselect(key)
+        except Exception:
+            # In RBWM mode, do not fall back to mock — surface an upstream failure
+            log.exception("RBWM postcode scrape failed")
+            raise
+    return _mock_schedule(key)
 
 
 def build_response_from_scrape(scrape: ScraperResult, *, source: str, cached: bool) -> BinResponse:
@@ -200,8 +349,140 @@ def build_response_from_scrape(scrape: ScraperResult, *, source: str, cached: bo
     )
 
 
+_CACHE_FIELDS = {
+    "postcode", "next_collection_date", "next_collection_day", "bins", "source", "cached", "fetched_at", "no_collections"
+}
+
+
+def _cache_payload(resp: BinResponse) -> Dict:
+    """BinResponse as the plain alias-keyed dict stored in the disk cache."""
+    return {**resp.model_dump(mode="json", by_alias=True, include=_CACHE_FIELDS), "cached": False}
+
+
+def _schedule_payload(scrape: ScraperResult) -> List[Dict]:
+    return [
+        {"date": day.collection_date.isoformat(), "bins": [BinType(b).value for b in day.bins]}
+        for day in (getattr(scrape, "schedule", None) or [])
+    ]
+
+
+def _circuit_open(exc: governor.CircuitOpen) -> HTTPException:
+    log.warning("[governor] Failing fast: %s", exc)
+    return HTTPException(status_code=502, detail="RBWM is unavailable right now; please retry shortly")
+
+
+async def _race_upstream(label: str, http_path, browser_path, *, what: str):
+    """HTTP first, hedged with Playwright (see hedge.race); upstream failures become 502
+    (404 when RBWM lists no addresses) and are remembered in the negative cache."""
+    errors: List[BaseException] = []
+
+    def recorded(path):
+        async def run():
+            try:
+                return await path()
+            except Exception as exc:
+                errors.append(exc)
+                raise
+
+        return run
+
+    try:
+        return await hedge.race(
+            label, ("http", recorded(http_path)), ("browser", recorded(browser_path)), fatal=(governor.CircuitOpen,)
+        )
+    except governor.CircuitOpen as exc:
+        raise _circuit_open(exc)
+    except hedge.DeadlineExceeded as exc:
+        log.warning("RBWM %s lookup timed out: %s", what, exc)
+        raise _remember_failure(label, "upstream_error", f"RBWM did not answer in time for {what}")
+    except Exception as exc:
+        outcome = _failure_outcome(errors or [exc])
+        if outcome == "no_addresses":
+            # A definite answer, not an outage: 404 so clients don't retry it
+            log.info("RBWM lists no addresses for %s", label)
+            raise _remember_failure(label, outcome, "No RBWM addresses for this postcode", status=404)
+        log.exception("RBWM %s fetch failed on every path; returning error (no mock fallback in rbwm mode)", what)
+        raise _remember_failure(label, outcome, f"RBWM upstream fetch failed for {what}")
+
+
+def _failure_outcome(errors: List[BaseException]) -> str:
+    """Classify a failed lookup. A definite answer from RBWM on either path (no addresses,
+    no collection table) wins over the other path crashing or timing out."""
+    rbwm = _rbwm_scraper()
+    if any(isinstance(e, rbwm.NoAddresses) for e in errors):
+        return "no_addresses"
+    if any(isinstance(e, rbwm.NoCollections) for e in errors):
+        return "no_collections"
+    return "upstream_error"
+
+
+def _remember_failure(key: str, outcome: str, detail: str, status: int = 502) -> HTTPException:
+    """Record a failed lookup in the negative cache and return the error to raise."""
+    try:
+        disk_cache.put_negative(key, outcome, status=status, detail=detail)
+    except Exception:
+        log.exception("[cache] Negative cache write failed for %s", key)
+    return HTTPException(status_code=status, detail=detail)
+
+
+def _negative_hit(key: str) -> HTTPException | None:
+    """The error to repeat for a key that failed recently, or None."""
+    try:
+        neg = disk_cache.get_negative(key)
+    except Exception:
+        log.exception("[cache] Negative cache read failed for %s", key)
+        return None
+    if neg is None:
+        return None
+    log.info("[cache] Negative hit for %s (%s).", key, neg.get("outcome"))
+    return HTTPException(status_code=int(neg.get("status", 502)), detail=str(neg.get("detail", "")))
+
+
+async def _fetch_uprn_upstream(uprn: str):
+    """Schedule for one UPRN: HTTP, hedged with Playwright. 502 if both fail."""
+    rbwm = _rbwm_scraper()
+    return await _race_upstream(
+        f"uprn:{uprn}",
+        lambda: rbwm.fetch_rbwm_schedule_by_uprn_http_async(uprn),
+        lambda: rbwm.fetch_rbwm_schedule_by_uprn(uprn),
+        what="UPRN",
+    )
+
+
+async def _addresses_http_polite(postcode: str) -> List[Dict[str, str]]:
+    """Address list over HTTP, retried once when RBWM returns nothing (paced by the governor)."""
+    rbwm = _rbwm_scraper()
+    found = await rbwm.fetch_rbwm_addresses_http_async(postcode)
+    if not found:
+        found = await rbwm.fetch_rbwm_addresses_http_async(postcode)
+    return [{"uprn": a.uprn, "address": a.address} for a in found]
+
+
+async def _postcode_via_http(postcode: str):
+    addrs = await address_index.lookup_async(postcode, _addresses_http_polite)
+    if not addrs:
+        raise _rbwm_scraper().NoAddresses("no addresses from HTTP")
+    first = addrs[0]
+    log.info("[scraper] HTTP first address for %s: %s (%s)", postcode, first["address"], first["uprn"])
+    return await _rbwm_scraper().fetch_rbwm_schedule_by_uprn_http_async(first["uprn"])
+
+
+async def _fetch_postcode_upstream(postcode: str):
+    """Smart-hybrid postcode flow:
+    1) Pure HTTP: first indexed address -> schedule
+    2) Playwright auto-select, started if HTTP fails or is slower than the hedge delay
+    If both fail, surface 502.
+    """
+    return await _race_upstream(
+        f"pc:{_normalize_postcode(postcode)}",
+        lambda: _postcode_via_http(postcode),
+        lambda: scrape_rbwm_schedule_async(postcode),
+        what="postcode",
+    )
+
+
 @app.get("/api/bins", response_model=BinResponse, response_model_by_alias=True)
-def get_bins(
+async def get_bins(
     postcode: str | None = Query(None, min_length=5, max_length=10),
     uprn: str | None = Query(None, description="RBWM Unique Property Reference Number"),
     refresh: bool = Query(False, description="Force refresh ignoring cache"),
@@ -210,194 +491,551 @@ def get_bins(
     Returns next collection info.
     - If `uprn` is provided and datasource=rbwm, fetch by UPRN (preferred).
     - Else if `postcode` is provided, use rbwm/mock postcode flow.
-    Uses persistent disk cache (same-day). Set `refresh=true` to bypass.
+    Uses persistent disk cache (see BINDICATOR_CACHE_POLICY). Entries expired less than
+    BINDICATOR_CACHE_STALE_GRACE_HOURS ago are served with `stale=true` while they refresh
+    in the background. Set `refresh=true` to bypass.
     """
-    if uprn:
-        cache_key = f"uprn:{uprn}"
-    elif postcode:
-        cache_key = f"pc:{_normalize_postcode(postcode)}"
-    else:
-        raise HTTPException(status_code=400, detail="Provide either 'uprn' or 'postcode'")
+    cache_key = _bins_key(postcode, uprn)
+    if postcode:
+        _check_postcode(postcode)
+    datasource = os.getenv("BINDICATOR_DATASOURCE", "mock").lower()
+    _record_access(cache_key)
+    if not refresh:
+        body = _fast_hit(_store_key(postcode, uprn, datasource))
+        if body is not None:
+            _offer_verification(postcode, uprn, datasource)
+            return Response(content=body, media_type="application/json")
+    return await _lookup_bins(postcode, uprn, refresh=refresh, datasource=datasource)
+
+
+async def _lookup_bins(postcode: str | None, uprn: str | None, *, refresh: bool, datasource: str):
+    """/api/bins answer without the pre-rendered fast path: a cached dict or a fresh BinResponse."""
+    cache_key = _bins_key(postcode, uprn)
+    if not refresh:
+        data = _cached_bins(postcode, uprn, datasource)
+        if data is not None:
+            _offer_verification(postcode, uprn, datasource)
+            return data
+
+        failed = _negative_hit(cache_key)
+        if failed is not None:
+            raise failed
+
+    # Miss: one upstream fetch per key, shared by everyone asking for it meanwhile
+    resp = await _bins_flight.do(cache_key, lambda: _refresh_bins(postcode, uprn, datasource))
+    _offer_verification(postcode, uprn, datasource)
+    return resp
 
-    # No separate in-memory caching; prefer disk cache for postcode lookups
 
+async def _prefetch_refresh(key: str) -> None:
+    """Refresh one stale cache entry for the prefetch scheduler, keeping its verification flags."""
     datasource = os.getenv("BINDICATOR_DATASOURCE", "mock").lower()
+    if key.startswith("uprn:"):
+        uprn = key[len("uprn:"):]
+        await _bins_flight.do(key, lambda: _refresh_bins(None, uprn, datasource))
+    else:
+        await _bins_flight.do(
+            f"pc:{_normalize_postcode(key)}", lambda: _refresh_bins(key, None, datasource, keep_verification=True)
+        )
+
+
+def _offer_verification(postcode: str | None, uprn: str | None, datasource: str) -> None:
+    """Queue a background mixed-route check for a postcode lookup (deduplicated and
+    throttled per postcode by verify_queue)."""
+    if postcode and not uprn and datasource == "rbwm":
+        try:
+            verify_queue.offer(postcode)
+        except Exception:
+            log.exception("[verify] Could not queue %s", postcode)
+
+
+def _record_access(cache_key: str) -> None:
+    """Count a lookup towards the key's popularity (prefetch order and cold eviction)."""
+    try:
+        disk_cache.record_access(cache_key)
+    except Exception:
+        log.exception("[cache] Could not record access for %s", cache_key)
+
+
+def _bins_key(postcode: str | None, uprn: str | None) -> str:
+    if uprn:
+        return f"uprn:{uprn.strip()}"
+    if postcode:
+        return f"pc:{_normalize_postcode(postcode)}"
+    raise HTTPException(status_code=400, detail="Provide either 'uprn' or 'postcode'")
+
+
+def _cached_bins(postcode: str | None, uprn: str | None, datasource: str) -> Dict | None:
+    """The cached /api/bins payload for a key, or None on a miss.
+
+    An expired entry still inside the stale grace window is returned with ``stale``
+    set, and one background refresh is started for the key."""
     if uprn and datasource == "rbwm":
-        # Disk cache for UPRN (same-day)
-        if not refresh:
-            try:
-                key = f"uprn:{uprn}"
-                if disk_cache.is_same_day_cached_key(key):
-                    item = disk_cache.get_cached_key(key)
-                    if item and isinstance(item.get("data"), dict):
-                        data = dict(item["data"])  # shallow copy
-                        data["cached"] = True
-                        log.info("[cache] Hit for %s (same-day data).", key)
-                        return data
-            except Exception:
-                log.exception("Disk UPRN cache read failed")
+        # Disk cache for UPRN (validity per BINDICATOR_CACHE_POLICY)
         try:
-            # Try fast HTTP path first
-            from backend.scraper.rbwm import fetch_rbwm_schedule_by_uprn_http as _fetch_http
-            scrape = _fetch_http(uprn)
-            source = "rbwm"
+            key = f"uprn:{uprn}"
+            item, stale = disk_cache.get_servable_cached_key(key)
+            if item and isinstance(item.get("data"), dict):
+                data = disk_cache.current_data(item)  # copy, rolled on to the next known date
+                data["cached"] = True
+                _log_hit(key, stale)
+                if stale:
+                    data["stale"] = True
+                    _revalidate(postcode, uprn, datasource)
+                else:
+                    _remember_hit(key, item, data)
+                return data
         except Exception:
-            log.exception("RBWM UPRN HTTP fetch failed; trying Playwright")
-            try:
-                from backend.scraper.rbwm import fetch_rbwm_schedule_by_uprn as _fetch_by_uprn
-                scrape = asyncio.run(_fetch_by_uprn(uprn))
-                source = "rbwm"
-            except Exception:
-                log.exception("RBWM UPRN Playwright failed; returning error (no mock fallback in rbwm mode)")
-                raise HTTPException(status_code=502, detail="RBWM upstream fetch failed for UPRN")
-    else:
-        pc_norm = _normalize_postcode(postcode or "")
+            log.exception("Disk UPRN cache read failed")
+    elif postcode:
         # Persistent on-disk cache only applies to postcode lookups
-        # Check disk cache (same-day validation) unless refresh=true
-        if postcode and not refresh:
-            try:
-                if disk_cache.is_same_day_cached(postcode):
-                    item = disk_cache.get_cached(postcode)
-                    if item and isinstance(item.get("data"), dict):
-                        data = dict(item["data"])  # shallow copy
-                        data["cached"] = True
-                        # propagate verification flags
-                        if item.get("mixed_routes") is True:
-                            data["mixed_routes"] = True
-                            details = item.get("mixed_routes_details") or {}
-                            data["addresses"] = list(details.keys()) if isinstance(details, dict) else None
-                        log.info("[cache] Hit for %s (same-day data).", item.get("key", postcode))
-                        return data
-            except Exception:
-                log.exception("Disk cache read failed")
+        try:
+            item, stale = disk_cache.get_servable_cached(postcode)
+            if item and isinstance(item.get("data"), dict):
+                data = disk_cache.current_data(item)  # copy, rolled on to the next known date
+                data["cached"] = True
+                # propagate verification flags
+                if item.get("mixed_routes") is True:
+                    data["mixed_routes"] = True
+                    details = item.get("mixed_routes_details") or {}
+                    data["addresses"] = list(details.keys()) if isinstance(details, dict) else None
+                _log_hit(item.get("key", postcode), stale)
+                if stale:
+                    data["stale"] = True
+                    _revalidate(postcode, uprn, datasource)
+                else:
+                    _remember_hit(item.get("key") or disk_cache._pretty_postcode(postcode), item, data)
+                return data
+        except Exception:
+            log.exception("Disk cache read failed")
+    return None
 
-        if datasource == "rbwm":
-            # Smart-hybrid postcode flow:
-            # 1) Try pure-HTTP path: first address -> schedule (with one polite retry)
-            # 2) Fallback to Playwright auto-select
-            # If both fail, surface 502
-            try:
-                log.info("[cache] Refreshing %s (new day or refresh=true).", postcode)
-                try:
-                    from backend.scraper.rbwm import (
-                        fetch_rbwm_addresses_http as _addr_http,
-                        fetch_rbwm_schedule_by_uprn_http as _sched_http,
-                    )
-                except Exception:
-                    # Allow running as a script: import sibling 'scraper' by path
-                    import sys as _sys, os as _os
-                    backend_dir = _os.path.dirname(__file__)
-                    if backend_dir not in _sys.path:
-                        _sys.path.insert(0, backend_dir)
-                    from scraper.rbwm import (  # type: ignore
-                        fetch_rbwm_addresses_http as _addr_http,
-                        fetch_rbwm_schedule_by_uprn_http as _sched_http,
-                    )
-
-                addrs = _addr_http(postcode)
-                if not addrs:
-                    time.sleep(random.uniform(0.9, 1.8))
-                    addrs = _addr_http(postcode)
-                if not addrs:
-                    raise RuntimeError("no addresses from HTTP")
-                first = addrs[0]
-                log.info("[scraper] HTTP first address for %s: %s (%s)", postcode, first.address, first.uprn)
-                scrape = _sched_http(first.uprn)
-                source = "rbwm"
-            except Exception:
-                log.exception("RBWM HTTP postcode path failed; trying Playwright autoselect")
-                try:
-                    scrape = scrape_rbwm_schedule(pc_norm)
-                    source = "rbwm"
-                except Exception:
-                    log.exception("RBWM postcode fetch failed; returning error (no mock fallback in rbwm mode)")
-                    raise HTTPException(status_code=502, detail="RBWM upstream fetch failed for postcode")
-        else:
-            log.info("[cache] Refreshing %s (mock mode).", postcode)
-            scrape = scrape_rbwm_schedule(pc_norm)
-            source = "mock"
+
+# JSON bodies of recent cache hits, keyed like the store. A repeat hit whose stored record
+# is unchanged is answered with these bytes: no copy, no model validation, no serialisation.
+_HIT_BYTES_MAX = int(os.getenv("BINDICATOR_HIT_BYTES_MAX", "10000"))
+_hit_bytes: "OrderedDict[str, Tuple[Tuple, float, Dict[str, bool], bytes]]" = OrderedDict()
+HIT_BYTES_STATS: Dict[str, int] = {"served": 0, "rendered": 0}
+
+
+def _hit_signature(item: Dict) -> Tuple:
+    """What a rendered hit depends on besides the clock; any write to the record changes it."""
+    return (item.get("fetched_at"), item.get("mixed_routes"), item.get("mixed_routes_checked_at"))
+
+
+def _store_key(postcode: str | None, uprn: str | None, datasource: str) -> str | None:
+    """The disk cache key _cached_bins reads for a lookup."""
+    if uprn and datasource == "rbwm":
+        return f"uprn:{uprn}"
+    return disk_cache._pretty_postcode(postcode) if postcode else None
+
+
+def _remember_hit(key: str, item: Dict, data: Dict) -> None:
+    """Render a fresh hit once and keep the bytes until the record or its day changes."""
+    if _HIT_BYTES_MAX <= 0:
+        return
+    try:
+        until, verdicts = disk_cache.hit_window(item)
+        body = BinResponse.model_validate(data).model_dump_json(by_alias=True).encode()
+    except Exception:
+        log.exception("[cache] Could not pre-render hit for %s", key)
+        return
+    _hit_bytes[key] = (_hit_signature(item), until, verdicts, body)
+    _hit_bytes.move_to_end(key)
+    while len(_hit_bytes) > _HIT_BYTES_MAX:
+        _hit_bytes.popitem(last=False)
+    HIT_BYTES_STATS["rendered"] += 1
+
+
+def _fast_hit(key: str | None) -> bytes | None:
+    """Pre-rendered body for ``key`` if its record is unchanged and still in its window."""
+    entry = _hit_bytes.get(key) if key else None
+    if entry is None:
+        return None
+    signature, until, verdicts, body = entry
+    try:
+        item = disk_cache.peek(key)
+    except Exception:
+        log.exception("Disk cache read failed")
+        return None
+    if not item or _hit_signature(item) != signature or time.time() >= until:
+        _hit_bytes.pop(key, None)
+        return None
+    disk_cache.count_lookup(verdicts)
+    _hit_bytes.move_to_end(key)
+    HIT_BYTES_STATS["served"] += 1
+    log.debug("[cache] Hit for %s (pre-rendered).", key)
+    return body
+
+
+def _log_hit(key: str, stale: bool) -> None:
+    if stale:
+        log.info("[cache] Stale hit for %s (%s policy); revalidating in the background.", key, disk_cache.active_policy())
+    else:
+        log.info("[cache] Hit for %s (%s policy).", key, disk_cache.active_policy())
+
+
+# Background refreshes started by stale hits, one per key
+_revalidating: Dict[str, "asyncio.Task[None]"] = {}
+
+
+def _revalidate(postcode: str | None, uprn: str | None, datasource: str) -> None:
+    """Refresh a stale entry in the background unless a refresh for it is already running.
+    Postcode refreshes keep the entry's mixed-route flags, as prefetch does."""
+    key = _bins_key(postcode, uprn)
+    if key in _revalidating or disk_cache.get_negative(key) is not None:
+        # Already refreshing, or upstream failed for it moments ago
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    async def run() -> None:
+        try:
+            await _bins_flight.do(
+                key, lambda: _refresh_bins(postcode, uprn, datasource, keep_verification=bool(postcode and not uprn))
+            )
+        except Exception as exc:
+            log.warning("[cache] Background refresh failed for %s (still serving stale): %s", key, exc)
+        finally:
+            _revalidating.pop(key, None)
+
+    _revalidating[key] = loop.create_task(run())
+
+
+async def _stop_revalidating() -> None:
+    tasks = list(_revalidating.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _refresh_bins(
+    postcode: str | None, uprn: str | None, datasource: str, *, keep_verification: bool = False
+) -> BinResponse:
+    """Fetch a schedule upstream (or from the mock) and write it to the disk cache.
+    A postcode entry's mixed-route flags are reset unless ``keep_verification``."""
+    if uprn and datasource == "rbwm":
+        scrape = await _fetch_uprn_upstream(uprn)
+        source = "rbwm"
+    elif datasource == "rbwm":
+        log.info("[cache] Refreshing %s (expired or refresh=true).", postcode)
+        scrape = await _fetch_postcode_upstream(postcode or "")
+        source = "rbwm"
+    else:
+        log.info("[cache] Refreshing %s (mock mode).", postcode)
+        scrape = await scrape_rbwm_schedule_async(_normalize_postcode(postcode or ""))
+        source = "mock"
 
     resp = build_response_from_scrape(scrape, source=source, cached=False)
     # Persist to disk cache
     try:
+        if datasource == "rbwm":
+            disk_cache.clear_negative(_bins_key(postcode, uprn))
         if postcode:
             # store response as plain dict with alias keys
-            disk_cache.update_cache(postcode, {
-                "postcode": resp.postcode,
-                "nextCollectionDate": resp.next_collection_date.isoformat() if resp.next_collection_date else None,
-                "nextCollectionDay": resp.next_collection_day,
-                "bins": [b.value for b in resp.bins],
-                "source": resp.source,
-                "cached": False,
-                "fetchedAt": resp.fetched_at.isoformat(),
-                "noCollections": resp.no_collections,
-            }, mixed_routes=None, mixed_routes_checked=False)
+            verification = {} if keep_verification else {"mixed_routes": None, "mixed_routes_checked": False}
+            disk_cache.update_cache(postcode, _cache_payload(resp), schedule=_schedule_payload(scrape), **verification)
         elif uprn:
-            disk_cache.update_cache_key(f"uprn:{uprn}", {
-                "postcode": resp.postcode,
-                "nextCollectionDate": resp.next_collection_date.isoformat() if resp.next_collection_date else None,
-                "nextCollectionDay": resp.next_collection_day,
-                "bins": [b.value for b in resp.bins],
-                "source": resp.source,
-                "cached": False,
-                "fetchedAt": resp.fetched_at.isoformat(),
-                "noCollections": resp.no_collections,
-            })
+            disk_cache.update_cache_key(f"uprn:{uprn}", _cache_payload(resp), schedule=_schedule_payload(scrape))
     except Exception:
         log.exception("Disk cache write failed")
 
     return resp
 
 
+# --- Batch lookups ---
+_BATCH_MAX_ITEMS = int(os.getenv("BINDICATOR_BATCH_MAX_ITEMS", "500"))
+# Upstream fetches one batch runs at once; the shared governor still paces them against RBWM
+_BATCH_CONCURRENCY = max(1, int(os.getenv("BINDICATOR_BATCH_CONCURRENCY", "4")))
+
+
+class BinsBatchRequest(BaseModel):
+    uprns: List[str] = []
+    postcodes: List[str] = []
+    refresh: bool = False
+
+
+class BatchError(BaseModel):
+    status: int
+    detail: str
+
+
+class BinsBatchItem(BaseModel):
+    uprn: str | None = None
+    postcode: str | None = None
+    status: str  # "ok" | "error"
+    data: BinResponse | None = None
+    error: BatchError | None = None
+
+
+class BatchSummary(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    total: int
+    ok: int
+    cached: int
+    fetched: int
+    failed: int
+    duration_ms: float = Field(alias="durationMs")
+
+
+class BinsBatchResponse(BaseModel):
+    items: List[BinsBatchItem]
+    summary: BatchSummary
+
+
+def _batch_requests(req: BinsBatchRequest) -> List[Tuple[str | None, str | None]]:
+    """(postcode, uprn) per requested item, UPRNs first, in request order."""
+    wanted = [(None, u.strip()) for u in req.uprns] + [(p, None) for p in req.postcodes]
+    if len(wanted) > _BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {_BATCH_MAX_ITEMS} items per batch")
+    return wanted
+
+
+def _batch_item(postcode: str | None, uprn: str | None, *, data=None, error: BatchError | None = None) -> BinsBatchItem:
+    if error is not None:
+        return BinsBatchItem(uprn=uprn, postcode=postcode, status="error", error=error)
+    if isinstance(data, BinResponse):
+        data = data.model_dump(mode="json", by_alias=True)
+    return BinsBatchItem(uprn=uprn, postcode=postcode, status="ok", data=data)
+
+
+async def _run_batch(
+    wanted: List[Tuple[str | None, str | None]], *, refresh: bool
+) -> AsyncIterator[Tuple[int, BinsBatchItem]]:
+    """Yield (index, item) for each requested key: cache hits straight away, then upstream
+    fetches as they finish, at most _BATCH_CONCURRENCY at a time. Items sharing a key share
+    one fetch; a failed item carries its error instead of failing the batch."""
+    datasource = os.getenv("BINDICATOR_DATASOURCE", "mock").lower()
+    misses: Dict[str, List[int]] = {}
+    for i, (postcode, uprn) in enumerate(wanted):
+        failed = _postcode_error(postcode) if postcode is not None else None
+        if failed is not None:
+            yield i, _batch_item(postcode, uprn, error=BatchError(status=failed.status_code, detail=str(failed.detail)))
+            continue
+        if postcode is None and not uprn:
+            yield i, _batch_item(postcode, uprn, error=BatchError(status=400, detail="Empty UPRN"))
+            continue
+        key = _bins_key(postcode, uprn)
+        _record_access(key)
+        data = None if refresh else _cached_bins(postcode, uprn, datasource)
+        failed = None if refresh or data is not None else _negative_hit(key)
+        if data is not None:
+            yield i, _batch_item(postcode, uprn, data=data)
+        elif failed is not None:
+            yield i, _batch_item(postcode, uprn, error=BatchError(status=failed.status_code, detail=str(failed.detail)))
+        else:
+            misses.setdefault(key, []).append(i)
+
+    sem = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def fetch(key: str, indices: List[int]):
+        postcode, uprn = wanted[indices[0]]
+        async with sem:
+            try:
+                resp = await _bins_flight.do(key, lambda: _refresh_bins(postcode, uprn, datasource))
+                return indices, resp, None
+            except HTTPException as exc:
+                return indices, None, BatchError(status=exc.status_code, detail=str(exc.detail))
+            except Exception:
+                log.exception("Batch lookup failed for %s", key)
+                return indices, None, BatchError(status=500, detail="Internal error")
+
+    tasks = [asyncio.ensure_future(fetch(key, indices)) for key, indices in misses.items()]
+    try:
+        for done in asyncio.as_completed(tasks):
+            indices, resp, error = await done
+            for i in indices:
+                postcode, uprn = wanted[i]
+                yield i, _batch_item(postcode, uprn, data=resp, error=error)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def _count_item(counts: Dict[str, int], item: BinsBatchItem) -> None:
+    counts["total"] += 1
+    if item.status != "ok":
+        counts["failed"] += 1
+    elif item.data is not None and item.data.cached:
+        counts["cached"] += 1
+    else:
+        counts["fetched"] += 1
+
+
+def _batch_summary(counts: Dict[str, int], started: float) -> BatchSummary:
+    return BatchSummary(
+        ok=counts["cached"] + counts["fetched"],
+        duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        **counts,
+    )
+
+
+def _new_counts() -> Dict[str, int]:
+    return {"total": 0, "cached": 0, "fetched": 0, "failed": 0}
+
+
+def _stream(events: AsyncIterator[Dict], fmt: str) -> StreamingResponse:
+    """Send dict events as they are produced: NDJSON lines, or Server-Sent Events named
+    after each event's ``type``."""
+
+    async def body():
+        async with aclosing(events):
+            async for event in events:
+                line = json.dumps(event, separators=(",", ":"), default=str)
+                if fmt == "sse":
+                    yield f"event: {event.get('type', 'message')}\ndata: {line}\n\n"
+                else:
+                    yield line + "\n"
+
+    media_type = "text/event-stream" if fmt == "sse" else "application/x-ndjson"
+    # Ask proxies (nginx) not to buffer, so each record reaches the client as it is sent
+    return StreamingResponse(body(), media_type=media_type, headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@app.post("/api/bins/batch", response_model=BinsBatchResponse, response_model_by_alias=True)
+async def get_bins_batch(req: BinsBatchRequest):
+    """
+    Next collection info for many UPRNs and/or postcodes in one call.
+    Cache hits are answered immediately; misses are fetched upstream with bounded
+    concurrency (BINDICATOR_BATCH_CONCURRENCY). Each item has its own status, so one
+    failure doesn't fail the batch. Items come back in request order, UPRNs first.
+    """
+    started = time.perf_counter()
+    wanted = _batch_requests(req)
+    results: List[BinsBatchItem | None] = [None] * len(wanted)
+    counts = _new_counts()
+    async for i, item in _run_batch(wanted, refresh=req.refresh):
+        results[i] = item
+        _count_item(counts, item)
+    items = [it for it in results if it is not None]
+    return BinsBatchResponse(items=items, summary=_batch_summary(counts, started))
+
+
+@app.post("/api/bins/batch/stream")
+async def get_bins_batch_stream(
+    req: BinsBatchRequest,
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$", description="ndjson or sse"),
+):
+    """
+    Streaming /api/bins/batch: one `item` record per key as soon as it is answered (cache
+    hits first, then upstream fetches in completion order, with its request `index`), then
+    a final `summary` record.
+    """
+    started = time.perf_counter()
+    wanted = _batch_requests(req)
+
+    async def events():
+        counts = _new_counts()
+        async with aclosing(_run_batch(wanted, refresh=req.refresh)) as batch:
+            async for i, item in batch:
+                _count_item(counts, item)
+                yield {"type": "item", "index": i, **item.model_dump(mode="json", by_alias=True)}
+        yield {"type": "summary", **_batch_summary(counts, started).model_dump(mode="json", by_alias=True)}
+
+    return _stream(events(), format)
+
+
+class CollectionItem(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    collection_date: date = Field(alias="date")
+    day: str
+    bins: List[BinType]
+
+
+class CollectionsResponse(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    postcode: str
+    collections: List[CollectionItem]
+    cached: bool = False
+    fetched_at: datetime | None = Field(default=None, alias="fetchedAt")
+
+
+@app.get("/api/collections", response_model=CollectionsResponse, response_model_by_alias=True)
+async def get_collections(
+    postcode: str | None = Query(None, min_length=5, max_length=10),
+    uprn: str | None = Query(None, description="RBWM Unique Property Reference Number"),
+    count: int = Query(5, ge=1, le=52, description="How many upcoming collections to return"),
+):
+    """
+    Returns the next `count` collections from the stored schedule.
+    Goes upstream only when the cache has nothing valid for the key (same rules as /api/bins).
+    """
+    # Reuse the /api/bins path so misses are fetched and cached exactly once
+    cache_key = _bins_key(postcode, uprn)
+    if postcode:
+        _check_postcode(postcode)
+    datasource = os.getenv("BINDICATOR_DATASOURCE", "mock").lower()
+    _record_access(cache_key)
+    nxt = await _lookup_bins(postcode, uprn, refresh=False, datasource=datasource)
+    if isinstance(nxt, BinResponse):
+        nxt = nxt.model_dump(mode="json", by_alias=True)
+    item = disk_cache.get_cached_key(f"uprn:{uprn}") if uprn else disk_cache.get_cached(postcode or "")
+    upcoming = disk_cache.upcoming_collections(item) if item else []
+    if not upcoming and nxt.get("nextCollectionDate"):
+        # Entry cached before schedules were stored: fall back to the single next collection
+        upcoming = [{"date": nxt["nextCollectionDate"], "day": nxt.get("nextCollectionDay"), "bins": nxt.get("bins") or []}]
+    return CollectionsResponse(
+        postcode=nxt.get("postcode") or (postcode or ""),
+        collections=[CollectionItem(**c) for c in upcoming[:count]],
+        cached=bool(nxt.get("cached")),
+        fetched_at=(item or {}).get("fetched_at") or nxt.get("fetchedAt"),
+    )
+
+
 class AddressItem(BaseModel):
     uprn: str
     address: str
 
 
+async def _fetch_addresses_upstream(postcode: str) -> List[Dict[str, str]]:
+    """RBWM address list via HTTP, hedged with Playwright. Raises if both fail."""
+    rbwm = _rbwm_scraper()
+
+    async def _http():
+        results = await rbwm.fetch_rbwm_addresses_http_async(postcode)
+        if not results:
+            raise RuntimeError("No addresses found via HTTP")
+        return results
+
+    results = await hedge.race(
+        f"addresses:{_normalize_postcode(postcode)}",
+        ("http", _http),
+        ("browser", lambda: rbwm.fetch_rbwm_addresses(postcode)),
+        fatal=(governor.CircuitOpen,),
+    )
+    log.info("RBWM addresses: %s candidates for %s", len(results), postcode)
+    return [{"uprn": r.uprn, "address": r.address} for r in results]
+
+
+async def _lookup_addresses(postcode: str, *, refresh: bool = False) -> List[AddressItem]:
+    """Addresses for a postcode from the persistent index, populated on first use."""
+    rows = await address_index.lookup_async(postcode, _fetch_addresses_upstream, refresh=refresh)
+    return [AddressItem(**r) for r in rows]
+
+
 @app.get("/api/addresses", response_model=List[AddressItem])
-def get_addresses(postcode: str = Query(..., min_length=5, max_length=10)):
+async def get_addresses(
+    postcode: str = Query(..., min_length=5, max_length=10),
+    refresh: bool = Query(False, description="Re-read the address list from RBWM"),
+):
     """RBWM address lookup: returns a list of UPRNs for a postcode.
-    Requires BINDICATOR_DATASOURCE=rbwm.
+    Served from the address index after the first lookup. Requires BINDICATOR_DATASOURCE=rbwm.
     """
     datasource = os.getenv("BINDICATOR_DATASOURCE", "mock").lower()
     if datasource != "rbwm":
         return []
+    _check_postcode(postcode)
 
     try:
-        # Try fast HTTP path first
-        try:
-            from backend.scraper.rbwm import fetch_rbwm_addresses_http as _fetch_http
-        except Exception:
-            # Allow running as a script: import sibling 'scraper' by path
-            import sys as _sys, os as _os
-            backend_dir = _os.path.dirname(__file__)
-            if backend_dir not in _sys.path:
-                _sys.path.insert(0, backend_dir)
-            from scraper.rbwm import fetch_rbwm_addresses_http as _fetch_http
-        results = _fetch_http(postcode)
-        if not results:
-            raise RuntimeError("No addresses found via HTTP")
-        addrs = [AddressItem(uprn=r.uprn, address=r.address) for r in results]
-        log.info("RBWM HTTP addresses: %s candidates for %s", len(addrs), postcode)
-        return addrs
+        return await _lookup_addresses(postcode, refresh=refresh)
     except Exception:
-        log.exception("RBWM address HTTP lookup failed; trying Playwright")
-        try:
-            try:
-                from backend.scraper.rbwm import fetch_rbwm_addresses as _fetch_addrs
-            except Exception:
-                import sys as _sys, os as _os
-                backend_dir = _os.path.dirname(__file__)
-                if backend_dir not in _sys.path:
-                    _sys.path.insert(0, backend_dir)
-                from scraper.rbwm import fetch_rbwm_addresses as _fetch_addrs
-            results = asyncio.run(_fetch_addrs(postcode))
-            addrs = [AddressItem(uprn=r.uprn, address=r.address) for r in results]
-            log.info("RBWM Playwright addresses: %s candidates for %s", len(addrs), postcode)
-            return addrs
-        except Exception:
-            log.exception("RBWM address lookup failed")
-            return []
+        log.exception("RBWM address lookup failed")
+        return []
 
 
 # --- Cache admin endpoints (dev convenience) ---
@@ -405,15 +1043,21 @@ class CacheStatus(BaseModel):
     entries: int
     keys: List[str]
     now: datetime
+    uprn_entries: int | None = None
+    postcode_entries: int | None = None
 
 
 @app.get("/api/cache/status", response_model=CacheStatus)
 def cache_status(limit: int = Query(10, ge=0, le=100)):
     now = datetime.now(timezone.utc)
     try:
-        entries = disk_cache.iter_cached_postcodes()
-        keys = list(entries.keys())[:limit]
-        return CacheStatus(entries=len(entries), keys=keys, now=now)
+        return CacheStatus(
+            entries=disk_cache.count_entries(),
+            keys=disk_cache.list_keys(limit),
+            now=now,
+            uprn_entries=disk_cache.count_entries("uprn:"),
+            postcode_entries=disk_cache.count_entries("pc:"),
+        )
     except Exception:
         log.exception("Cache status failed")
         return CacheStatus(entries=0, keys=[], now=now)
@@ -428,12 +1072,7 @@ def cache_clear(scope: str | None = Query(None, description="all|uprn|pc"), key:
         removed = disk_cache.delete_scope(scope + ":")
         return {"removed": removed}
     # clear all
-    entries = disk_cache.iter_cached_postcodes()
-    removed = 0
-    for k in list(entries.keys()):
-        if disk_cache.delete_key(k):
-            removed += 1
-    return {"removed": removed}
+    return {"removed": disk_cache.delete_scope("")}
 
 
 class ResolvedAddress(BaseModel):
@@ -471,9 +1110,10 @@ def _score_address_match(address: str, house: str) -> tuple[int, bool]:
 
 
 @app.get("/api/resolve", response_model=List[ResolvedAddress])
-def resolve_address(
+async def resolve_address(
     postcode: str = Query(..., min_length=5, max_length=10),
     house: str | None = Query(None, description="House number/name to match"),
+    refresh: bool = Query(False, description="Re-read the address list from RBWM"),
 ):
     """Resolve a postcode and house query to one or more RBWM UPRNs.
     Returns sorted candidates with a score and exact flag. Requires datasource=rbwm.
@@ -481,29 +1121,43 @@ def resolve_address(
     datasource = os.getenv("BINDICATOR_DATASOURCE", "mock").lower()
     if datasource != "rbwm":
         return []
+    _check_postcode(postcode)
 
-    # Use HTTP path for speed; fall back to Playwright if needed
-    def _fetch_all() -> List[AddressItem]:
-        from backend.scraper.rbwm import fetch_rbwm_addresses_http as _fetch_http
-        try:
-            res = _fetch_http(postcode)
-            if res:
-                return [AddressItem(uprn=r.uprn, address=r.address) for r in res]
-            raise RuntimeError("no addresses via http")
-        except Exception:
-            from backend.scraper.rbwm import fetch_rbwm_addresses as _fetch_pw
-            try:
-                res2 = asyncio.run(_fetch_pw(postcode))
-                return [AddressItem(uprn=r.uprn, address=r.address) for r in res2]
-            except Exception:
-                log.exception("Resolve: address lookup failed")
-                return []
+    # Address index first (HTTP, then Playwright on a miss); always work with a list
+    try:
+        items = await _lookup_addresses(postcode, refresh=refresh)
+    except Exception:
+        log.exception("Resolve: address lookup failed")
+        items = []
+    # If no house provided, return a simple shortlist (no scoring)
+    if not (house or "").strip():
+        return [ResolvedAddress(uprn=it.uprn, address=it.address, exact=False, score=0) for it in items[:10]]
+    scored: List[ResolvedAddress] = []
+    for it in items:
+        s, exact = _score_address_match(it.address, house)
+        if s > 0:
+            scored.append(ResolvedAddress(uprn=it.uprn, address=it.address, exact=exact, score=s))
 
+    # If nothing matched by score, return the raw list (limited) to allow manual choice
+    if not scored:
+        return [ResolvedAddress(uprn=it.uprn, address=it.address, exact=False, score=0) for it in items[:10]]
 
-@app.get("/api/debug/lazy-verify")
-def lazy_verify(postcode: str = Query(..., min_length=5, max_length=10)):
+    # Fallback: ensure a list is always returned
+    if scored is None:
+        return []
+
+    # Sort by exact desc, score desc, then address asc
+    scored.sort(key=lambda x: (x.exact, x.score, x.address.lower()), reverse=True)
+    # Return top 10
+    return scored[:10]
+
+
+def _lazy_verify_gate(postcode: str) -> Dict | None:
+    """Debug/datasource checks for lazy verification; the throttled answer if it ran recently."""
     if os.getenv("BINDICATOR_DEBUG", "false").lower() not in {"1", "true", "yes", "on"}:
         raise HTTPException(status_code=404, detail="Not found")
+    # Validate before anything is read from the cache, like every other endpoint
+    _check_postcode(postcode)
     # throttle
     if disk_cache.should_throttle_verify(postcode, hours=24):
         entry = disk_cache.get_entry(postcode) or {}
@@ -518,136 +1172,148 @@ def lazy_verify(postcode: str = Query(..., min_length=5, max_length=10)):
     datasource = os.getenv("BINDICATOR_DATASOURCE", "mock").lower()
     if datasource != "rbwm":
         raise HTTPException(status_code=400, detail="Lazy verify available only in rbwm mode")
+    return None
 
+
+def _record_verification(postcode: str, result: Dict) -> Dict:
+    """Store a verification result on the postcode's cache entry and describe it."""
+    mixed = not bool(result.get("consistent"))
+    details = result.get("differences") if mixed else {}
+    disk_cache.update_verification(postcode, mixed_routes=mixed, details=details)
+    log.info("[verify] Lazy verification complete for %s (mixed_routes=%s)", postcode.upper(), mixed)
+    entry = disk_cache.get_entry(postcode) or {}
+    return {
+        "postcode": postcode.upper(),
+        "mixed_routes": entry.get("mixed_routes"),
+        "checked_at": entry.get("mixed_routes_checked_at"),
+        "addresses": list((entry.get("mixed_routes_details") or {}).keys()),
+        "throttled": False,
+    }
+
+
+async def _verification_addresses(postcode: str):
+    """Addresses to sample, from the address index filled over HTTP only (never a browser);
+    None lets the scraper look them up itself."""
+    rbwm = _rbwm_scraper()
     try:
-        from backend.scraper.rbwm import verify_postcode_consistency as _verify
-        result = asyncio.run(_verify(postcode))
-        mixed = not bool(result.get("consistent"))
-        details = result.get("differences") if mixed else {}
-        disk_cache.update_verification(postcode, mixed_routes=mixed, details=details)
-        log.info("[verify] Lazy verification complete for %s (mixed_routes=%s)", postcode.upper(), mixed)
-        entry = disk_cache.get_entry(postcode) or {}
-        return {
-            "postcode": postcode.upper(),
-            "mixed_routes": entry.get("mixed_routes"),
-            "checked_at": entry.get("mixed_routes_checked_at"),
-            "addresses": list((entry.get("mixed_routes_details") or {}).keys()),
-            "throttled": False,
-        }
+        items = await address_index.lookup_async(postcode, _addresses_http_polite)
+    except governor.CircuitOpen:
+        raise
     except Exception:
-        log.exception("Lazy verification failed for %s", postcode)
-        raise HTTPException(status_code=502, detail="Verification failed")
+        log.warning("[verify] Address index lookup failed for %s; scraper will fetch the list", postcode)
+        return None
+    return [rbwm.RBWMAddress(uprn=it["uprn"], address=it["address"]) for it in items] or None
 
-    # Always ensure we work with a list
-    items = _fetch_all() or []
-    # If no house provided, return a simple shortlist (no scoring)
-    if not (house or "").strip():
-        return [ResolvedAddress(uprn=it.uprn, address=it.address, exact=False, score=0) for it in items[:10]]
-    scored: List[ResolvedAddress] = []
-    for it in items:
-        s, exact = _score_address_match(it.address, house)
-        if s > 0:
-            scored.append(ResolvedAddress(uprn=it.uprn, address=it.address, exact=exact, score=s))
 
-    # If nothing matched by score, return the raw list (limited) to allow manual choice
-    if not scored:
-        return [ResolvedAddress(uprn=it.uprn, address=it.address, exact=False, score=0) for it in items[:10]]
+# Verification where every sampled schedule fetch failed: nothing is stored, so it is retried
+_INCONCLUSIVE = "Verification inconclusive: no address schedules could be fetched from RBWM"
 
-    # Fallback: ensure a list is always returned
-    if scored is None:
-        return []
 
-    # Sort by exact desc, score desc, then address asc
-    scored.sort(key=lambda x: (x.exact, x.score, x.address.lower()), reverse=True)
-    # Return top 10
-    return scored[:10]
+async def _verify_and_record(postcode: str) -> Dict:
+    """Run a mixed-route verification and store its result on the postcode's entry.
+    Raises (storing nothing) if no sampled address produced a schedule."""
+    result = await _rbwm_scraper().verify_postcode_consistency(
+        postcode, addresses=await _verification_addresses(postcode)
+    )
+    return _record_verification(postcode, result)
 
 
-if __name__ == "__main__":
-    import uvicorn
-    host = os.getenv("HOST", "127.0.0.1")
-    port = int(os.getenv("PORT", "8000"))
-    # Load cache and prefetch stale entries in background
+@app.get("/api/verify/queue")
+def verify_queue_status():
+    """Background verification queue: depth, in-progress postcodes, throughput and failures."""
+    return verify_queue.stats()
+
+
+@app.post("/api/verify/queue")
+def verify_queue_add(postcode: str = Query(..., min_length=5, max_length=10)):
+    """Queue a postcode for background verification (skipped if queued or verified recently)."""
+    if not verify_queue.stats()["running"]:
+        raise HTTPException(status_code=400, detail="Background verification runs only in rbwm mode")
+    _check_postcode(postcode)
+    return {"postcode": postcode.upper(), "queued": verify_queue.offer(postcode)}
+
+
+@app.get("/api/prefetch")
+def prefetch_status():
+    """Prefetch scheduler: state, progress and ETA of the current run, next run time."""
+    return prefetch.stats()
+
+
+@app.post("/api/prefetch/pause")
+async def prefetch_pause():
+    prefetch.pause()
+    return prefetch.stats()
+
+
+@app.post("/api/prefetch/resume")
+async def prefetch_resume():
+    prefetch.resume()
+    return prefetch.stats()
+
+
+@app.post("/api/prefetch/run")
+async def prefetch_run():
+    """Start a prefetch run now (no-op while one is in progress)."""
+    started = prefetch.trigger()
+    await asyncio.sleep(0)
+    return {"started": started, **prefetch.stats()}
+
+
+@app.get("/api/debug/lazy-verify")
+async def lazy_verify(postcode: str = Query(..., min_length=5, max_length=10)):
+    throttled = _lazy_verify_gate(postcode)
+    if throttled is not None:
+        return throttled
     try:
-        disk_cache.load_cache()
+        return await _verify_and_record(postcode)
+    except governor.CircuitOpen as exc:
+        raise _circuit_open(exc)
+    except _rbwm_scraper().VerificationInconclusive:
+        raise HTTPException(status_code=502, detail=_INCONCLUSIVE)
     except Exception:
-        log.exception("Failed to load disk cache on startup")
+        log.exception("Lazy verification failed for %s", postcode)
+        raise HTTPException(status_code=502, detail="Verification failed")
 
-    def _prefetch():
-        entries = disk_cache.iter_cached_postcodes()
-        today = datetime.now(timezone.utc).date()
-        PREFETCH_STATS.update({"attempted": 0, "refreshed": 0, "failed": 0})
-        for key, item in entries.items():
-            try:
-                ts = item.get("fetched_at")
-                d = datetime.fromisoformat(str(ts).replace("Z", "+00:00")).date() if ts else None
-                if d != today:
-                    # Refresh
-                    log.info("[cache] Prefetch refreshing %s (stale)", key)
-                    PREFETCH_STATS["attempted"] += 1
-                    pc_norm = _normalize_postcode(key)
-                    datasource = os.getenv("BINDICATOR_DATASOURCE", "mock").lower()
-                    if datasource == "rbwm":
-                        # Prefer HTTP path during prefetch (lighter, no headless)
-                        try:
-                            try:
-                                from backend.scraper.rbwm import (
-                                    fetch_rbwm_addresses_http as _addr_http,
-                                    fetch_rbwm_schedule_by_uprn_http as _sched_http,
-                                )
-                            except Exception:
-                                # Ensure backend dir on path to import sibling package 'scraper'
-                                import sys as _sys, os as _os
-                                backend_dir = _os.path.dirname(__file__)
-                                if backend_dir not in _sys.path:
-                                    _sys.path.insert(0, backend_dir)
-                                from scraper.rbwm import (
-                                    fetch_rbwm_addresses_http as _addr_http,
-                                    fetch_rbwm_schedule_by_uprn_http as _sched_http,
-                                )
-
-                            addrs = _addr_http(key)
-                            if not addrs:
-                                # Polite small wait and retry once
-                                time.sleep(random.uniform(1.0, 2.0))
-                                addrs = _addr_http(key)
-                            if not addrs:
-                                raise RuntimeError("no addresses via http")
-                            first = addrs[0]
-                            sc = _sched_http(first.uprn)
-                            res = build_response_from_scrape(sc, source="rbwm", cached=False)
-                            PREFETCH_STATS["refreshed"] += 1
-                        except Exception:
-                            # Fall back to Playwright autoselect once; if it fails, log and skip
-                            try:
-                                time.sleep(random.uniform(0.8, 1.6))
-                                sc = scrape_rbwm_schedule(key)
-                                res = build_response_from_scrape(sc, source="rbwm", cached=False)
-                                PREFETCH_STATS["refreshed"] += 1
-                            except Exception:
-                                log.warning("Prefetch RBWM failed for %s (skipping)", key)
-                                PREFETCH_STATS["failed"] += 1
-                                continue
-                    else:
-                        sc = scrape_rbwm_schedule(key)
-                        res = build_response_from_scrape(sc, source="mock", cached=False)
-                        PREFETCH_STATS["refreshed"] += 1
-                    disk_cache.update_cache(key, {
-                        "postcode": res.postcode,
-                        "nextCollectionDate": res.next_collection_date.isoformat() if res.next_collection_date else None,
-                        "nextCollectionDay": res.next_collection_day,
-                        "bins": [b.value for b in res.bins],
-                        "source": res.source,
-                        "cached": False,
-                        "fetchedAt": res.fetched_at.isoformat(),
-                        "noCollections": res.no_collections,
-                    })
-            except Exception:
-                log.exception("Prefetch processing failed for %s", key)
-                PREFETCH_STATS["failed"] += 1
-        global LAST_PREFETCH_AT
-        LAST_PREFETCH_AT = datetime.now(timezone.utc)
 
-    threading.Thread(target=_prefetch, daemon=True).start()
+@app.get("/api/debug/lazy-verify/stream")
+async def lazy_verify_stream(
+    postcode: str = Query(..., min_length=5, max_length=10),
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$", description="ndjson or sse"),
+):
+    """Streaming lazy verification: one `address` record per checked address as it is
+    fetched, then a `summary` record (the /api/debug/lazy-verify answer) or an `error`."""
+    throttled = _lazy_verify_gate(postcode)
+
+    async def events():
+        if throttled is not None:
+            yield {"type": "summary", **throttled}
+            return
+        rbwm = _rbwm_scraper()
+        results: List[Dict] = []
+        try:
+            addresses = await _verification_addresses(postcode)
+            async with aclosing(rbwm.iter_verification(postcode, addresses=addresses)) as checks:
+                async for result in checks:
+                    results.append(result)
+                    yield {"type": "address", **result}
+            summary = _record_verification(postcode, rbwm.summarize_verification(postcode, results))
+        except governor.CircuitOpen as exc:
+            yield {"type": "error", "status": 502, "detail": _circuit_open(exc).detail}
+            return
+        except rbwm.VerificationInconclusive:
+            yield {"type": "error", "status": 502, "detail": _INCONCLUSIVE}
+            return
+        except Exception:
+            log.exception("Lazy verification failed for %s", postcode)
+            yield {"type": "error", "status": 502, "detail": "Verification failed"}
+            return
+        yield {"type": "summary", **summary}
 
+    return _stream(events(), format)
+
+if __name__ == "__main__":
+    import uvicorn
+    host = os.getenv("HOST", "127.0.0.1")
+    port = int(os.getenv("PORT", "8000"))
+    # Cache loading and stale-entry prefetch happen in the app lifespan
     uvicorn.run(app, host=host, port=port)
@@ -0,0 +1,132 @@
+"""Local postcode checks run before any upstream work.
+
+``canonical()`` validates input against the UK postcode grammar (outward code
+formats A9, A99, AA9, AA99, A9A, AA9A with the letters each position allows,
+then a 9AA inward code) and returns it in the ``SL6 6AH`` form. ``in_coverage()``
+checks a valid postcode against the RBWM districts and sectors listed in
+``rbwm_postcodes.txt`` (or ``BINDICATOR_COVERAGE_FILE``); the file is re-read
+when it changes. A missing or empty file lets every postcode through.
+"""
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+log = logging.getLogger("bindicator.postcodes")
+
+_GRAMMAR = re.compile(
+    r"^(?:GIR 0AA|"
+    r"(?:[A-PR-UWYZ][0-9][0-9]?"
+    r"|[A-PR-UWYZ][A-HK-Y][0-9][0-9]?"
+    r"|[A-PR-UWYZ][0-9][A-HJKPSTUW]"
+    r"|[A-PR-UWYZ][A-HK-Y][0-9][ABEHMNPRVWXY])"
+    r" [0-9][ABD-HJLNP-UW-Z]{2})$"
+)
+
+_COVERAGE_FILE = os.getenv(
+    "BINDICATOR_COVERAGE_FILE", os.path.join(os.path.dirname(__file__), "rbwm_postcodes.txt")
+)
+# How often the coverage file's modification time is checked
+_RECHECK_SECONDS = 60.0
+
+_lock = threading.Lock()
+_coverage: Dict[str, Any] = {
+    "districts": frozenset(),
+    "sectors": frozenset(),
+    "mtime": None,
+    "checked": 0.0,
+}
+STATS: Dict[str, int] = {"invalid": 0, "outside": 0, "accepted": 0}
+
+
+def coverage_enabled() -> bool:
+    return os.getenv("BINDICATOR_POSTCODE_COVERAGE", "true").lower() in {"1", "true", "yes", "on"}
+
+
+def canonical(postcode: str) -> Optional[str]:
+    """``postcode`` as ``OUTWARD INWARD`` in upper case if it is a well-formed UK postcode, else None."""
+    compact = "".join((postcode or "").split()).upper()
+    if len(compact) < 5:
+        return None
+    pretty = f"{compact[:-3]} {compact[-3:]}"
+    return pretty if _GRAMMAR.match(pretty) else None
+
+
+def _parse(text: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    districts, sectors = set(), set()
+    for line in text.splitlines():
+        entry = " ".join(line.split("#", 1)[0].split()).upper()
+        if not entry:
+            continue
+        if " " in entry:
+            sectors.add(entry)
+        else:
+            districts.add(entry)
+    return frozenset(districts), frozenset(sectors)
+
+
+def _current() -> Dict[str, Any]:
+    """Coverage sets, re-read from disk if the file changed. Caller holds _lock."""
+    now = time.monotonic()
+    if _coverage["checked"] and now - _coverage["checked"] < _RECHECK_SECONDS:
+        return _coverage
+    _coverage["checked"] = now
+    try:
+        mtime = os.path.getmtime(_COVERAGE_FILE)
+    except OSError:
+        mtime = None
+    if mtime == _coverage["mtime"]:
+        return _coverage
+    districts: FrozenSet[str] = frozenset()
+    sectors: FrozenSet[str] = frozenset()
+    if mtime is None:
+        log.warning("[postcodes] Coverage file %s not found; accepting all valid postcodes", _COVERAGE_FILE)
+    else:
+        try:
+            with open(_COVERAGE_FILE, "r", encoding="utf-8") as f:
+                districts, sectors = _parse(f.read())
+            log.info("[postcodes] Loaded %s districts and %s sectors", len(districts), len(sectors))
+        except OSError:
+            log.exception("[postcodes] Could not read %s; accepting all valid postcodes", _COVERAGE_FILE)
+    _coverage.update(districts=districts, sectors=sectors, mtime=mtime)
+    return _coverage
+
+
+def in_coverage(pretty: str) -> bool:
+    """Whether a canonical postcode falls in a listed RBWM district or sector."""
+    outward, _, inward = pretty.partition(" ")
+    with _lock:
+        cov = _current()
+        if not cov["districts"] and not cov["sectors"]:
+            return True
+        return outward in cov["districts"] or f"{outward} {inward[:1]}" in cov["sectors"]
+
+
+def check(postcode: str, *, coverage: bool) -> Tuple[Optional[str], Optional[str]]:
+    """(canonical postcode, None) if accepted, else (None, 'invalid' or 'outside')."""
+    pretty = canonical(postcode)
+    if pretty is None:
+        reason = "invalid"
+    elif coverage and coverage_enabled() and not in_coverage(pretty):
+        reason = "outside"
+    else:
+        with _lock:
+            STATS["accepted"] += 1
+        return pretty, None
+    with _lock:
+        STATS[reason] += 1
+    return None, reason
+
+
+def stats() -> Dict[str, Any]:
+    with _lock:
+        cov = _current()
+        return {
+            "coverage": coverage_enabled(),
+            "file": _COVERAGE_FILE,
+            "districts": sorted(cov["districts"]),
+            "sectors": sorted(cov["sectors"]),
+            **STATS,
+        }
@@ -0,0 +1,302 @@
+"""Scheduled refresh of stale cache entries.
+
+Started from the app lifespan, so it runs under ``uvicorn backend.main:app`` as
+well as ``python backend/main.py``. A run refreshes every cached entry that is
+no longer valid under the active cache policy, ``BINDICATOR_PREFETCH_WORKERS``
+at a time; each refresh goes through the normal upstream path and therefore the
+shared governor. Runs happen once at startup (``BINDICATOR_PREFETCH_ON_STARTUP``)
+and every day at ``BINDICATOR_PREFETCH_AT`` (HH:MM) in ``BINDICATOR_PREFETCH_TZ``,
+so schedules are fresh before people put their bins out.
+
+Stale entries are refreshed hottest first, by the decayed access score the cache
+keeps per key. Entries whose score has dropped below
+``BINDICATOR_ACCESS_COLD_SCORE`` are not refreshed; they are evicted instead.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+# Import cache module in a way that works both as a package and as a script
+try:
+    from . import cache as disk_cache  # type: ignore
+except Exception:
+    try:
+        from backend import cache as disk_cache  # type: ignore
+    except Exception:
+        import cache as disk_cache  # type: ignore
+
+log = logging.getLogger("bindicator.prefetch")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, "true" if default else "false").lower() in {"1", "true", "yes", "on"}
+
+
+_DEFAULT_AT = "05:00"
+_AT = os.getenv("BINDICATOR_PREFETCH_AT", _DEFAULT_AT)
+_TZ = os.getenv("BINDICATOR_PREFETCH_TZ", "Europe/London")
+_WORKERS = max(1, int(os.getenv("BINDICATOR_PREFETCH_WORKERS", "2")))
+# Longest single sleep while waiting for the next run; keeps the schedule right across clock changes
+_MAX_SLEEP_SECONDS = 3600.0
+
+_lock = threading.Lock()
+PREFETCH_STATS: Dict[str, Any] = {
+    "runs": 0,
+    "attempted": 0,
+    "refreshed": 0,
+    "failed": 0,
+    "total": 0,
+    "skippedCold": 0,
+    "evicted": 0,
+}
+_state: Dict[str, Any] = {
+    "running": False,
+    "startedAt": None,
+    "finishedAt": None,
+    "nextRunAt": None,
+    "started": 0.0,
+    "pausedFor": 0.0,
+    "pausedSince": None,
+}
+_current: Set[str] = set()
+_refresh: Optional[Callable[[str], Awaitable[Any]]] = None
+_include_uprn = False
+_resume: Optional[asyncio.Event] = None
+_task: Optional["asyncio.Task[None]"] = None
+# Runs started by hand (trigger()), cancelled with the scheduler on stop()
+_manual: Set["asyncio.Task[bool]"] = set()
+
+
+def enabled() -> bool:
+    return _env_bool("BINDICATOR_PREFETCH", True)
+
+
+@lru_cache(maxsize=1)
+def _zone():
+    try:
+        from zoneinfo import ZoneInfo
+
+        return ZoneInfo(_TZ)
+    except Exception:
+        log.warning("[prefetch] Unknown BINDICATOR_PREFETCH_TZ=%r; using server local time", _TZ)
+        return None
+
+
+def parse_at(at: str) -> Tuple[int, int]:
+    """(hour, minute) from ``HH:MM`` (or a bare hour); ValueError if malformed or out of range."""
+    hour, sep, minute = at.strip().partition(":")
+    if not hour.isdigit() or (sep and not (minute.isdigit() and len(minute) == 2)):
+        raise ValueError(f"expected HH:MM, got {at!r}")
+    h, m = int(hour), int(minute or 0)
+    if h > 23 or m > 59:
+        raise ValueError(f"no such time of day: {at!r}")
+    return h, m
+
+
+def next_run_after(now: datetime, at: Optional[str] = None) -> datetime:
+    """The first ``at`` (HH:MM, default ``BINDICATOR_PREFETCH_AT``; wall clock of ``now``'s
+    zone) strictly after ``now``."""
+    hour, minute = parse_at(_AT if at is None else at)
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    return candidate if candidate > now else candidate + timedelta(days=1)
+
+
+def _now() -> datetime:
+    zone = _zone()
+    return datetime.now(zone) if zone is not None else datetime.now().astimezone()
+
+
+def stale_keys(items: Optional[Dict[str, Dict[str, Any]]] = None) -> Tuple[List[str], List[str]]:
+    """Cached keys whose entries are no longer valid under the active policy, split
+    into (hot, cold): hot keys ordered by access score, highest first."""
+    if items is None:
+        items = disk_cache.iter_cached_postcodes()
+    stale = {}
+    for key, item in items.items():
+        if not isinstance(item, dict) or not isinstance(item.get("data"), dict):
+            # Verification-only records have nothing to refresh
+            continue
+        if key.startswith("uprn:") and not _include_uprn:
+            continue
+        if not disk_cache.is_entry_valid(item):
+            stale[key] = item
+    scores = disk_cache.access_scores(stale)
+    hot = sorted((k for k in stale if not disk_cache.is_cold(scores[k])), key=lambda k: -scores[k])
+    cold = [k for k in stale if disk_cache.is_cold(scores[k])]
+    return hot, cold
+
+
+async def _work(queue: "asyncio.Queue[str]") -> None:
+    assert _refresh is not None and _resume is not None
+    while True:
+        await _resume.wait()
+        try:
+            key = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        with _lock:
+            _current.add(key)
+            PREFETCH_STATS["attempted"] += 1
+        try:
+            await _refresh(key)
+            outcome = "refreshed"
+        except Exception as exc:
+            log.warning("[prefetch] Refresh failed for %s (skipping): %s", key, exc)
+            outcome = "failed"
+        with _lock:
+            _current.discard(key)
+            PREFETCH_STATS[outcome] += 1
+
+
+async def run_once() -> bool:
+    """Refresh all stale entries now. Returns False if a run is already in progress."""
+    with _lock:
+        if _state["running"]:
+            return False
+        _state["running"] = True
+    try:
+        items = disk_cache.iter_cached_postcodes()
+        keys, cold = stale_keys(items)
+        evicted = disk_cache.evict(cold) if cold else 0
+        disk_cache.prune_access(items)
+        queue: "asyncio.Queue[str]" = asyncio.Queue()
+        for key in keys:
+            queue.put_nowait(key)
+        with _lock:
+            PREFETCH_STATS.update({"runs": PREFETCH_STATS["runs"] + 1, "attempted": 0, "refreshed": 0, "failed": 0})
+            PREFETCH_STATS.update(total=len(keys), skippedCold=len(cold), evicted=evicted)
+            _state.update(startedAt=_now().isoformat(), finishedAt=None, started=time.monotonic(), pausedFor=0.0)
+            if _state["pausedSince"] is not None:
+                # Paused before this run began: only count the pause from here on
+                _state["pausedSince"] = _state["started"]
+        if cold:
+            log.info("[prefetch] Evicted %s cold stale entries", evicted)
+        log.info("[prefetch] Refreshing %s stale entries with %s workers, hottest first", len(keys), _WORKERS)
+        await asyncio.gather(*(_work(queue) for _ in range(min(_WORKERS, len(keys)))))
+        with _lock:
+            _state["finishedAt"] = _now().isoformat()
+            done = dict(PREFETCH_STATS)
+        log.info("[prefetch] Done: %s refreshed, %s failed", done["refreshed"], done["failed"])
+        return True
+    finally:
+        with _lock:
+            _state["running"] = False
+
+
+async def _schedule(on_startup: bool) -> None:
+    if on_startup:
+        await _run_logged()
+    while True:
+        target = next_run_after(_now())
+        with _lock:
+            _state["nextRunAt"] = target.isoformat()
+        while True:
+            remaining = (target - _now()).total_seconds()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, _MAX_SLEEP_SECONDS))
+        await _run_logged()
+
+
+async def _run_logged() -> None:
+    try:
+        await run_once()
+    except Exception:
+        log.exception("[prefetch] Run failed")
+
+
+def start(refresh: Callable[[str], Awaitable[Any]], *, include_uprn: bool) -> None:
+    """Start the scheduler on the running loop (app lifespan). ``refresh(key)`` refreshes
+    one cache entry; UPRN entries are included only with ``include_uprn``."""
+    global _refresh, _include_uprn, _resume, _task, _AT
+    if not enabled() or _task is not None:
+        return
+    try:
+        parse_at(_AT)
+    except ValueError as exc:
+        log.error("[prefetch] Invalid BINDICATOR_PREFETCH_AT (%s); using %s", exc, _DEFAULT_AT)
+        _AT = _DEFAULT_AT
+    _refresh, _include_uprn = refresh, include_uprn
+    _resume = asyncio.Event()
+    _resume.set()
+    _task = asyncio.create_task(_schedule(_env_bool("BINDICATOR_PREFETCH_ON_STARTUP", True)))
+
+
+def trigger() -> bool:
+    """Start a run in the background unless one is in progress or the scheduler is off."""
+    with _lock:
+        if _task is None or _state["running"]:
+            return False
+    task = asyncio.create_task(run_once())
+    _manual.add(task)
+    task.add_done_callback(_manual.discard)
+    return True
+
+
+async def stop() -> None:
+    global _task
+    tasks = [t for t in (_task, *_manual) if t is not None]
+    _task = None
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def pause() -> None:
+    """Let in-flight refreshes finish but start no new ones until resume()."""
+    if _resume is not None and _resume.is_set():
+        _resume.clear()
+        with _lock:
+            _state["pausedSince"] = time.monotonic()
+        log.info("[prefetch] Paused")
+
+
+def resume() -> None:
+    if _resume is not None and not _resume.is_set():
+        with _lock:
+            since = _state["pausedSince"]
+            _state["pausedSince"] = None
+            if since is not None and _state["running"]:
+                _state["pausedFor"] += time.monotonic() - since
+        _resume.set()
+        log.info("[prefetch] Resumed")
+
+
+def last_run_at() -> Optional[str]:
+    with _lock:
+        return _state["finishedAt"]
+
+
+def stats() -> Dict[str, Any]:
+    now = time.monotonic()
+    with _lock:
+        out: Dict[str, Any] = dict(PREFETCH_STATS)
+        running = _state["running"]
+        paused_since = _state["pausedSince"]
+        done = out["refreshed"] + out["failed"]
+        remaining = out["total"] - done if running else 0
+        eta = None
+        if running and done:
+            # Time actually spent working this run (pauses excluded), extrapolated
+            active = now - _state["started"] - _state["pausedFor"] - (now - paused_since if paused_since else 0.0)
+            eta = round(active / done * remaining, 1)
+        out.update(
+            enabled=enabled(),
+            state="paused" if paused_since is not None else ("running" if running else "idle"),
+            remaining=remaining,
+            progress=round(done / out["total"], 3) if out["total"] else None,
+            etaSeconds=eta,
+            inProgress=sorted(_current),
+            workers=_WORKERS,
+            startedAt=_state["startedAt"],
+            finishedAt=_state["finishedAt"],
+            nextRunAt=_state["nextRunAt"],
+            at=_AT,
+            timezone=_TZ,
+        )
+    return out
@@ -0,0 +1,328 @@
+"""Warm Playwright browser pool for the RBWM scraper fallbacks.
+
+One Chromium is launched per process and kept running; pages are opened in a
+bounded set of reusable browser contexts. A context is recycled after
+``RBWM_BROWSER_MAX_USES`` pages or after a Playwright error, and the browser is
+relaunched if it disconnects. When every context is busy, callers queue for up
+to ``RBWM_BROWSER_ACQUIRE_TIMEOUT`` seconds.
+
+Playwright objects belong to the event loop that created them, so the pool
+serves only the app's loop (started from the FastAPI lifespan). Code running on
+any other loop, e.g. a tool calling ``asyncio.run``, gets an ephemeral browser
+exactly as before.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from . import governor, resource_filter
+
+log = logging.getLogger("bindicator.browser")
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, int] = {
+    "launches": 0,
+    "relaunches": 0,
+    "contexts": 0,
+    "recycled": 0,
+    "pages": 0,
+    "queued": 0,
+    "timeouts": 0,
+    "errors": 0,
+    "ephemeral": 0,
+}
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, "true" if default else "false").lower() in {"1", "true", "yes", "on"}
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+
+class PoolTimeout(RuntimeError):
+    """No browser context became free within the acquire timeout."""
+
+
+class _Slot:
+    __slots__ = ("context", "generation", "uses", "idle_since")
+
+    def __init__(self, context: Any, generation: int):
+        self.context = context
+        self.generation = generation
+        self.uses = 0
+        self.idle_since = time.monotonic()
+
+
+class BrowserPool:
+    def __init__(self, *, size: int, max_uses: int, acquire_timeout: float, idle_seconds: float):
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.acquire_timeout = acquire_timeout
+        self.idle_seconds = idle_seconds
+        self.loop = asyncio.get_running_loop()
+        self._sem = asyncio.Semaphore(self.size)
+        self._launch_lock = asyncio.Lock()
+        self._idle: List[_Slot] = []
+        self._in_use = 0
+        self._waiting = 0
+        self._playwright: Any = None
+        self._browser: Any = None
+        # Bumped on every (re)launch so contexts from a dead browser are never reused
+        self._generation = 0
+        self._closed = False
+
+    def _connected(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _ensure_browser(self) -> Any:
+        if self._connected():
+            return self._browser
+        async with self._launch_lock:
+            if self._connected():
+                return self._browser
+            if self._browser is not None:
+                log.warning("[browser] Chromium disconnected; relaunching")
+                _count("relaunches")
+                self._idle.clear()
+                try:
+                    await self._browser.close()
+                except Exception:
+                    pass
+            if self._playwright is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._generation += 1
+            _count("launches")
+            log.info("[browser] Chromium launched (pool size %s)", self.size)
+        return self._browser
+
+    async def _checkout(self) -> _Slot:
+        browser = await self._ensure_browser()
+        while self._idle:
+            slot = self._idle.pop()
+            if slot.generation == self._generation:
+                return slot
+        context = await browser.new_context()
+        _count("contexts")
+        return _Slot(context, self._generation)
+
+    async def _checkin(self, slot: _Slot, healthy: bool) -> None:
+        slot.uses += 1
+        if healthy and not self._closed and slot.uses < self.max_uses and slot.generation == self._generation:
+            slot.idle_since = time.monotonic()
+            self._idle.append(slot)
+            return
+        _count("recycled")
+        try:
+            await slot.context.close()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """A fresh page in a pooled context; waits (bounded) when all contexts are busy."""
+        from playwright.async_api import Error as PlaywrightError
+
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+        if self._sem.locked():
+            _count("queued")
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(self._sem.acquire(), self.acquire_timeout)
+            except asyncio.TimeoutError:
+                _count("timeouts")
+                raise PoolTimeout(f"No browser context free after {self.acquire_timeout:.0f}s") from None
+            finally:
+                self._waiting -= 1
+        else:
+            await self._sem.acquire()
+        self._in_use += 1
+        slot: Optional[_Slot] = None
+        healthy = True
+        try:
+            slot = await self._checkout()
+            page = await slot.context.new_page()
+            _count("pages")
+            try:
+                yield page
+            except PlaywrightError:
+                # Timeouts, crashed targets, closed contexts: don't hand this context out again
+                healthy = False
+                _count("errors")
+                raise
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    healthy = False
+        finally:
+            if slot is not None:
+                await self._checkin(slot, healthy)
+            self._in_use -= 1
+            self._sem.release()
+
+    async def check(self) -> None:
+        """Health check: drop contexts of a disconnected browser and trim long-idle ones."""
+        if self._browser is not None and not self._browser.is_connected():
+            self._idle.clear()
+        cutoff = time.monotonic() - self.idle_seconds
+        stale = [s for s in self._idle if s.idle_since < cutoff]
+        self._idle = [s for s in self._idle if s.idle_since >= cutoff]
+        for slot in stale:
+            _count("recycled")
+            try:
+                await slot.context.close()
+            except Exception:
+                pass
+
+    async def run_checks(self, interval: float) -> None:
+        while not self._closed:
+            await asyncio.sleep(interval)
+            try:
+                await self.check()
+            except Exception:
+                log.exception("[browser] Health check failed")
+
+    async def warm(self) -> None:
+        """Launch Chromium and open one context ahead of the first fallback."""
+        async with self.page():
+            pass
+
+    async def close(self) -> None:
+        self._closed = True
+        for slot in self._idle:
+            try:
+                await slot.context.close()
+            except Exception:
+                pass
+        self._idle.clear()
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "maxUses": self.max_uses,
+            "connected": self._connected(),
+            "inUse": self._in_use,
+            "idle": len(self._idle),
+            "waiting": self._waiting,
+        }
+
+
+_pool: Optional[BrowserPool] = None
+_health_task: Optional["asyncio.Task[None]"] = None
+
+
+def enabled() -> bool:
+    return _env_bool("RBWM_BROWSER_POOL", True)
+
+
+async def start() -> Optional[BrowserPool]:
+    """Create the pool on the running loop (app lifespan). Chromium launches on first
+    use unless RBWM_BROWSER_PREWARM is set."""
+    global _pool, _health_task
+    if not enabled() or _pool is not None:
+        return _pool
+    _pool = BrowserPool(
+        size=_env_int("RBWM_BROWSER_POOL_SIZE", 2),
+        max_uses=_env_int("RBWM_BROWSER_MAX_USES", 50),
+        acquire_timeout=_env_float("RBWM_BROWSER_ACQUIRE_TIMEOUT", 30.0),
+        idle_seconds=_env_float("RBWM_BROWSER_IDLE_SECONDS", 600.0),
+    )
+    _health_task = asyncio.create_task(_pool.run_checks(_env_float("RBWM_BROWSER_HEALTH_SECONDS", 60.0)))
+    if _env_bool("RBWM_BROWSER_PREWARM", False):
+        try:
+            await _pool.warm()
+        except Exception as exc:
+            log.warning("[browser] Pre-warm failed (will retry on first use): %s", exc)
+    return _pool
+
+
+async def close() -> None:
+    global _pool, _health_task
+    pool, _pool = _pool, None
+    task, _health_task = _health_task, None
+    if task is not None:
+        task.cancel()
+    if pool is not None:
+        await pool.close()
+
+
+def current() -> Optional[BrowserPool]:
+    """The pool if it was started on the running event loop, else None."""
+    pool = _pool
+    if pool is None:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return pool if pool.loop is loop else None
+
+
+@asynccontextmanager
+async def page() -> AsyncIterator[Any]:
+    """A Playwright page: pooled on the app's loop, otherwise from a one-off browser.
+    The page session holds one upstream governor slot and loads only what the
+    resource filter lets through."""
+    pool = current()
+    if pool is not None:
+        async with pool.page() as p, governor.slot(), resource_filter.filtered(p):
+            yield p
+        return
+
+    from playwright.async_api import async_playwright
+
+    _count("ephemeral")
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+        ctx = await browser.new_context()
+        try:
+            p = await ctx.new_page()
+            async with governor.slot(), resource_filter.filtered(p):
+                yield p
+        finally:
+            await ctx.close()
+            await browser.close()
+
+
+def stats() -> Dict[str, Any]:
+    with _stats_lock:
+        out: Dict[str, Any] = dict(_stats)
+    pool = _pool
+    out["enabled"] = enabled()
+    out["started"] = pool is not None
+    out["resources"] = resource_filter.stats()
+    if pool is not None:
+        out.update(pool.stats())
+    return out
@@ -0,0 +1,294 @@
+"""Shared politeness and protection layer for every request to RBWM.
+
+All upstream work, whether HTTP requests through the shared clients or
+Playwright page sessions, takes a slot here first:
+
+- a token bucket caps the request rate across all concurrent users
+  (``RBWM_RATE_PER_SEC``, ``RBWM_RATE_BURST``);
+- an AIMD concurrency limit grows by ~1 per round of successes and halves on
+  429/5xx responses and timeouts (``RBWM_CONCURRENCY_MIN/INITIAL/MAX``); a 429
+  with ``Retry-After`` also pauses the bucket;
+- a circuit breaker opens after ``RBWM_BREAKER_FAILURES`` consecutive failures
+  and rejects calls with ``CircuitOpen`` for ``RBWM_BREAKER_COOLDOWN`` seconds,
+  then lets a single probe through.
+
+State lives behind a threading lock and waits are short sleeps, so the same
+governor paces the app's event loop and the blocking scrapers used by tools and
+benchmarks.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+import httpx
+
+log = logging.getLogger("bindicator.governor")
+
+# Longest single sleep while waiting for a slot; keeps waits responsive to releases
+_POLL_SECONDS = 0.05
+# Multiplicative decreases closer together than this count as one congestion event
+_BACKOFF_WINDOW_SECONDS = 1.0
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class CircuitOpen(RuntimeError):
+    """RBWM has been failing; calls are rejected until the cooldown passes."""
+
+
+class GovernorTimeout(RuntimeError):
+    """No upstream slot became available within the maximum wait."""
+
+
+def _classify(exc: Optional[BaseException]) -> str:
+    """'ok', 'overload' (back off), 'failure' (upstream unreachable) or 'neutral'."""
+    if exc is None:
+        return "ok"
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return "overload" if code == 429 or code >= 500 else "ok"
+    if isinstance(exc, (httpx.TimeoutException, TimeoutError)):
+        return "overload"
+    if isinstance(exc, httpx.TransportError):
+        return "failure"
+    if type(exc).__module__.startswith("playwright"):
+        return "overload" if "Timeout" in type(exc).__name__ else "failure"
+    # Parse errors, cancellations, ...: RBWM itself answered (or we gave up), no signal
+    return "neutral"
+
+
+def _retry_after(exc: Optional[BaseException]) -> Optional[float]:
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429:
+        try:
+            return min(float(exc.response.headers.get("Retry-After", "")), 60.0)
+        except ValueError:
+            return None
+    return None
+
+
+class Governor:
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: float,
+        min_limit: float,
+        initial_limit: float,
+        max_limit: float,
+        failure_threshold: int,
+        cooldown: float,
+        max_wait: float,
+    ):
+        self.rate = max(rate, 0.01)
+        self.burst = max(burst, 1.0)
+        self.min_limit = max(min_limit, 1.0)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.failure_threshold = max(failure_threshold, 1)
+        self.cooldown = cooldown
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._refilled = time.monotonic()
+        self._paused_until = 0.0
+        self._limit = min(max(initial_limit, self.min_limit), self.max_limit)
+        self._in_flight = 0
+        self._last_backoff = 0.0
+        self._state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._stats: Dict[str, int] = {
+            "acquired": 0,
+            "delayed": 0,
+            "rejected": 0,
+            "timeouts": 0,
+            "backoffs": 0,
+            "opened": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> "Governor":
+        return cls(
+            rate=_env_float("RBWM_RATE_PER_SEC", 2.0),
+            burst=_env_float("RBWM_RATE_BURST", 5.0),
+            min_limit=_env_float("RBWM_CONCURRENCY_MIN", 1.0),
+            initial_limit=_env_float("RBWM_CONCURRENCY_INITIAL", 4.0),
+            max_limit=_env_float("RBWM_CONCURRENCY_MAX", 8.0),
+            failure_threshold=int(_env_float("RBWM_BREAKER_FAILURES", 5)),
+            cooldown=_env_float("RBWM_BREAKER_COOLDOWN", 30.0),
+            max_wait=_env_float("RBWM_GOVERNOR_MAX_WAIT", 20.0),
+        )
+
+    def _try_acquire(self, now: float) -> Tuple[float, bool]:
+        """Take a slot and return (0, probe), or return (how long to wait, False).
+        ``probe`` is True for the one call let through a half-open circuit; only its
+        release may close or reopen the circuit. Raises CircuitOpen."""
+        with self._lock:
+            if self._state == "open":
+                if now - self._opened_at < self.cooldown:
+                    self._stats["rejected"] += 1
+                    raise CircuitOpen(f"RBWM circuit open for another {self.cooldown - (now - self._opened_at):.0f}s")
+                self._state = "half_open"
+                log.info("[governor] Circuit half-open; probing RBWM")
+            if self._state == "half_open" and self._probing:
+                self._stats["rejected"] += 1
+                raise CircuitOpen("RBWM circuit half-open; probe in progress")
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+            self._refilled = now
+            if now < self._paused_until:
+                return self._paused_until - now, False
+            if self._in_flight >= int(self._limit):
+                return _POLL_SECONDS, False
+            if self._tokens < 1.0:
+                return (1.0 - self._tokens) / self.rate, False
+            self._tokens -= 1.0
+            self._in_flight += 1
+            self._stats["acquired"] += 1
+            probe = self._state == "half_open"
+            if probe:
+                self._probing = True
+            return 0.0, probe
+
+    def _release(self, exc: Optional[BaseException], *, probe: bool = False) -> None:
+        """Account for a finished call. Calls that were already in flight when the
+        circuit opened (``probe`` False) adjust the limits but never change its state."""
+        kind = _classify(exc)
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight -= 1
+            if probe:
+                self._probing = False
+            if kind == "neutral":
+                # No verdict; a half-open circuit simply lets the next call probe
+                return
+            if kind == "ok":
+                if self._state == "half_open" and probe:
+                    self._state = "closed"
+                    log.info("[governor] RBWM recovered; circuit closed")
+                self._failures = 0
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+                return
+            self._failures += 1
+            if now - self._last_backoff >= _BACKOFF_WINDOW_SECONDS:
+                self._limit = max(self.min_limit, self._limit / 2.0)
+                self._last_backoff = now
+                self._stats["backoffs"] += 1
+            pause = _retry_after(exc)
+            if pause:
+                self._paused_until = max(self._paused_until, now + pause)
+            if (self._state == "half_open" and probe) or (
+                self._state == "closed" and self._failures >= self.failure_threshold
+            ):
+                self._state = "open"
+                self._opened_at = now
+                self._stats["opened"] += 1
+                log.warning("[governor] Circuit opened after %s consecutive failures", self._failures)
+
+    def _check_wait(self, now: float, deadline: float, delay: float) -> None:
+        if now + delay > deadline:
+            with self._lock:
+                self._stats["timeouts"] += 1
+            raise GovernorTimeout(f"No RBWM slot within {self.max_wait:.0f}s")
+
+    def _mark_delayed(self) -> None:
+        with self._lock:
+            self._stats["delayed"] += 1
+
+    async def acquire(self) -> bool:
+        """Wait for a slot; True if this call is the half-open probe."""
+        deadline = time.monotonic() + self.max_wait
+        delayed = False
+        while True:
+            now = time.monotonic()
+            delay, probe = self._try_acquire(now)
+            if delay <= 0:
+                break
+            self._check_wait(now, deadline, delay)
+            delayed = True
+            await asyncio.sleep(min(delay, _POLL_SECONDS * 5))
+        if delayed:
+            self._mark_delayed()
+        return probe
+
+    def acquire_sync(self) -> bool:
+        deadline = time.monotonic() + self.max_wait
+        delayed = False
+        while True:
+            now = time.monotonic()
+            delay, probe = self._try_acquire(now)
+            if delay <= 0:
+                break
+            self._check_wait(now, deadline, delay)
+            delayed = True
+            time.sleep(min(delay, _POLL_SECONDS * 5))
+        if delayed:
+            self._mark_delayed()
+        return probe
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        probe = await self.acquire()
+        try:
+            yield
+        except BaseException as exc:
+            self._release(exc, probe=probe)
+            raise
+        self._release(None, probe=probe)
+
+    @contextmanager
+    def slot_sync(self) -> Iterator[None]:
+        probe = self.acquire_sync()
+        try:
+            yield
+        except BaseException as exc:
+            self._release(exc, probe=probe)
+            raise
+        self._release(None, probe=probe)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+            return {
+                "circuit": self._state,
+                "consecutiveFailures": self._failures,
+                "reopensInSeconds": (
+                    round(max(0.0, self.cooldown - (now - self._opened_at)), 1) if self._state == "open" else None
+                ),
+                "ratePerSec": self.rate,
+                "burst": self.burst,
+                "tokens": round(tokens, 2),
+                "pausedForSeconds": round(max(0.0, self._paused_until - now), 1),
+                "concurrencyLimit": round(self._limit, 2),
+                "inFlight": self._in_flight,
+                **self._stats,
+            }
+
+
+_governor = Governor.from_env()
+
+
+def get_governor() -> Governor:
+    return _governor
+
+
+def slot():
+    """``async with slot():`` around one upstream request or page session."""
+    return _governor.slot()
+
+
+def slot_sync():
+    return _governor.slot_sync()
+
+
+def stats() -> Dict[str, Any]:
+    return _governor.stats()
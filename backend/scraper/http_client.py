@@ -0,0 +1,197 @@
+"""Process-wide pooled HTTP clients for the RBWM scrapers.
+
+One ``httpx.AsyncClient`` (request handlers and background jobs, on the app's
+event loop) is shared by every lookup, so DNS, TCP and TLS setup to
+forms.rbwm.gov.uk is paid once per pooled connection instead of once per call.
+The FastAPI lifespan starts (and warms) it and closes it on shutdown. The sync
+scrapers used by tools and benchmarks get a lazily created ``httpx.Client``.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+log = logging.getLogger("bindicator.http")
+
+RBWM_BASE_URL = "https://forms.rbwm.gov.uk"
+USER_AGENT = "Bindicator/0.1 (+https://github.com/)"
+
+_lock = threading.Lock()
+_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_started_at: Optional[float] = None
+_stats: Dict[str, int] = {"requests": 0, "responses": 0, "errors": 0}
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _http2_enabled() -> bool:
+    if os.getenv("RBWM_HTTP2", "false").lower() not in {"1", "true", "yes", "on"}:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        log.warning("RBWM_HTTP2 is set but the 'h2' package is missing (pip install 'httpx[http2]'); using HTTP/1.1")
+        return False
+    return True
+
+
+def _count(name: str) -> None:
+    with _lock:
+        _stats[name] += 1
+
+
+def _on_request(_request: httpx.Request) -> None:
+    _count("requests")
+
+
+def _on_response(_response: httpx.Response) -> None:
+    _count("responses")
+
+
+async def _on_request_async(_request: httpx.Request) -> None:
+    _count("requests")
+
+
+async def _on_response_async(_response: httpx.Response) -> None:
+    _count("responses")
+
+
+def _client_kwargs() -> Dict[str, Any]:
+    limits = httpx.Limits(
+        max_connections=_env_int("RBWM_HTTP_MAX_CONNECTIONS", 10),
+        max_keepalive_connections=_env_int("RBWM_HTTP_MAX_KEEPALIVE", 5),
+        keepalive_expiry=_env_float("RBWM_HTTP_KEEPALIVE_EXPIRY", 30.0),
+    )
+    return {
+        "follow_redirects": True,
+        "timeout": _env_float("RBWM_HTTP_TIMEOUT", 20.0),
+        "headers": {"User-Agent": USER_AGENT},
+        "limits": limits,
+        "http2": _http2_enabled(),
+    }
+
+
+def _build() -> httpx.Client:
+    return httpx.Client(event_hooks={"request": [_on_request], "response": [_on_response]}, **_client_kwargs())
+
+
+def _build_async() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        event_hooks={"request": [_on_request_async], "response": [_on_response_async]}, **_client_kwargs()
+    )
+
+
+def get_client() -> httpx.Client:
+    """Shared sync client for the blocking scrapers (tools, benchmarks), created on first use."""
+    global _client, _started_at
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = _build()
+                _started_at = time.time()
+    return _client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Shared async client. Its connections belong to the event loop that first used it
+    (the app's loop)."""
+    global _async_client, _started_at
+    if _async_client is None:
+        with _lock:
+            if _async_client is None:
+                _async_client = _build_async()
+                _started_at = _started_at or time.time()
+    return _async_client
+
+
+def start() -> httpx.AsyncClient:
+    return get_async_client()
+
+
+def use_clients(*, client: Optional[httpx.Client] = None, async_client: Optional[httpx.AsyncClient] = None) -> None:
+    """Install specific clients (tools and benchmarks, e.g. with a mock transport)."""
+    global _client, _async_client, _started_at
+    with _lock:
+        if client is not None:
+            _client = client
+        if async_client is not None:
+            _async_client = async_client
+        _started_at = _started_at or time.time()
+
+
+async def warm_up_async() -> bool:
+    """Open a pooled connection to RBWM ahead of the first real lookup."""
+    try:
+        await get_async_client().head(
+            RBWM_BASE_URL + "/bincollections", timeout=_env_float("RBWM_HTTP_WARMUP_TIMEOUT", 5.0)
+        )
+        return True
+    except Exception as exc:
+        _count("errors")
+        log.warning("RBWM HTTP warm-up failed: %s", exc)
+        return False
+
+
+def record_error() -> None:
+    """Scrapers call this when a request through the shared client fails."""
+    _count("errors")
+
+
+def close() -> None:
+    global _client, _started_at
+    with _lock:
+        client, _client = _client, None
+        if _async_client is None:
+            _started_at = None
+    if client is not None:
+        client.close()
+
+
+async def aclose() -> None:
+    """Close both shared clients (app shutdown)."""
+    global _async_client
+    with _lock:
+        async_client, _async_client = _async_client, None
+    if async_client is not None:
+        await async_client.aclose()
+    close()
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Counters plus a best-effort view of the connection pool for /api/health."""
+    with _lock:
+        clients = {"sync": _client, "async": _async_client}
+        stats: Dict[str, Any] = dict(_stats)
+        started = _started_at
+    stats["started"] = any(c is not None for c in clients.values())
+    stats["uptimeSeconds"] = round(time.time() - started, 1) if started else None
+    if not stats["started"]:
+        return stats
+    stats["http2"] = _http2_enabled()
+    for name, client in clients.items():
+        if client is None:
+            continue
+        # httpcore exposes the pool's connections; fall back quietly if that changes
+        try:
+            conns = list(client._transport._pool.connections)  # type: ignore[attr-defined]
+            idle = sum(1 for c in conns if c.is_idle())
+            stats[f"{name}Pool"] = {"connections": len(conns), "idle": idle, "active": len(conns) - idle}
+        except Exception:
+            pass
+    return stats
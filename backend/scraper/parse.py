@@ -0,0 +1,261 @@
+"""HTML parsing for RBWM bin collection pages.
+
+Two page shapes matter: the postcode search page (an address table whose rows
+link to ``?uprn=...``) and the per-address page with its
+``.widget-bin-collections`` table. Both the HTTP scrapers and the Playwright
+scrapers (via ``page.content()``) parse through here.
+
+The parser backend is picked once: selectolax (lexbor) if installed, then lxml,
+then BeautifulSoup's pure-Python ``html.parser``. ``RBWM_HTML_PARSER`` forces one
+of ``selectolax``, ``lxml`` or ``bs4``. The backends agree on RBWM's markup; only
+selectolax (an HTML5 parser) also sees an implied ``<tbody>`` in bare tables.
+"""
+import logging
+import os
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+log = logging.getLogger("bindicator.scraper")
+
+_ORDINAL_RE = re.compile(r"\b(\d{1,2})(st|nd|rd|th)\b")
+_POSTCODE_RE = re.compile(r"\b([A-Z]{1,2}\d{1,2}[A-Z]?)\s*(\d[ABD-HJLN-UW-Z]{2})\b")
+_WIDGET_CLASS = "widget-bin-collections"
+_SELECT_LABEL = "Select this address"
+
+# (uprn, address text) per address row
+AddressRows = List[Tuple[str, str]]
+# (service, date text) per schedule row, plus the widget's text; rows is None without a widget
+ScheduleRows = Tuple[Optional[List[Tuple[str, str]]], str]
+
+
+class ScheduleTable(NamedTuple):
+    services_by_date: Dict[date, List[str]]
+    postcode: str
+    no_collections: bool
+
+
+def _uprn_from(href: str) -> str:
+    return href.split("uprn=")[-1].split("&")[0]
+
+
+def _fallback_address(row_text: str, link_text: str) -> str:
+    return row_text or (link_text or "").replace(_SELECT_LABEL, "").strip()
+
+
+# --- selectolax (lexbor) ---
+
+def _sx_text(node, sep: str) -> str:
+    # Join stripped, non-empty text nodes like BeautifulSoup's get_text(sep, strip=True)
+    return sep.join(p for p in node.text(separator="\x1f", strip=True).split("\x1f") if p)
+
+
+def _sx_addresses(html: str) -> AddressRows:
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    rows: AddressRows = []
+    for row in tree.css("table tbody tr"):
+        cells = row.css("td")
+        if not cells:
+            continue
+        link = row.css_first('a[href*="uprn="]')
+        href = (link.attributes.get("href") or "") if link is not None else ""
+        if not href or "uprn=" not in href:
+            continue
+        uprn = _uprn_from(href)
+        rows.append((uprn, _sx_text(cells[0], " ") or uprn))
+    if rows:
+        return rows
+    for a in tree.css("a"):
+        href = a.attributes.get("href") or ""
+        if "uprn=" not in href:
+            continue
+        uprn = _uprn_from(href)
+        tr = a.parent
+        while tr is not None and tr.tag != "tr":
+            tr = tr.parent
+        first = tr.css_first("td") if tr is not None else None
+        row_text = _sx_text(first, " ") if first is not None else ""
+        rows.append((uprn, _fallback_address(row_text, _sx_text(a, " ")) or uprn))
+    return rows
+
+
+def _sx_schedule(html: str) -> ScheduleRows:
+    from selectolax.lexbor import LexborHTMLParser
+
+    widget = LexborHTMLParser(html).css_first("." + _WIDGET_CLASS)
+    if widget is None:
+        return None, ""
+    rows = []
+    for row in widget.css("table tbody tr"):
+        tds = row.css("td")
+        if len(tds) >= 2:
+            rows.append((_sx_text(tds[0], ""), _sx_text(tds[1], "")))
+    return rows, _sx_text(widget, " ")
+
+
+# --- lxml ---
+
+def _lx_text(el, sep: str) -> str:
+    return sep.join(t.strip() for t in el.itertext() if t.strip())
+
+
+def _lx_root(html: str):
+    from lxml import html as lxml_html
+
+    return lxml_html.document_fromstring(html)
+
+
+def _lx_addresses(html: str) -> AddressRows:
+    root = _lx_root(html)
+    rows: AddressRows = []
+    for row in root.xpath("//table//tbody//tr"):
+        cells = row.xpath(".//td")
+        if not cells:
+            continue
+        links = row.xpath(".//a[contains(@href, 'uprn=')]")
+        href = (links[0].get("href") or "") if links else ""
+        if not href:
+            continue
+        uprn = _uprn_from(href)
+        rows.append((uprn, _lx_text(cells[0], " ") or uprn))
+    if rows:
+        return rows
+    for a in root.xpath("//a[contains(@href, 'uprn=')]"):
+        uprn = _uprn_from(a.get("href") or "")
+        tds = a.xpath("ancestor::tr[1]//td")
+        row_text = _lx_text(tds[0], " ") if tds else ""
+        rows.append((uprn, _fallback_address(row_text, _lx_text(a, " ")) or uprn))
+    return rows
+
+
+def _lx_schedule(html: str) -> ScheduleRows:
+    found = _lx_root(html).xpath(
+        f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {_WIDGET_CLASS} ')]"
+    )
+    if not found:
+        return None, ""
+    widget = found[0]
+    rows = []
+    for row in widget.xpath(".//table//tbody//tr"):
+        tds = row.xpath(".//td")
+        if len(tds) >= 2:
+            rows.append((_lx_text(tds[0], ""), _lx_text(tds[1], "")))
+    return rows, _lx_text(widget, " ")
+
+
+# --- BeautifulSoup (pure Python fallback) ---
+
+def _bs_addresses(html: str) -> AddressRows:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    rows: AddressRows = []
+    for row in soup.select("table tbody tr"):
+        cells = row.find_all("td")
+        if not cells:
+            continue
+        link = row.select_one('a[href*="uprn="]')
+        href = link.get("href") if link else ""
+        if not href or "uprn=" not in href:
+            continue
+        uprn = _uprn_from(href)
+        rows.append((uprn, cells[0].get_text(" ", strip=True) or uprn))
+    if rows:
+        return rows
+    for a in soup.find_all("a"):
+        href = a.get("href") or ""
+        if "uprn=" not in href:
+            continue
+        uprn = _uprn_from(href)
+        tr = a.find_parent("tr")
+        tds = tr.find_all("td") if tr else []
+        row_text = tds[0].get_text(" ", strip=True) if tds else ""
+        rows.append((uprn, _fallback_address(row_text, a.get_text(" ", strip=True)) or uprn))
+    return rows
+
+
+def _bs_schedule(html: str) -> ScheduleRows:
+    from bs4 import BeautifulSoup
+
+    widget = BeautifulSoup(html, "html.parser").select_one("." + _WIDGET_CLASS)
+    if not widget:
+        return None, ""
+    rows = []
+    for row in widget.select("table tbody tr"):
+        tds = row.find_all("td")
+        if len(tds) >= 2:
+            rows.append((tds[0].get_text(strip=True), tds[1].get_text(strip=True)))
+    return rows, widget.get_text(" ", strip=True)
+
+
+_BACKENDS: Dict[str, Tuple[Callable[[str], AddressRows], Callable[[str], ScheduleRows]]] = {
+    "selectolax": (_sx_addresses, _sx_schedule),
+    "lxml": (_lx_addresses, _lx_schedule),
+    "bs4": (_bs_addresses, _bs_schedule),
+}
+_MODULES = {"selectolax": "selectolax.lexbor", "lxml": "lxml.html", "bs4": "bs4"}
+
+
+def available_backends() -> List[str]:
+    import importlib
+
+    found = []
+    for name, module in _MODULES.items():
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+        found.append(name)
+    return found
+
+
+def _pick_backend() -> str:
+    available = available_backends()
+    wanted = os.getenv("RBWM_HTML_PARSER", "auto").lower()
+    if wanted in available:
+        return wanted
+    if wanted != "auto":
+        log.warning("RBWM_HTML_PARSER=%s is not available; using %s", wanted, available[0] if available else "bs4")
+    return available[0] if available else "bs4"
+
+
+BACKEND = _pick_backend()
+
+
+@lru_cache(maxsize=1024)
+def parse_date(text: str) -> Optional[date]:
+    """'3rd November 2025' -> date(2025, 11, 3); None when it isn't a date."""
+    try:
+        return datetime.strptime(_ORDINAL_RE.sub(r"\1", text.strip()), "%d %B %Y").date()
+    except ValueError:
+        return None
+
+
+def find_postcode(text: str) -> str:
+    m = _POSTCODE_RE.search(text)
+    return m.group(0).upper() if m else ""
+
+
+def parse_addresses(html: str, *, backend: Optional[str] = None) -> AddressRows:
+    """``[(uprn, address), ...]`` from a postcode search page."""
+    return _BACKENDS[backend or BACKEND][0](html)
+
+
+def parse_schedule(html: str, *, backend: Optional[str] = None) -> ScheduleTable:
+    """Services per collection date from an address page. Raises if the widget is missing."""
+    rows, text = _BACKENDS[backend or BACKEND][1](html)
+    if rows is None:
+        raise RuntimeError("RBWM schedule widget not found")
+    services_by_date: Dict[date, List[str]] = {}
+    for service, date_text in rows:
+        d = parse_date(date_text)
+        if d is not None:
+            services_by_date.setdefault(d, []).append(service)
+    return ScheduleTable(
+        services_by_date=services_by_date,
+        postcode=find_postcode(text),
+        no_collections=not services_by_date and "no collections found" in text.lower(),
+    )
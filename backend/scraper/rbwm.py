@@ -1,9 +1,16 @@
 import os
 from datetime import date
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, AsyncIterator, Optional, List, Dict, Any
 from pydantic import BaseModel
 from enum import Enum
 
+from . import governor, parse
+from .browser_pool import page as browser_page
+from .http_client import RBWM_BASE_URL, get_async_client, get_client, record_error
+
+if TYPE_CHECKING:
+    import httpx
+
 # Import types from main without circular import by redefining minimal contract here
 class BinType(str, Enum):
     blue = "blue"
@@ -11,10 +18,36 @@ class BinType(str, Enum):
     black = "black"
 
 
+class CollectionDay(BaseModel):
+    collection_date: date
+    bins: list[BinType]
+
+
 class ScraperResult(BaseModel):
     postcode: str
     next_collection_date: Optional[date]
     bins: list[BinType]
+    # Every dated row of the schedule table, oldest first (empty for heuristic scrapes)
+    schedule: list[CollectionDay] = []
+
+
+def _bins_for_services(services: List[str]) -> list[BinType]:
+    """Map RBWM service names to bins: always blue + (black if Refuse present else green if Garden present)."""
+    has_refuse = any("refuse" in s.lower() for s in services)
+    has_garden = any("garden" in s.lower() for s in services)
+    return [BinType.blue, (BinType.black if has_refuse else (BinType.green if has_garden else BinType.black))]
+
+
+def _schedule_from(services_by_date: Dict[date, List[str]]) -> tuple[date, list[BinType], list[CollectionDay]]:
+    """Pick the next collection (first date >= today) and keep the whole parsed schedule."""
+    today = date.today()
+    future_dates = sorted([d for d in services_by_date.keys() if d >= today])
+    target = future_dates[0] if future_dates else sorted(services_by_date.keys())[0]
+    schedule = [
+        CollectionDay(collection_date=d, bins=_bins_for_services(services_by_date[d]))
+        for d in sorted(services_by_date.keys())
+    ]
+    return target, _bins_for_services(services_by_date[target]), schedule
 
 
 async def fetch_rbwm_schedule(postcode: str) -> ScraperResult:
@@ -24,8 +57,6 @@ async def fetch_rbwm_schedule(postcode: str) -> ScraperResult:
       - Requires 'playwright' and installed browsers: `python -m playwright install`.
       - Selectors may need adjustment depending on site changes.
     """
-    from playwright.async_api import async_playwright
-
     base_url = os.getenv(
         "RBWM_BIN_URL",
         # Default guess; adjust if RBWM changes structure
@@ -34,153 +65,174 @@ async def fetch_rbwm_schedule(postcode: str) -> ScraperResult:
 
     normalized = postcode.strip().upper()
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        ctx = await browser.new_context()
-        page = await ctx.new_page()
-        try:
-            await page.goto(base_url, wait_until="domcontentloaded", timeout=60000)
-
-            # Try common patterns to locate the postcode input
-            input_loc = page.get_by_label("Postcode", exact=False)
-            if not await input_loc.count():
-                input_loc = page.locator('input[name="postcode"], input[placeholder*="post" i]')
-
-            await input_loc.first.fill(normalized)
-
-            # Click a search or submit button
-            btn = page.get_by_role("button", name=lambda n: n and ("find" in n.lower() or "search" in n.lower() or "lookup" in n.lower()))
-            if not await btn.count():
-                btn = page.locator('button, input[type="submit"]')
-            await btn.first.click()
-
-            # Wait for results area; try a few heuristics
-            # Look for any text containing 'collection'
-            await page.wait_for_timeout(500)  # brief settle
-            results = page.locator("text=/collection/i")
-            await results.first.wait_for(timeout=60000)
-
-            # Extract the page text and do heuristic parsing
-            text = await page.inner_text("body")
-            # Very rough parsing: look for a date-like pattern. This is a placeholder
-            # for a site-specific parser. Adjust to actual RBWM markup.
-            import re
-            # Match formats like 'Monday 14 October 2024' or '14/10/2024'
-            m = re.search(r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+([0-3]?\d)\s+([A-Za-z]+)\s+(20\d{2})", text)
-            if m:
-                # Map month name to number
-                from datetime import datetime
-                dt = datetime.strptime(" ".join(m.groups()), "%A %d %B %Y").date()
-                date_idx = m.start()
-            else:
-                m2 = re.search(r"([0-3]?\d)/(0?\d|1[0-2])/(20\d{2})", text)
-                if not m2:
-                    raise RuntimeError("Unable to locate next collection date in page text. Adjust selectors/parsing.")
-                from datetime import datetime
-                day, month, year = m2.groups()
-                dt = date(int(year), int(month), int(day))
-                date_idx = m2.start()
-
-            # Determine bins: enforce rule blue + (green|black). Prefer keywords near the date.
-            bins: list[BinType] = [BinType.blue]
-            lowered = text.lower()
-            window_radius = 300
-            start = max(0, date_idx - window_radius)
-            end = min(len(lowered), date_idx + window_radius)
-            window = lowered[start:end]
-
-            # helper to find nearest occurrence index of any term
-            def nearest_pos(text_: str, terms: list[str]):
-                positions = [text_.find(t) for t in terms]
-                positions = [p for p in positions if p != -1]
-                return min(positions) if positions else None
-
-            green_pos = nearest_pos(window, ["garden", "green bin", "garden waste"])  # garden
-            black_pos = nearest_pos(window, ["rubbish", "refuse", "black bin"])       # rubbish
-
-            if green_pos is not None and black_pos is not None:
-                chosen = BinType.green if green_pos <= black_pos else BinType.black
-            elif green_pos is not None:
+    async with browser_page() as page:
+        await page.goto(base_url, wait_until="domcontentloaded", timeout=60000)
+
+        # Try common patterns to locate the postcode input
+        input_loc = page.get_by_label("Postcode", exact=False)
+        if not await input_loc.count():
+            input_loc = page.locator('input[name="postcode"], input[placeholder*="post" i]')
+
+        await input_loc.first.fill(normalized)
+
+        # Click a search or submit button
+        btn = page.get_by_role("button", name=lambda n: n and ("find" in n.lower() or "search" in n.lower() or "lookup" in n.lower()))
+        if not await btn.count():
+            btn = page.locator('button, input[type="submit"]')
+        await btn.first.click()
+
+        # Wait for results area; try a few heuristics
+        # Look for any text containing 'collection'
+        await page.wait_for_timeout(500)  # brief settle
+        results = page.locator("text=/collection/i")
+        await results.first.wait_for(timeout=60000)
+
+        # Extract the page text and do heuristic parsing
+        text = await page.inner_text("body")
+        # Very rough parsing: look for a date-like pattern. This is a placeholder
+        # for a site-specific parser. Adjust to actual RBWM markup.
+        import re
+        # Match formats like 'Monday 14 October 2024' or '14/10/2024'
+        m = re.search(r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+([0-3]?\d)\s+([A-Za-z]+)\s+(20\d{2})", text)
+        if m:
+            # Map month name to number
+            from datetime import datetime
+            dt = datetime.strptime(" ".join(m.groups()), "%A %d %B %Y").date()
+            date_idx = m.start()
+        else:
+            m2 = re.search(r"([0-3]?\d)/(0?\d|1[0-2])/(20\d{2})", text)
+            if not m2:
+                raise RuntimeError("Unable to locate next collection date in page text. Adjust selectors/parsing.")
+            from datetime import datetime
+            day, month, year = m2.groups()
+            dt = date(int(year), int(month), int(day))
+            date_idx = m2.start()
+
+        # Determine bins: enforce rule blue + (green|black). Prefer keywords near the date.
+        bins: list[BinType] = [BinType.blue]
+        lowered = text.lower()
+        window_radius = 300
+        start = max(0, date_idx - window_radius)
+        end = min(len(lowered), date_idx + window_radius)
+        window = lowered[start:end]
+
+        # helper to find nearest occurrence index of any term
+        def nearest_pos(text_: str, terms: list[str]):
+            positions = [text_.find(t) for t in terms]
+            positions = [p for p in positions if p != -1]
+            return min(positions) if positions else None
+
+        green_pos = nearest_pos(window, ["garden", "green bin", "garden waste"])  # garden
+        black_pos = nearest_pos(window, ["rubbish", "refuse", "black bin"])       # rubbish
+
+        if green_pos is not None and black_pos is not None:
+            chosen = BinType.green if green_pos <= black_pos else BinType.black
+        elif green_pos is not None:
+            chosen = BinType.green
+        elif black_pos is not None:
+            chosen = BinType.black
+        else:
+            # broaden search across page
+            green_any = any(tok in lowered for tok in ["garden", "green bin", "garden waste"])
+            black_any = any(tok in lowered for tok in ["rubbish", "refuse", "black bin"])
+            if green_any and not black_any:
                 chosen = BinType.green
-            elif black_pos is not None:
+            elif black_any and not green_any:
                 chosen = BinType.black
             else:
-                # broaden search across page
-                green_any = any(tok in lowered for tok in ["garden", "green bin", "garden waste"])
-                black_any = any(tok in lowered for tok in ["rubbish", "refuse", "black bin"])
+                chosen = BinType.black
+
+        bins.append(chosen)
+
+        # Post-process to enforce RBWM rule: always blue + exactly one of (green|black)
+        try:
+            # Build regexes to locate the chosen date within the text to get context
+            wd = dt.strftime("%A")
+            day_num = dt.day
+            month_name = dt.strftime("%B")
+            year_num = dt.year
+            import re as _re
+            patterns = [
+                _re.compile(fr"{wd}\\s+0?{day_num}\\s+{month_name}\\s+{year_num}", _re.I),
+                _re.compile(fr"0?{day_num}/0?{dt.month}/{year_num}"),
+            ]
+            idx = None
+            for pat in patterns:
+                m = pat.search(text)
+                if m:
+                    idx = m.start()
+                    break
+
+            # Choose the companion bin using context near the date if available
+            companion = None
+            lowered = text.lower()
+            if idx is not None:
+                radius = 300
+                s = max(0, idx - radius)
+                e = min(len(lowered), idx + radius)
+                win = lowered[s:e]
+                green_hits = any(t in win for t in ["garden", "green bin", "garden waste"])
+                black_hits = any(t in win for t in ["rubbish", "refuse", "black bin"])
+                if green_hits and not black_hits:
+                    companion = BinType.green
+                elif black_hits and not green_hits:
+                    companion = BinType.black
+                elif green_hits and black_hits:
+                    # Pick whichever term appears first in the window
+                    def first_pos(txt, terms):
+                        ps = [txt.find(t) for t in terms]
+                        ps = [p for p in ps if p != -1]
+                        return min(ps) if ps else None
+                    gp = first_pos(win, ["garden", "green bin", "garden waste"]) or 10**9
+                    bp = first_pos(win, ["rubbish", "refuse", "black bin"]) or 10**9
+                    companion = BinType.green if gp <= bp else BinType.black
+
+            if companion is None:
+                # Fall back to whole page signal
+                green_any = any(t in lowered for t in ["garden", "green bin", "garden waste"])
+                black_any = any(t in lowered for t in ["rubbish", "refuse", "black bin"])
                 if green_any and not black_any:
-                    chosen = BinType.green
+                    companion = BinType.green
                 elif black_any and not green_any:
-                    chosen = BinType.black
+                    companion = BinType.black
                 else:
-                    chosen = BinType.black
+                    companion = BinType.black
 
-            bins.append(chosen)
+            bins = [BinType.blue, companion]
+        except Exception:
+            # If any issue, still enforce a safe two-bin structure
+            bins = [BinType.blue, (BinType.black if BinType.black in bins else BinType.green)]
+
+        return ScraperResult(postcode=normalized, next_collection_date=dt, bins=bins)
+
+
+
+class NoAddresses(RuntimeError):
+    """RBWM answered, but lists no addresses for the postcode."""
 
-            # Post-process to enforce RBWM rule: always blue + exactly one of (green|black)
-            try:
-                # Build regexes to locate the chosen date within the text to get context
-                wd = dt.strftime("%A")
-                day_num = dt.day
-                month_name = dt.strftime("%B")
-                year_num = dt.year
-                import re as _re
-                patterns = [
-                    _re.compile(fr"{wd}\\s+0?{day_num}\\s+{month_name}\\s+{year_num}", _re.I),
-                    _re.compile(fr"0?{day_num}/0?{dt.month}/{year_num}"),
-                ]
-                idx = None
-                for pat in patterns:
-                    m = pat.search(text)
-                    if m:
-                        idx = m.start()
-                        break
-
-                # Choose the companion bin using context near the date if available
-                companion = None
-                lowered = text.lower()
-                if idx is not None:
-                    radius = 300
-                    s = max(0, idx - radius)
-                    e = min(len(lowered), idx + radius)
-                    win = lowered[s:e]
-                    green_hits = any(t in win for t in ["garden", "green bin", "garden waste"])
-                    black_hits = any(t in win for t in ["rubbish", "refuse", "black bin"])
-                    if green_hits and not black_hits:
-                        companion = BinType.green
-                    elif black_hits and not green_hits:
-                        companion = BinType.black
-                    elif green_hits and black_hits:
-                        # Pick whichever term appears first in the window
-                        def first_pos(txt, terms):
-                            ps = [txt.find(t) for t in terms]
-                            ps = [p for p in ps if p != -1]
-                            return min(ps) if ps else None
-                        gp = first_pos(win, ["garden", "green bin", "garden waste"]) or 10**9
-                        bp = first_pos(win, ["rubbish", "refuse", "black bin"]) or 10**9
-                        companion = BinType.green if gp <= bp else BinType.black
-
-                if companion is None:
-                    # Fall back to whole page signal
-                    green_any = any(t in lowered for t in ["garden", "green bin", "garden waste"])
-                    black_any = any(t in lowered for t in ["rubbish", "refuse", "black bin"])
-                    if green_any and not black_any:
-                        companion = BinType.green
-                    elif black_any and not green_any:
-                        companion = BinType.black
-                    else:
-                        companion = BinType.black
-
-                bins = [BinType.blue, companion]
-            except Exception:
-                # If any issue, still enforce a safe two-bin structure
-                bins = [BinType.blue, (BinType.black if BinType.black in bins else BinType.green)]
 
-            return ScraperResult(postcode=normalized, next_collection_date=dt, bins=bins)
+class NoCollections(RuntimeError):
+    """RBWM answered, but the page has no collection table to read."""
 
-        finally:
-            await ctx.close()
-            await browser.close()
+
+class VerificationInconclusive(RuntimeError):
+    """No sampled address produced a schedule, so routes could not be compared."""
+
+
+class RBWMAddress(BaseModel):
+    uprn: str
+    address: str
+
+
+async def _addresses_from_page(page: Any) -> List[RBWMAddress]:
+    """Address rows from a loaded search page: one ``page.content()`` round trip."""
+    return parse_addresses_html(await page.content())
+
+
+async def _schedule_from_page(page: Any) -> parse.ScheduleTable:
+    """Wait for the schedule widget, then read the whole page in one round trip."""
+    await page.locator(".widget-bin-collections").first.wait_for(timeout=60000)
+    return parse.parse_schedule(await page.content())
 
 
 async def fetch_rbwm_schedule_autoselect(postcode: str) -> ScraperResult:
@@ -188,7 +240,6 @@ async def fetch_rbwm_schedule_autoselect(postcode: str) -> ScraperResult:
     Auto-select the first address for a postcode on the RBWM forms site and
     parse the schedule for that address. Intended for postcode-keyed caching.
     """
-    from playwright.async_api import async_playwright
     import logging as _logging
 
     log = _logging.getLogger("bindicator.scraper")
@@ -199,362 +250,216 @@ async def fetch_rbwm_schedule_autoselect(postcode: str) -> ScraperResult:
     else:
         pretty = normalized[:-3] + " " + normalized[-3:] if len(normalized) > 3 else normalized
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        ctx = await browser.new_context()
-        page = await ctx.new_page()
-        try:
-            url = f"https://forms.rbwm.gov.uk/bincollections?postcode={pretty.replace(' ', '+')}&submit=Search+for+address"
-            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-
-            links = page.get_by_role("link", name="Select this address")
-            count = await links.count()
-            if count == 0:
-                links = page.locator("a:has-text('Select this address')")
-                count = await links.count()
-            if count == 0:
-                log.warning("[scraper] No addresses found for postcode %s", pretty)
-                raise RuntimeError("No addresses found for postcode")
-
-            first = links.nth(0)
-            try:
-                row = first.locator("xpath=ancestor::tr[1]")
-                addr = (await row.locator("td").first.inner_text()).strip()
-            except Exception:
-                addr = "(unknown address)"
-            log.info("[scraper] Auto-selecting first address for postcode %s: '%s'", pretty, addr)
+    async with browser_page() as page:
+        await page.goto(_addresses_url(pretty), wait_until="domcontentloaded", timeout=60000)
 
-            href = await first.get_attribute("href")
-            if href:
-                if href.startswith("http"):
-                    await page.goto(href, wait_until="domcontentloaded", timeout=60000)
-                else:
-                    await page.goto("https://forms.rbwm.gov.uk" + href, wait_until="domcontentloaded", timeout=60000)
-            else:
-                await first.click()
-                await page.wait_for_load_state("domcontentloaded")
-
-            container = page.locator(".widget-bin-collections").first
-            await container.wait_for(timeout=60000)
-
-            rows = container.locator("table tbody tr")
-            rc = await rows.count()
-            services_by_date: Dict[date, List[str]] = {}
-
-            def _strip_ordinal(d: str) -> str:
-                import re as _re
-                return _re.sub(r"\b(\d{1,2})(st|nd|rd|th)\b", r"\1", d)
-
-            from datetime import datetime as _dt
-            for i in range(rc):
-                r = rows.nth(i)
-                cols = r.locator("td")
-                if await cols.count() < 2:
-                    continue
-                service = (await cols.nth(0).inner_text()).strip()
-                date_text = _strip_ordinal((await cols.nth(1).inner_text()).strip())
-                try:
-                    d = _dt.strptime(date_text, "%d %B %Y").date()
-                except Exception:
-                    continue
-                services_by_date.setdefault(d, []).append(service)
-
-            if not services_by_date:
-                txt = await container.inner_text()
-                if "no collections found" in txt.lower():
-                    return ScraperResult(postcode=pretty, next_collection_date=None, bins=[])
-                raise RuntimeError("No service dates found after selecting address")
-
-            today = date.today()
-            future_dates = sorted([d for d in services_by_date.keys() if d >= today])
-            target = future_dates[0] if future_dates else sorted(services_by_date.keys())[0]
-            services = services_by_date[target]
-            has_refuse = any("refuse" in s.lower() for s in services)
-            has_garden = any("garden" in s.lower() for s in services)
-            bins = [BinType.blue, (BinType.black if has_refuse else (BinType.green if has_garden else BinType.black))]
-
-            return ScraperResult(postcode=pretty, next_collection_date=target, bins=bins)
-        finally:
-            await ctx.close()
-            await browser.close()
-class RBWMAddress(BaseModel):
-    uprn: str
-    address: str
+        addrs = await _addresses_from_page(page)
+        if not addrs:
+            log.warning("[scraper] No addresses found for postcode %s", pretty)
+            raise NoAddresses("No addresses found for postcode")
+
+        first = addrs[0]
+        log.info("[scraper] Auto-selecting first address for postcode %s: '%s'", pretty, first.address)
+        await page.goto(_schedule_url(first.uprn), wait_until="domcontentloaded", timeout=60000)
+
+        table = await _schedule_from_page(page)
+    return _result_from_table(table, postcode=pretty, empty_error="No service dates found after selecting address")
 
 
 async def fetch_rbwm_addresses(postcode: str) -> List[RBWMAddress]:
-    from playwright.async_api import async_playwright
-    normalized = postcode.strip().upper()
-    url = f"https://forms.rbwm.gov.uk/bincollections?postcode={normalized.replace(' ', '+')}&submit=Search+for+address"
+    async with browser_page() as page:
+        await page.goto(_addresses_url(postcode), wait_until="domcontentloaded", timeout=60000)
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        ctx = await browser.new_context()
-        page = await ctx.new_page()
+        # Wait briefly for content to render
         try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            await page.get_by_text("Bin collections", exact=False).first.wait_for(timeout=5000)
+        except Exception:
+            pass
 
-            # Wait briefly for content to render
-            try:
-                await page.get_by_text("Bin collections", exact=False).first.wait_for(timeout=5000)
-            except Exception:
-                pass
-
-            # Find all "Select this address" links using multiple strategies
-            links = page.locator("a", has_text="Select this address")
-            count = await links.count()
-            if count == 0:
-                links = page.get_by_role("link", name="Select this address")
-                count = await links.count()
-            if count == 0:
-                links = page.locator("a:has-text('Select this address')")
-                count = await links.count()
-            results: List[RBWMAddress] = []
-            for i in range(count):
-                a = links.nth(i)
-                href = await a.get_attribute("href")
-                if not href:
-                    continue
-                # Extract uprn from query (format: ?uprn=123456)
-                import urllib.parse as _up
-                parsed = _up.urlparse(href)
-                qs = _up.parse_qs(parsed.query)
-                uprn = qs.get("uprn", [None])[0]
-                if not uprn:
-                    # Sometimes href might be absolute without query; try splitting
-                    if "uprn=" in href:
-                        uprn = href.split("uprn=")[-1].split("&")[0]
-                if not uprn:
-                    continue
-
-                # Try to capture the address from the same table row's first cell
-                addr_text = ""
-                try:
-                    row = a.locator("xpath=ancestor::tr[1]")
-                    if await row.count():
-                        first_td = row.locator("td").first
-                        if await first_td.count():
-                            addr_text = (await first_td.inner_text()).strip()
-                except Exception:
-                    addr_text = ""
-                # Fallbacks: parent container text without the link label
-                if not addr_text:
-                    addr_text = await a.evaluate(
-                        "el => (el.parentElement && el.parentElement.innerText) || ''"
-                    )
-                    if addr_text:
-                        addr_text = addr_text.replace("Select this address", "").strip()
-                results.append(RBWMAddress(uprn=uprn, address=addr_text or uprn))
-
-            return results
-        finally:
-            await ctx.close()
-            await browser.close()
+        return await _addresses_from_page(page)
 
 
 async def fetch_rbwm_schedule_by_uprn(uprn: str) -> ScraperResult:
-    from playwright.async_api import async_playwright
+    async with browser_page() as page:
+        await page.goto(_schedule_url(uprn), wait_until="domcontentloaded", timeout=60000)
+        table = await _schedule_from_page(page)
+    return _result_from_table(
+        table, postcode=table.postcode if table.services_by_date else "", empty_error="No service dates found on UPRN page"
+    )
+
 
-    url = f"https://forms.rbwm.gov.uk/bincollections?uprn={uprn}"
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        ctx = await browser.new_context()
-        page = await ctx.new_page()
+# --- HTTP-based fallbacks (no browser) ---
+
+def _get(url: str, client: Optional["httpx.Client"] = None) -> "httpx.Response":
+    """GET through the shared pooled client (or an explicit one), paced by the governor."""
+    with governor.slot_sync():
         try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-
-            # Find the bin collections widget
-            container = page.locator(".widget-bin-collections")
-            await container.first.wait_for(timeout=60000)
-
-            # Extract table rows: Service | Date
-            rows = container.locator("table tbody tr")
-            rc = await rows.count()
-            services_by_date: Dict[date, List[str]] = {}
-
-            # Helper: strip ordinal suffixes
-            def _strip_ordinal(d: str) -> str:
-                import re as _re
-                return _re.sub(r"\b(\d{1,2})(st|nd|rd|th)\b", r"\1", d)
-
-            from datetime import datetime as _dt
-
-            for i in range(rc):
-                r = rows.nth(i)
-                cols = r.locator("td")
-                if await cols.count() < 2:
-                    continue
-                service = (await cols.nth(0).inner_text()).strip()
-                date_text = (await cols.nth(1).inner_text()).strip()
-                date_text = _strip_ordinal(date_text)
-                try:
-                    d = _dt.strptime(date_text, "%d %B %Y").date()
-                except Exception:
-                    continue
-                services_by_date.setdefault(d, []).append(service)
-
-            if not services_by_date:
-                # Check for explicit 'no collections found'
-                txt = await container.first.inner_text()
-                if "no collections found" in txt.lower():
-                    return ScraperResult(postcode="", next_collection_date=None, bins=[])
-                raise RuntimeError("No service dates found on UPRN page")
-
-            today = date.today()
-            future_dates = sorted([d for d in services_by_date.keys() if d >= today])
-            target = future_dates[0] if future_dates else sorted(services_by_date.keys())[0]
-            services = services_by_date[target]
-
-            # Map services to bins: always blue + (black if Refuse present else green if Garden present)
-            has_refuse = any("refuse" in s.lower() for s in services)
-            has_garden = any("garden" in s.lower() for s in services)
-            bins = [BinType.blue, (BinType.black if has_refuse else (BinType.green if has_garden else BinType.black))]
-
-            # Extract postcode from the Address line near the widget header if present
-            full_text = await container.first.inner_text()
-            import re as _re
-            pc_match = _re.search(r"\b([A-Z]{1,2}\d{1,2}[A-Z]?)\s*(\d[ABD-HJLN-UW-Z]{2})\b", full_text.replace("\n", " "))
-            postcode = (pc_match.group(0) if pc_match else "").upper()
-            return ScraperResult(postcode=postcode, next_collection_date=target, bins=bins)
-        finally:
-            await ctx.close()
-            await browser.close()
+            resp = (client or get_client()).get(url)
+            resp.raise_for_status()
+        except Exception:
+            record_error()
+            raise
+    return resp
 
 
-# --- HTTP-based fallbacks (no browser) ---
+async def _aget(url: str, client: Optional["httpx.AsyncClient"] = None) -> "httpx.Response":
+    """Async GET through the shared pooled client (or an explicit one), paced by the governor."""
+    async with governor.slot():
+        try:
+            resp = await (client or get_async_client()).get(url)
+            resp.raise_for_status()
+        except Exception:
+            record_error()
+            raise
+    return resp
 
-def fetch_rbwm_addresses_http(postcode: str) -> List[RBWMAddress]:
-    import httpx
-    from bs4 import BeautifulSoup
 
+def _addresses_url(postcode: str) -> str:
     pretty = postcode.strip().upper()
     if " " not in pretty and len(pretty) > 3:
         pretty = pretty[:-3] + " " + pretty[-3:]
-    url = f"https://forms.rbwm.gov.uk/bincollections?postcode={pretty.replace(' ', '+')}&submit=Search+for+address"
-    headers = {"User-Agent": "Bindicator/0.1 (+https://github.com/)"}
-    with httpx.Client(follow_redirects=True, timeout=20.0, headers=headers) as client:
-        resp = client.get(url)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        results: List[RBWMAddress] = []
-        # Preferred: parse the address table rows
-        table_rows = soup.select("table tbody tr")
-        for row in table_rows:
-            cells = row.find_all("td")
-            if not cells:
-                continue
-            address_text = cells[0].get_text(" ", strip=True)
-            link = row.select_one('a[href*="uprn="]')
-            href = link.get("href") if link else ""
-            if not href or "uprn=" not in href:
-                continue
-            uprn = href.split("uprn=")[-1].split("&")[0]
-            results.append(RBWMAddress(uprn=uprn, address=address_text or uprn))
-
-        # Fallback: scan all anchors if table parsing found nothing
-        if not results:
-            for a in soup.find_all("a"):
-                href = a.get("href") or ""
-                if "uprn=" not in href:
-                    continue
-                uprn = href.split("uprn=")[-1].split("&")[0]
-                tr = a.find_parent("tr")
-                address_text = ""
-                if tr:
-                    tds = tr.find_all("td")
-                    if tds:
-                        address_text = tds[0].get_text(" ", strip=True)
-                if not address_text:
-                    address_text = (a.get_text(" ", strip=True) or "").replace("Select this address", "").strip()
-                results.append(RBWMAddress(uprn=uprn, address=address_text or uprn))
-        return results
-
-
-def fetch_rbwm_schedule_by_uprn_http(uprn: str) -> ScraperResult:
-    import httpx
-    from bs4 import BeautifulSoup
-    from datetime import datetime as _dt
-    import re as _re
-
-    url = f"https://forms.rbwm.gov.uk/bincollections?uprn={uprn}"
-    headers = {"User-Agent": "Bindicator/0.1 (+https://github.com/)"}
-    with httpx.Client(follow_redirects=True, timeout=20.0, headers=headers) as client:
-        resp = client.get(url)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        widget = soup.select_one(".widget-bin-collections")
-        if not widget:
-            raise RuntimeError("RBWM schedule widget not found")
-
-        # Parse the table rows
-        services_by_date: Dict[date, List[str]] = {}
-        for row in widget.select("table tbody tr"):
-            tds = row.find_all("td")
-            if len(tds) < 2:
-                continue
-            service = tds[0].get_text(strip=True)
-            date_text = tds[1].get_text(strip=True)
-            date_text = _re.sub(r"\b(\d{1,2})(st|nd|rd|th)\b", r"\1", date_text)
-            try:
-                d = _dt.strptime(date_text, "%d %B %Y").date()
-            except Exception:
-                continue
-            services_by_date.setdefault(d, []).append(service)
-
-        if not services_by_date:
-            txt = widget.get_text(" ", strip=True).lower()
-            if "no collections found" in txt:
-                return ScraperResult(postcode="", next_collection_date=None, bins=[])
-            raise RuntimeError("No service dates found in RBWM table")
-
-        today = date.today()
-        future_dates = sorted([d for d in services_by_date.keys() if d >= today])
-        target = future_dates[0] if future_dates else sorted(services_by_date.keys())[0]
-        services = services_by_date[target]
-
-        has_refuse = any("refuse" in s.lower() for s in services)
-        has_garden = any("garden" in s.lower() for s in services)
-        bins = [BinType.blue, (BinType.black if has_refuse else (BinType.green if has_garden else BinType.black))]
-        # Extract postcode from Address text around widget
-        text = widget.get_text(" ", strip=True)
-        import re as _re
-        m = _re.search(r"\b([A-Z]{1,2}\d{1,2}[A-Z]?)\s*(\d[ABD-HJLN-UW-Z]{2})\b", text)
-        postcode = (m.group(0) if m else "").upper()
-        return ScraperResult(postcode=postcode, next_collection_date=target, bins=bins)
-
-
-async def verify_postcode_consistency(postcode: str, limit: int = 5) -> Dict[str, Any]:
-    """Check multiple addresses under a postcode and compare bin patterns.
-    Returns a structured dict with consistency info.
-    Polite behaviour: random small waits between checks.
+    return f"{RBWM_BASE_URL}/bincollections?postcode={pretty.replace(' ', '+')}&submit=Search+for+address"
+
+
+def _schedule_url(uprn: str) -> str:
+    return f"{RBWM_BASE_URL}/bincollections?uprn={uprn}"
+
+
+def parse_addresses_html(html: str) -> List[RBWMAddress]:
+    """Address rows (uprn + text) from an RBWM postcode search page."""
+    return [RBWMAddress(uprn=uprn, address=address) for uprn, address in parse.parse_addresses(html)]
+
+
+def _result_from_table(table: parse.ScheduleTable, *, postcode: str, empty_error: str) -> ScraperResult:
+    if not table.services_by_date:
+        if table.no_collections:
+            return ScraperResult(postcode=postcode, next_collection_date=None, bins=[])
+        raise NoCollections(empty_error)
+    target, bins, schedule = _schedule_from(table.services_by_date)
+    return ScraperResult(postcode=postcode, next_collection_date=target, bins=bins, schedule=schedule)
+
+
+def parse_schedule_html(html: str) -> ScraperResult:
+    """Schedule for one address from an RBWM ``?uprn=`` page."""
+    table = parse.parse_schedule(html)
+    return _result_from_table(
+        table, postcode=table.postcode if table.services_by_date else "", empty_error="No service dates found in RBWM table"
+    )
+
+
+def fetch_rbwm_addresses_http(postcode: str, client: Optional["httpx.Client"] = None) -> List[RBWMAddress]:
+    return parse_addresses_html(_get(_addresses_url(postcode), client).text)
+
+
+def fetch_rbwm_schedule_by_uprn_http(uprn: str, client: Optional["httpx.Client"] = None) -> ScraperResult:
+    return parse_schedule_html(_get(_schedule_url(uprn), client).text)
+
+
+async def fetch_rbwm_addresses_http_async(
+    postcode: str, client: Optional["httpx.AsyncClient"] = None
+) -> List[RBWMAddress]:
+    resp = await _aget(_addresses_url(postcode), client)
+    return parse_addresses_html(resp.text)
+
+
+async def fetch_rbwm_schedule_by_uprn_http_async(
+    uprn: str, client: Optional["httpx.AsyncClient"] = None
+) -> ScraperResult:
+    resp = await _aget(_schedule_url(uprn), client)
+    return parse_schedule_html(resp.text)
+
+
+# Address sampling for verification: "first" N, "spread" (N evenly spaced) or "all"
+_VERIFY_SAMPLING = os.getenv("BINDICATOR_VERIFY_SAMPLING", "spread").lower()
+_VERIFY_LIMIT = int(os.getenv("BINDICATOR_VERIFY_LIMIT", "5"))
+# Schedules fetched at once per verification; the governor's rate budget still applies
+_VERIFY_CONCURRENCY = max(1, int(os.getenv("BINDICATOR_VERIFY_CONCURRENCY", "3")))
+
+
+def sample_addresses(addrs: List[RBWMAddress], limit: int, strategy: str) -> List[RBWMAddress]:
+    """Pick which addresses to check: the first ``limit``, ``limit`` spread evenly from
+    first to last (catches a route change part-way along a street), or all of them."""
+    limit = max(1, limit)
+    if strategy == "all" or limit >= len(addrs):
+        return list(addrs)
+    if strategy == "first" or limit == 1:
+        return addrs[:limit]
+    step = (len(addrs) - 1) / (limit - 1)
+    return [addrs[round(i * step)] for i in range(limit)]
+
+
+async def iter_verification(
+    postcode: str,
+    limit: Optional[int] = None,
+    *,
+    addresses: Optional[List[RBWMAddress]] = None,
+    sampling: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Check a sample of addresses under a postcode over HTTP, yielding each one's result
+    as soon as it is fetched: ``{"uprn", "address", "bins"}``, or ``"error"`` instead of
+    bins. Stops as soon as two different bin patterns have been seen. ``CircuitOpen``
+    is not recorded per address: it ends the run.
+
+    ``addresses`` skips the address lookup (e.g. from the address index). Schedules are
+    fetched ``BINDICATOR_VERIFY_CONCURRENCY`` at a time, paced by the upstream governor.
     """
-    import random
     import asyncio
     import logging as _logging
 
     log = _logging.getLogger("bindicator.scraper")
     normalized = postcode.strip().upper()
 
-    # Use Playwright list to get UPRNs
-    addrs = await fetch_rbwm_addresses(normalized)
+    addrs = addresses if addresses is not None else await fetch_rbwm_addresses_http_async(normalized)
     if not addrs:
         log.warning("[scraper] verification: no addresses for %s", normalized)
-        raise RuntimeError("No addresses found for postcode")
+        raise NoAddresses("No addresses found for postcode")
 
-    checked = 0
-    patterns: Dict[str, List[str]] = {}
-    for item in addrs[: max(1, min(limit, len(addrs)) )]:
-        try:
-            # Polite, small random delay
-            await asyncio.sleep(random.uniform(1.0, 2.5))
-            r = await fetch_rbwm_schedule_by_uprn(item.uprn)
-            bins = [b.value if isinstance(b, BinType) else str(b) for b in r.bins]
-            # Normalize order: blue is always included, keep other stable order
-            patterns[item.address] = bins
-            checked += 1
-        except Exception:
-            log.exception("[scraper] verification failed for %s (%s)", item.address, item.uprn)
+    strategy = (sampling or _VERIFY_SAMPLING).lower()
+    sample = sample_addresses(addrs, _VERIFY_LIMIT if limit is None else limit, strategy)
+    sem = asyncio.Semaphore(_VERIFY_CONCURRENCY)
+
+    async def check(item: RBWMAddress) -> Dict[str, Any]:
+        async with sem:
+            try:
+                r = await fetch_rbwm_schedule_by_uprn_http_async(item.uprn)
+            except governor.CircuitOpen:
+                raise
+            except Exception:
+                log.exception("[scraper] verification failed for %s (%s)", item.address, item.uprn)
+                return {"uprn": item.uprn, "address": item.address, "error": "schedule lookup failed"}
+        bins = [b.value if isinstance(b, BinType) else str(b) for b in r.bins]
+        return {"uprn": item.uprn, "address": item.address, "bins": bins}
+
+    tasks = [asyncio.ensure_future(check(item)) for item in sample]
+    seen = set()
+    try:
+        for done in asyncio.as_completed(tasks):
+            result = await done
+            yield result
+            if "bins" in result:
+                seen.add(tuple(result["bins"]))
+                if len(seen) > 1:
+                    log.info("[scraper] verification: %s has two patterns; skipping remaining addresses", normalized)
+                    break
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def summarize_verification(postcode: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Consistency verdict over per-address results from ``iter_verification``.
+
+    Raises ``VerificationInconclusive`` when no address produced bins (e.g. every
+    schedule fetch failed), rather than reporting that as a single route.
+    """
+    import logging as _logging
+
+    log = _logging.getLogger("bindicator.scraper")
+    normalized = postcode.strip().upper()
+    patterns: Dict[str, List[str]] = {r["address"]: r["bins"] for r in results if "bins" in r}
+    if not patterns:
+        log.warning("[scraper] verification: no schedules for %s (%s failed)", normalized, len(results))
+        raise VerificationInconclusive(f"No schedules fetched for {normalized}")
 
     unique_sets = {tuple(p) for p in patterns.values()}
     consistent = len(unique_sets) <= 1
@@ -567,7 +472,17 @@ async def verify_postcode_consistency(postcode: str, limit: int = 5) -> Dict[str
 
     return {
         "postcode": normalized,
-        "addresses_checked": checked,
+        "addresses_checked": len(patterns),
         "consistent": consistent,
         "differences": differences,
     }
+
+
+async def verify_postcode_consistency(
+    postcode: str, limit: Optional[int] = None, *, addresses: Optional[List[RBWMAddress]] = None
+) -> Dict[str, Any]:
+    """Check multiple addresses under a postcode and compare bin patterns.
+    Returns a structured dict with consistency info.
+    """
+    results = [r async for r in iter_verification(postcode, limit, addresses=addresses)]
+    return summarize_verification(postcode, results)
@@ -0,0 +1,155 @@
+"""Request interception for Playwright scraper pages.
+
+The scrapers only need RBWM's HTML, so every page opened through the browser
+pool routes its requests through here: resource types in
+``RBWM_BROWSER_BLOCK_TYPES`` (images, stylesheets, fonts, media by default) and
+requests to hosts outside ``RBWM_BROWSER_ALLOWED_HOSTS`` (analytics, CDNs) are
+aborted before they are sent. Top-level documents are always let through.
+
+Blocked responses are never downloaded, so their size is unknown; bytes saved
+are an estimate from typical sizes per resource type. Loaded bytes come from
+``Content-Length`` and are a lower bound.
+"""
+import logging
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+log = logging.getLogger("bindicator.browser")
+
+# Rough transfer sizes of what RBWM-style pages pull in, per blocked request
+_ESTIMATED_BYTES = {
+    "image": 30_000,
+    "media": 200_000,
+    "font": 40_000,
+    "stylesheet": 20_000,
+    "script": 40_000,
+}
+_DEFAULT_ESTIMATE = 10_000
+
+
+def _env_set(name: str, default: str) -> Tuple[str, ...]:
+    return tuple(v.strip().lower() for v in os.getenv(name, default).split(",") if v.strip())
+
+
+def enabled() -> bool:
+    return os.getenv("RBWM_BROWSER_BLOCKING", "true").lower() in {"1", "true", "yes", "on"}
+
+
+BLOCK_TYPES = _env_set("RBWM_BROWSER_BLOCK_TYPES", "image,media,font,stylesheet")
+# Hosts (and their subdomains) a page may load from; "*" allows any host
+ALLOWED_HOSTS = _env_set("RBWM_BROWSER_ALLOWED_HOSTS", "rbwm.gov.uk")
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Any] = {
+    "pages": 0,
+    "allowed": 0,
+    "blocked": 0,
+    "blockedBytesEstimate": 0,
+    "loadedBytes": 0,
+    "blockedByType": {},
+    "blockedThirdParty": 0,
+}
+
+
+def _first_party(host: str) -> bool:
+    if "*" in ALLOWED_HOSTS:
+        return True
+    host = host.lower()
+    return any(host == h or host.endswith("." + h) for h in ALLOWED_HOSTS)
+
+
+def block_reason(resource_type: str, url: str) -> Optional[str]:
+    """'type', 'third-party' or None (let it through)."""
+    if resource_type == "document":
+        return None
+    if resource_type in BLOCK_TYPES:
+        return "type"
+    if not _first_party(urlsplit(url).hostname or ""):
+        return "third-party"
+    return None
+
+
+class PageLoad:
+    """Requests allowed/blocked and bytes loaded/saved for one scraper page."""
+
+    def __init__(self) -> None:
+        self.allowed = 0
+        self.blocked = 0
+        self.third_party = 0
+        self.blocked_bytes = 0
+        self.loaded_bytes = 0
+        self.by_type: Dict[str, int] = {}
+
+    def on_response(self, response: Any) -> None:
+        try:
+            self.loaded_bytes += int(response.headers.get("content-length", 0))
+        except (TypeError, ValueError):
+            pass
+
+    async def handle(self, route: Any) -> None:
+        request = route.request
+        reason = block_reason(request.resource_type, request.url)
+        try:
+            if reason is None:
+                self.allowed += 1
+                await route.continue_()
+                return
+            self.blocked += 1
+            self.third_party += reason == "third-party"
+            self.by_type[request.resource_type] = self.by_type.get(request.resource_type, 0) + 1
+            self.blocked_bytes += _ESTIMATED_BYTES.get(request.resource_type, _DEFAULT_ESTIMATE)
+            await route.abort("blockedbyclient")
+        except Exception:
+            # The page closed while the request was in flight
+            pass
+
+
+def _record(load: PageLoad) -> None:
+    with _stats_lock:
+        _stats["pages"] += 1
+        _stats["allowed"] += load.allowed
+        _stats["blocked"] += load.blocked
+        _stats["blockedThirdParty"] += load.third_party
+        _stats["blockedBytesEstimate"] += load.blocked_bytes
+        _stats["loadedBytes"] += load.loaded_bytes
+        by_type = _stats["blockedByType"]
+        for kind, n in load.by_type.items():
+            by_type[kind] = by_type.get(kind, 0) + n
+
+
+@asynccontextmanager
+async def filtered(page: Any) -> AsyncIterator[Optional[PageLoad]]:
+    """Route ``page``'s requests through the block list for the duration of one scrape."""
+    if not enabled():
+        yield None
+        return
+    load = PageLoad()
+    await page.route("**/*", load.handle)
+    page.on("response", load.on_response)
+    try:
+        yield load
+    finally:
+        _record(load)
+        log.info(
+            "[browser] Page load: %s requests, %s KiB; blocked %s (%s third-party), ~%s KiB saved",
+            load.allowed,
+            load.loaded_bytes // 1024,
+            load.blocked,
+            load.third_party,
+            load.blocked_bytes // 1024,
+        )
+
+
+def stats() -> Dict[str, Any]:
+    with _stats_lock:
+        out: Dict[str, Any] = {**_stats, "blockedByType": dict(_stats["blockedByType"])}
+    pages = out["pages"]
+    out["enabled"] = enabled()
+    out["blockTypes"] = list(BLOCK_TYPES)
+    out["allowedHosts"] = list(ALLOWED_HOSTS)
+    out["blockedPerPage"] = round(out["blocked"] / pages, 1) if pages else 0.0
+    out["savedBytesPerPage"] = out["blockedBytesEstimate"] // pages if pages else 0
+    return out
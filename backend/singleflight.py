@@ -0,0 +1,64 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+log = logging.getLogger("bindicator.singleflight")
+
+T = TypeVar("T")
+
+
+def _consume(task: "asyncio.Task[Any]") -> None:
+    # Mark the outcome as retrieved even if every waiter has gone away
+    if not task.cancelled():
+        task.exception()
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution.
+
+    The first caller for a key starts ``fn()`` as a task; callers arriving while it
+    runs await the same task and receive its result (or its exception). The task is
+    shielded, so a caller that goes away does not cancel the fetch for the others.
+    Calls are only shared between callers on the same event loop.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Tuple[asyncio.AbstractEventLoop, "asyncio.Task[Any]"]] = {}
+        self._stats: Dict[str, int] = {"executions": 0, "coalesced": 0, "failures": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            running = self._calls.get(key)
+            if running is not None and running[0] is loop:
+                self._stats["coalesced"] += 1
+                task = running[1]
+                shared = True
+            else:
+                task = loop.create_task(self._run(key, fn))
+                task.add_done_callback(_consume)
+                self._calls[key] = (loop, task)
+                self._stats["executions"] += 1
+                shared = False
+        if shared:
+            log.debug("[%s] Joined in-flight lookup for %s", self.name, key)
+        return await asyncio.shield(task)
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        try:
+            return await fn()
+        except BaseException:
+            with self._lock:
+                self._stats["failures"] += 1
+            raise
+        finally:
+            with self._lock:
+                if key in self._calls and self._calls[key][1] is asyncio.current_task():
+                    del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "inFlight": len(self._calls)}
@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure repository root on sys.path so 'backend' package imports cleanly
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the disk cache and its side stores (access scores, negative cache) at an
+    empty temporary directory."""
+    from backend import cache as disk_cache
+
+    def close_all():
+        disk_cache.close_access()
+        disk_cache.close_negative()
+        disk_cache.close_cache()
+
+    close_all()
+    monkeypatch.setenv("BINDICATOR_CACHE_BACKEND", "json")
+    monkeypatch.setattr(disk_cache, "_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(disk_cache, "_CACHE_FILE", str(tmp_path / "cache.json"))
+    yield tmp_path
+    close_all()
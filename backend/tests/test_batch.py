@@ -0,0 +1,65 @@
+import asyncio
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from backend import main as m
+
+# Later postcodes answer sooner, so completion order is the reverse of request order
+DELAYS = {"SL6 1AA": 0.3, "SL6 2AA": 0.15, "SL6 3AA": 0.0}
+
+
+@pytest.fixture
+def client(cache_dir, monkeypatch):
+    monkeypatch.setenv("BINDICATOR_DATASOURCE", "mock")
+    calls = []
+
+    async def refresh(postcode, uprn, datasource):
+        calls.append(postcode)
+        if postcode == "SL6 9ZZ":
+            raise HTTPException(status_code=502, detail="RBWM upstream fetch failed for postcode")
+        await asyncio.sleep(DELAYS.get(postcode, 0.0))
+        return m.BinResponse(
+            postcode=postcode,
+            nextCollectionDate=date(2099, 11, 3),
+            nextCollectionDay="Tuesday",
+            bins=["blue", "black"],
+            source="mock",
+            fetchedAt=datetime.now(timezone.utc),
+        )
+
+    monkeypatch.setattr(m, "_refresh_bins", refresh)
+    test_client = TestClient(m.app)
+    test_client.calls = calls
+    return test_client
+
+
+def test_items_in_request_order(client):
+    postcodes = ["SL6 1AA", "not a postcode", "SL6 2AA", "SL6 9ZZ", "SL6 3AA"]
+    r = client.post("/api/bins/batch", json={"postcodes": postcodes})
+    assert r.status_code == 200
+    body = r.json()
+    assert [it["postcode"] for it in body["items"]] == postcodes
+    assert [it["status"] for it in body["items"]] == ["ok", "error", "ok", "error", "ok"]
+    assert body["items"][1]["error"]["status"] == 400
+    assert body["items"][3]["error"]["status"] == 502
+    assert (body["summary"]["total"], body["summary"]["failed"]) == (5, 2)
+
+
+def test_duplicates_share_one_fetch(client):
+    r = client.post("/api/bins/batch", json={"postcodes": ["SL6 1AA", "sl61aa", "SL6 2AA"]})
+    assert [it["status"] for it in r.json()["items"]] == ["ok", "ok", "ok"]
+    assert sorted(client.calls) == ["SL6 1AA", "SL6 2AA"]
+
+
+def test_stream_reports_request_index(client):
+    postcodes = ["SL6 1AA", "SL6 2AA", "SL6 3AA"]
+    r = client.post("/api/bins/batch/stream", json={"postcodes": postcodes})
+    records = [json.loads(line) for line in r.text.splitlines() if line.strip()]
+    items = [rec for rec in records if rec["type"] == "item"]
+    assert [rec["index"] for rec in items] == [2, 1, 0]
+    assert all(postcodes[rec["index"]] == rec["postcode"] for rec in items)
+    assert records[-1]["type"] == "summary"
@@ -0,0 +1,28 @@
+import json
+import os
+import time
+
+from backend.cache import JsonFileBackend
+
+
+def test_journal_size_counts_bytes(tmp_path):
+    store = JsonFileBackend(str(tmp_path / "cache.json"), compact_bytes=1 << 30)
+    store.load()
+    store.put("pc:SL6 6AH", {"address": "Ça Ira, Château Row, Maidenhead", "data": {}})
+    store.put("pc:SL4 1AA", {"address": "ŵ" * 100, "data": {}})
+    assert store.stats()["journalBytes"] == os.path.getsize(store.journal_path)
+    store.close()
+
+
+def test_compacts_on_byte_threshold(tmp_path):
+    # One record of ~255 characters but ~655 bytes
+    store = JsonFileBackend(str(tmp_path / "cache.json"), compact_bytes=400)
+    store.load()
+    store.put("pc:SL6 6AH", {"address": "€" * 200})
+    deadline = time.monotonic() + 5.0
+    while store.stats()["journalBytes"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert store.stats()["journalBytes"] == 0
+    store.close()
+    with open(store.path, encoding="utf-8") as f:
+        assert json.load(f) == {"pc:SL6 6AH": {"address": "€" * 200}}
@@ -0,0 +1,63 @@
+from datetime import date, datetime, timezone
+
+from backend import cache as disk_cache
+
+FETCHED = "2026-03-10T09:00:00+00:00"
+
+
+def entry(next_date="2026-03-12", schedule=None, fetched=FETCHED):
+    item = {"fetched_at": fetched, "data": {"nextCollectionDate": next_date, "bins": ["blue", "black"]}}
+    if schedule is not None:
+        item["schedule"] = [{"date": d, "bins": b} for d, b in schedule]
+    return item
+
+
+def at(text):
+    return datetime.fromisoformat(text).replace(tzinfo=timezone.utc)
+
+
+def test_same_day_expires_at_next_midnight():
+    assert disk_cache.entry_expires_at(entry(), "same_day") == at("2026-03-11T00:00:00")
+
+
+def test_collection_date_lasts_until_end_of_collection_day():
+    item = entry()
+    assert disk_cache.entry_expires_at(item, "collection_date") == at("2026-03-13T00:00:00")
+    assert disk_cache.is_entry_valid(item, "collection_date", now=at("2026-03-12T23:59:00"))
+    assert not disk_cache.is_entry_valid(item, "collection_date", now=at("2026-03-13T00:00:00"))
+
+
+def test_collection_date_uses_last_scheduled_date():
+    item = entry(schedule=[("2026-03-12", ["blue", "black"]), ("2026-03-19", ["blue", "green"])])
+    assert disk_cache.entry_expires_at(item, "collection_date") == at("2026-03-20T00:00:00")
+
+
+def test_margin_and_max_age(monkeypatch):
+    monkeypatch.setenv("BINDICATOR_CACHE_MARGIN_HOURS", "6")
+    assert disk_cache.entry_expires_at(entry(), "collection_date") == at("2026-03-12T18:00:00")
+    monkeypatch.setenv("BINDICATOR_CACHE_MAX_AGE_HOURS", "24")
+    assert disk_cache.entry_expires_at(entry(), "collection_date") == at("2026-03-11T09:00:00")
+
+
+def test_no_date_falls_back_to_same_day():
+    assert disk_cache.entry_expires_at(entry(next_date=None), "collection_date") == at("2026-03-11T00:00:00")
+
+
+def test_unusable_entries():
+    assert disk_cache.entry_expires_at(entry(fetched="yesterday")) is None
+    assert not disk_cache.is_entry_valid(None)
+    assert not disk_cache.is_entry_valid({})
+
+
+def test_current_data_moves_to_next_collection():
+    item = entry(schedule=[("2026-03-12", ["blue", "black"]), ("2026-03-19", ["blue", "green"])])
+    data = disk_cache.current_data(item, now=at("2026-03-13T08:00:00"))
+    assert (data["nextCollectionDate"], data["bins"]) == ("2026-03-19", ["blue", "green"])
+    assert data["nextCollectionDay"] == date(2026, 3, 19).strftime("%A")
+
+
+def test_active_policy(monkeypatch):
+    monkeypatch.setenv("BINDICATOR_CACHE_POLICY", "same_day")
+    assert disk_cache.active_policy() == "same_day"
+    monkeypatch.setenv("BINDICATOR_CACHE_POLICY", "forever")
+    assert disk_cache.active_policy() == "collection_date"
@@ -0,0 +1,40 @@
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from backend.cache_sqlite import SQLiteBackend
+
+
+def test_close_closes_every_thread_connection(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    store = SQLiteBackend(path)
+    store.load()
+
+    def write(i: int) -> None:
+        store.put(f"pc:SL6 {i}AA", {"fetched_at": "2026-01-01T00:00:00+00:00", "data": {}})
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    conns = list(store._conns)
+    assert len(conns) == 5
+
+    store.close()
+    for conn in conns:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    # All connections gone, so the WAL was checkpointed into the database
+    assert not os.path.exists(path + "-wal")
+
+
+def test_usable_after_close(tmp_path):
+    store = SQLiteBackend(str(tmp_path / "cache.sqlite3"))
+    store.load()
+    store.put("pc:SL6 6AH", {"data": {}})
+    store.close()
+    assert store.count() == 1
+    store.close()
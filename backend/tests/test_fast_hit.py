@@ -0,0 +1,95 @@
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import cache as disk_cache
+from backend import main as m
+
+POSTCODE = "SL6 6AH"
+
+
+@pytest.fixture
+def client(cache_dir, monkeypatch):
+    monkeypatch.setenv("BINDICATOR_DATASOURCE", "mock")
+    monkeypatch.setattr(m, "_hit_bytes", OrderedDict())
+    monkeypatch.setattr(m, "_HIT_BYTES_MAX", 100)
+    monkeypatch.setattr(m, "HIT_BYTES_STATS", {"served": 0, "rendered": 0})
+    return TestClient(m.app)
+
+
+def store(bins, *, fetched_at=None):
+    first = date.today() + timedelta(days=1)
+    schedule = [{"date": (first + timedelta(days=7 * w)).isoformat(), "bins": bins} for w in range(4)]
+    disk_cache.update_cache(
+        POSTCODE,
+        {
+            "postcode": POSTCODE,
+            "nextCollectionDate": first.isoformat(),
+            "nextCollectionDay": first.strftime("%A"),
+            "bins": bins,
+            "source": "mock",
+            "cached": False,
+            "fetchedAt": (fetched_at or datetime.now(timezone.utc)).isoformat(),
+            "noCollections": False,
+        },
+        schedule=schedule,
+    )
+
+
+def get(client):
+    r = client.get("/api/bins", params={"postcode": POSTCODE})
+    assert r.status_code == 200
+    return r
+
+
+def test_repeat_hit_served_from_rendered_bytes(client):
+    store(["blue", "black"])
+    first = get(client)
+    assert m.HIT_BYTES_STATS == {"served": 0, "rendered": 1}
+    second = get(client)
+    assert m.HIT_BYTES_STATS["served"] == 1
+    assert second.content == first.content
+    assert second.json()["cached"] is True
+
+
+def test_new_fetch_invalidates(client):
+    store(["blue", "black"])
+    get(client)
+    store(["blue", "green"], fetched_at=datetime.now(timezone.utc) + timedelta(seconds=1))
+    assert get(client).json()["bins"] == ["blue", "green"]
+    assert m.HIT_BYTES_STATS["served"] == 0
+
+
+def test_verification_invalidates(client):
+    store(["blue", "black"])
+    assert get(client).json()["mixed_routes"] is None
+    disk_cache.update_verification(POSTCODE, mixed_routes=True, details={"1 High St": ["blue", "black"]})
+    assert get(client).json()["mixed_routes"] is True
+    assert m.HIT_BYTES_STATS["served"] == 0
+
+
+def test_cleared_entry_is_not_served(client):
+    store(["blue", "black"])
+    get(client)
+    assert client.post("/api/cache/clear", params={"key": POSTCODE}).status_code == 200
+    assert m._fast_hit(disk_cache._pretty_postcode(POSTCODE)) is None
+    assert disk_cache._pretty_postcode(POSTCODE) not in m._hit_bytes
+
+
+def test_expired_window_renders_again(client):
+    store(["blue", "black"])
+    get(client)
+    key = disk_cache._pretty_postcode(POSTCODE)
+    signature, _until, verdicts, body = m._hit_bytes[key]
+    m._hit_bytes[key] = (signature, 0.0, verdicts, body)
+    get(client)
+    assert m.HIT_BYTES_STATS == {"served": 0, "rendered": 2}
+
+
+def test_refresh_skips_rendered_bytes(client):
+    store(["blue", "black"])
+    get(client)
+    client.get("/api/bins", params={"postcode": POSTCODE, "refresh": "true"})
+    assert m.HIT_BYTES_STATS["served"] == 0
@@ -0,0 +1,122 @@
+import time
+
+import httpx
+import pytest
+
+from backend.scraper.governor import CircuitOpen, Governor
+
+DOWN = httpx.ConnectError("connection refused")
+
+
+def make(**overrides) -> Governor:
+    settings = dict(
+        rate=1000.0,
+        burst=1000.0,
+        min_limit=1.0,
+        initial_limit=8.0,
+        max_limit=8.0,
+        failure_threshold=3,
+        cooldown=0.0,
+        max_wait=1.0,
+    )
+    settings.update(overrides)
+    return Governor(**settings)
+
+
+def acquire(gov: Governor) -> bool:
+    delay, probe = gov._try_acquire(time.monotonic())
+    assert delay == 0
+    return probe
+
+
+def trip(gov: Governor) -> None:
+    for _ in range(gov.failure_threshold):
+        assert acquire(gov) is False
+        gov._release(DOWN)
+    assert gov.stats()["circuit"] == "open"
+
+
+def test_opens_after_consecutive_failures():
+    gov = make()
+    for _ in range(2):
+        acquire(gov)
+        gov._release(DOWN)
+    assert gov.stats()["circuit"] == "closed"
+    acquire(gov)
+    gov._release(DOWN)
+    assert gov.stats()["circuit"] == "open"
+    assert gov.stats()["opened"] == 1
+
+
+def test_success_resets_failure_count():
+    gov = make()
+    for exc in (DOWN, DOWN, None, DOWN, DOWN):
+        acquire(gov)
+        gov._release(exc)
+    assert gov.stats()["circuit"] == "closed"
+
+
+def test_rejects_during_cooldown():
+    gov = make(cooldown=60.0)
+    trip(gov)
+    with pytest.raises(CircuitOpen):
+        gov._try_acquire(time.monotonic())
+    assert gov.stats()["rejected"] == 1
+
+
+def test_half_open_lets_one_probe_through():
+    gov = make()
+    trip(gov)
+    assert acquire(gov) is True
+    assert gov.stats()["circuit"] == "half_open"
+    with pytest.raises(CircuitOpen):
+        gov._try_acquire(time.monotonic())
+
+
+def test_probe_success_closes_and_failure_reopens():
+    gov = make()
+    trip(gov)
+    gov._release(None, probe=acquire(gov))
+    assert gov.stats()["circuit"] == "closed"
+
+    trip(gov)
+    gov._release(DOWN, probe=acquire(gov))
+    assert gov.stats()["circuit"] == "open"
+    assert gov.stats()["opened"] == 3
+
+
+def test_stale_call_does_not_decide_half_open_circuit():
+    gov = make()
+    # In flight before the circuit opened
+    stale = acquire(gov)
+    for _ in range(gov.failure_threshold):
+        acquire(gov)
+        gov._release(DOWN)
+    probe = acquire(gov)
+    assert (stale, probe) == (False, True)
+
+    gov._release(None, probe=stale)
+    assert gov.stats()["circuit"] == "half_open"
+    # The probe is still running, so nobody else gets through
+    with pytest.raises(CircuitOpen):
+        gov._try_acquire(time.monotonic())
+
+    gov._release(None, probe=probe)
+    assert gov.stats()["circuit"] == "closed"
+
+
+def test_neutral_probe_lets_next_call_probe():
+    gov = make()
+    trip(gov)
+    gov._release(ValueError("unparseable page"), probe=acquire(gov))
+    assert gov.stats()["circuit"] == "half_open"
+    assert acquire(gov) is True
+
+
+def test_slot_sync_tracks_probe():
+    gov = make()
+    trip(gov)
+    with gov.slot_sync():
+        assert gov.stats()["circuit"] == "half_open"
+    assert gov.stats()["circuit"] == "closed"
+    assert gov.stats()["inFlight"] == 0
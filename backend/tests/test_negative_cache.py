@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from backend import cache as disk_cache
+
+
+def test_ttls_are_seconds():
+    assert disk_cache.NEGATIVE_TTLS == {
+        "no_addresses": 6 * 3600.0,
+        "no_collections": 3600.0,
+        "upstream_error": 60.0,
+    }
+
+
+def test_env_float(monkeypatch):
+    monkeypatch.setenv("BINDICATOR_TEST_SECONDS", "90")
+    assert disk_cache._env_float("BINDICATOR_TEST_SECONDS", 60.0) == 90.0
+    monkeypatch.setenv("BINDICATOR_TEST_SECONDS", "1m")
+    assert disk_cache._env_float("BINDICATOR_TEST_SECONDS", 60.0) == 60.0
+
+
+def test_put_and_get(cache_dir):
+    disk_cache.put_negative("pc:SL6 6AH", "no_addresses", status=404, detail="none")
+    rec = disk_cache.get_negative("SL6 6AH")
+    assert (rec["outcome"], rec["status"], rec["detail"]) == ("no_addresses", 404, "none")
+    assert rec["expires"] == pytest.approx(time.time() + 6 * 3600, abs=5)
+
+    disk_cache.clear_negative("SL6 6AH")
+    assert disk_cache.get_negative("SL6 6AH") is None
+
+
+def test_entries_expire(cache_dir, monkeypatch):
+    monkeypatch.setitem(disk_cache.NEGATIVE_TTLS, "upstream_error", 0.05)
+    disk_cache.put_negative("uprn:1001", "upstream_error", status=502, detail="down")
+    assert disk_cache.get_negative("uprn:1001") is not None
+    time.sleep(0.1)
+    assert disk_cache.get_negative("uprn:1001") is None
+
+
+def test_zero_ttl_turns_outcome_off(cache_dir, monkeypatch):
+    monkeypatch.setitem(disk_cache.NEGATIVE_TTLS, "no_collections", 0.0)
+    disk_cache.put_negative("uprn:1001", "no_collections", status=502, detail="no table")
+    assert disk_cache.get_negative("uprn:1001") is None
+
+
+def test_no_addresses_is_a_cached_404(cache_dir):
+    from backend import main as m
+
+    rbwm = m._rbwm_scraper()
+
+    async def no_addresses():
+        raise rbwm.NoAddresses("empty list")
+
+    async def browser_crash():
+        raise RuntimeError("browser failed")
+
+    with pytest.raises(HTTPException) as failed:
+        asyncio.run(m._race_upstream("pc:SL66AH", no_addresses, browser_crash, what="postcode"))
+    assert failed.value.status_code == 404
+
+    repeat = m._negative_hit("pc:SL66AH")
+    assert (repeat.status_code, repeat.detail) == (404, failed.value.detail)
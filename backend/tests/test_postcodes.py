@@ -0,0 +1,89 @@
+import pytest
+
+from backend import postcodes
+
+
+@pytest.fixture
+def coverage(tmp_path, monkeypatch):
+    """Use a coverage file written by the test instead of rbwm_postcodes.txt."""
+    path = tmp_path / "coverage.txt"
+    monkeypatch.setattr(postcodes, "_COVERAGE_FILE", str(path))
+    monkeypatch.setattr(
+        postcodes, "_coverage", {"districts": frozenset(), "sectors": frozenset(), "mtime": None, "checked": 0.0}
+    )
+    monkeypatch.setenv("BINDICATOR_POSTCODE_COVERAGE", "true")
+
+    def write(text: str) -> None:
+        path.write_text(text, encoding="utf-8")
+        postcodes._coverage["checked"] = 0.0
+
+    return write
+
+
+@pytest.mark.parametrize(
+    "raw, pretty",
+    [
+        ("SL6 6AH", "SL6 6AH"),
+        ("sl66ah", "SL6 6AH"),
+        ("  sl6   6ah ", "SL6 6AH"),
+        ("SL60 1AA", "SL60 1AA"),
+        ("W1A 1AA", "W1A 1AA"),
+        ("EC1A 1BB", "EC1A 1BB"),
+        ("M1 1AE", "M1 1AE"),
+        ("B33 8TH", "B33 8TH"),
+        ("GIR 0AA", "GIR 0AA"),
+    ],
+)
+def test_canonical_accepts(raw, pretty):
+    assert postcodes.canonical(raw) == pretty
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "",
+        "SL6",
+        "SL6 6A",
+        "5AM 1AA",   # outward code must start with a letter
+        "QL6 6AH",   # Q never starts a postcode
+        "SL6 6CI",   # C and I are not used in the inward code
+        "SL6 AAH",   # inward code starts with a digit
+        "SL6 6AH X",
+        "S-6 6AH",
+    ],
+)
+def test_canonical_rejects(raw):
+    assert postcodes.canonical(raw) is None
+
+
+def test_coverage_districts_and_sectors(coverage):
+    coverage("SL6   # Maidenhead\nTW19 5\n\n# comment only\n")
+    assert postcodes.in_coverage("SL6 6AH")
+    assert postcodes.in_coverage("TW19 5AB")
+    assert not postcodes.in_coverage("TW19 6AB")
+    assert not postcodes.in_coverage("SL60 1AA")
+
+
+def test_check_reasons(coverage):
+    coverage("SL6\n")
+    assert postcodes.check("sl66ah", coverage=True) == ("SL6 6AH", None)
+    assert postcodes.check("SL9 9ZZ", coverage=True) == (None, "outside")
+    assert postcodes.check("SL9 9ZZ", coverage=False) == ("SL9 9ZZ", None)
+    assert postcodes.check("hello", coverage=True) == (None, "invalid")
+
+
+def test_coverage_can_be_switched_off(coverage, monkeypatch):
+    coverage("SL6\n")
+    monkeypatch.setenv("BINDICATOR_POSTCODE_COVERAGE", "false")
+    assert postcodes.check("SL9 9ZZ", coverage=True) == ("SL9 9ZZ", None)
+
+
+def test_missing_file_lets_everything_through(coverage):
+    assert postcodes.in_coverage("SL9 9ZZ")
+
+
+def test_bundled_list_covers_the_borough():
+    assert postcodes.canonical("SL6 6AH") is not None
+    districts, sectors = postcodes._parse(open(postcodes._COVERAGE_FILE, encoding="utf-8").read())
+    assert {"SL4", "SL5", "SL6"} <= districts
+    assert "TW19 5" in sectors
@@ -0,0 +1,56 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from backend import prefetch
+
+NOON = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "at, expected",
+    [
+        ("05:00", datetime(2026, 3, 11, 5, 0, tzinfo=timezone.utc)),
+        ("12:30", datetime(2026, 3, 10, 12, 30, tzinfo=timezone.utc)),
+        ("23:59", datetime(2026, 3, 10, 23, 59, tzinfo=timezone.utc)),
+        ("7", datetime(2026, 3, 11, 7, 0, tzinfo=timezone.utc)),
+    ],
+)
+def test_next_run_after(at, expected):
+    assert prefetch.next_run_after(NOON, at) == expected
+
+
+def test_next_run_is_strictly_after_now():
+    assert prefetch.next_run_after(NOON, "12:00") == datetime(2026, 3, 11, 12, 0, tzinfo=timezone.utc)
+
+
+def test_next_run_keeps_the_zone():
+    assert prefetch.next_run_after(NOON, "05:00").tzinfo is timezone.utc
+
+
+@pytest.mark.parametrize("at", ["5am", "25:00", "12:60", "12:5", "", ":30", "-1:00"])
+def test_parse_at_rejects_malformed(at):
+    with pytest.raises(ValueError):
+        prefetch.parse_at(at)
+
+
+def test_start_falls_back_on_malformed_time(monkeypatch):
+    monkeypatch.setattr(prefetch, "_AT", "5am")
+    monkeypatch.setenv("BINDICATOR_PREFETCH", "true")
+    monkeypatch.setenv("BINDICATOR_PREFETCH_ON_STARTUP", "false")
+
+    async def refresh(_key):
+        return None
+
+    async def scenario():
+        prefetch.start(refresh, include_uprn=False)
+        try:
+            await asyncio.sleep(0)
+            return prefetch.stats()
+        finally:
+            await prefetch.stop()
+
+    stats = asyncio.run(scenario())
+    assert stats["at"] == "05:00"
+    assert stats["nextRunAt"] is not None
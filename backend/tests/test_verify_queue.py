@@ -0,0 +1,15 @@
+from backend import verify_queue
+
+
+def test_recently_checked_entries_expire(monkeypatch):
+    monkeypatch.setattr(verify_queue, "_recently_checked", {})
+    monkeypatch.setattr(verify_queue, "_RECHECK_SECONDS", 10.0)
+    verify_queue._mark_checked("SL6 6AH", 0.0)
+    verify_queue._mark_checked("SL4 1AA", 5.0)
+    verify_queue._mark_checked("SL6 6AH", 6.0)  # re-checked: moves to the back
+
+    verify_queue._prune_checked(15.0)
+    assert list(verify_queue._recently_checked) == ["SL6 6AH"]
+
+    verify_queue._prune_checked(16.0)
+    assert verify_queue._recently_checked == {}
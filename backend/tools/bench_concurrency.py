@@ -0,0 +1,153 @@
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Concurrency benchmark: how many upstream lookups one worker keeps in flight.
+#
+# "before" replays the old handler shape (a sync `def` endpoint in Starlette's
+# threadpool doing blocking upstream I/O); "after" drives the real async
+# /api/bins?uprn=...&refresh=true. RBWM is simulated by a mock transport that
+# answers every request after --latency seconds, so no network is needed.
+
+os.environ["BINDICATOR_DATASOURCE"] = "rbwm"
+os.environ.setdefault("RBWM_HTTP_WARMUP", "false")
+os.environ.setdefault("BINDICATOR_LOG_LEVEL", "WARNING")
+# Measure handler capacity, not the upstream governor's politeness limits
+for _name in ("RBWM_RATE_PER_SEC", "RBWM_RATE_BURST", "RBWM_CONCURRENCY_INITIAL", "RBWM_CONCURRENCY_MAX"):
+    os.environ.setdefault(_name, "100000")
+
+# Ensure repository root on sys.path so 'backend' package imports cleanly
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import httpx
+from fastapi import FastAPI, Query
+
+from backend import cache as disk_cache
+from backend import main as m
+from backend.scraper import http_client as rbwm_http
+from backend.scraper import rbwm
+
+SCHEDULE_PAGE = (
+    '<div class="widget-bin-collections"><p>Address: 1 High Street, Maidenhead SL6 1AA</p>'
+    "<table><tbody>"
+    "<tr><td>Recycling</td><td>3rd November 2099</td></tr>"
+    "<tr><td>Refuse</td><td>3rd November 2099</td></tr>"
+    "<tr><td>Recycling</td><td>10th November 2099</td></tr>"
+    "<tr><td>Garden Waste</td><td>10th November 2099</td></tr>"
+    "</tbody></table></div>"
+)
+
+
+class Upstream:
+    """Fake RBWM that counts how many requests are being served at once."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def _enter(self) -> None:
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _leave(self) -> None:
+        with self.lock:
+            self.in_flight -= 1
+
+    def reset(self) -> None:
+        self.in_flight = self.peak = 0
+
+    def handler(self, _request: httpx.Request) -> httpx.Response:
+        self._enter()
+        try:
+            time.sleep(self.latency)
+        finally:
+            self._leave()
+        return httpx.Response(200, text=SCHEDULE_PAGE)
+
+    async def ahandler(self, _request: httpx.Request) -> httpx.Response:
+        self._enter()
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self._leave()
+        return httpx.Response(200, text=SCHEDULE_PAGE)
+
+
+def legacy_app() -> FastAPI:
+    """The pre-async handler shape: blocking upstream call inside a threadpool worker."""
+    app = FastAPI()
+
+    @app.get("/api/bins")
+    def get_bins(uprn: str = Query(...)):
+        scrape = rbwm.fetch_rbwm_schedule_by_uprn_http(uprn)
+        return m.build_response_from_scrape(scrape, source="rbwm", cached=False)
+
+    return app
+
+
+async def drive(app: FastAPI, concurrency: int, upstream: Upstream) -> dict:
+    upstream.reset()
+    latencies = []
+
+    async def one(client: httpx.AsyncClient, i: int) -> None:
+        t0 = time.perf_counter()
+        r = await client.get("/api/bins", params={"uprn": str(100000 + i), "refresh": "true"})
+        r.raise_for_status()
+        latencies.append(time.perf_counter() - t0)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        t0 = time.perf_counter()
+        await asyncio.gather(*(one(client, i) for i in range(concurrency)))
+        wall = time.perf_counter() - t0
+    latencies.sort()
+    return {
+        "peak": upstream.peak,
+        "wall": wall,
+        "rps": concurrency / wall,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(0.95 * (len(latencies) - 1))],
+    }
+
+
+async def main(levels: list[int], latency: float) -> None:
+    upstream = Upstream(latency)
+    rbwm_http.use_clients(
+        client=httpx.Client(transport=httpx.MockTransport(upstream.handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(upstream.ahandler)),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        store = disk_cache.JsonFileBackend(os.path.join(tmp, "cache.json"))
+        store.load()
+        disk_cache.set_backend(store)
+        apps = {"before": legacy_app(), "after": m.app}
+
+        print(f"simulated upstream latency: {latency * 1000:.0f} ms")
+        print(f"{'mode':<7} {'requests':>8} {'in-flight':>9} {'wall s':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8}")
+        for n in levels:
+            for mode, app in apps.items():
+                r = await drive(app, n, upstream)
+                print(
+                    f"{mode:<7} {n:>8} {r['peak']:>9} {r['wall']:>8.2f} {r['rps']:>8.1f}"
+                    f" {r['p50'] * 1000:>8.0f} {r['p95'] * 1000:>8.0f}"
+                )
+        disk_cache.close_cache()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent in-flight lookups, sync vs async handlers")
+    parser.add_argument("--levels", default="10,50,100,200", help="comma-separated concurrent request counts")
+    parser.add_argument("--latency", type=float, default=0.5, help="simulated RBWM response time in seconds")
+    args = parser.parse_args()
+    asyncio.run(main([int(x) for x in args.levels.split(",")], args.latency))
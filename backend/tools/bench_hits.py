@@ -0,0 +1,158 @@
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Cache-hit throughput benchmark: requests per second for /api/bins when every
+# request is a cache hit.
+#
+# "before" is the old hit path (copy the stored dict, then FastAPI validates it
+# against BinResponse and serialises it on every request), forced by switching
+# the pre-rendered store off; "after" answers repeat hits with the stored JSON
+# bytes. Requests are fed straight to the ASGI app, with no HTTP client or
+# server in the way, so the numbers are the handler's own cost.
+
+os.environ.setdefault("BINDICATOR_DATASOURCE", "mock")
+os.environ.setdefault("BINDICATOR_LOG_LEVEL", "WARNING")
+
+# Ensure repository root on sys.path so 'backend' package imports cleanly
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend import cache as disk_cache
+from backend import main as m
+
+# Inward-code letters the postcode grammar allows
+_LETTERS = "ABDEFGHJLNPQRSTUWXYZ"
+
+
+def postcodes(n: int) -> List[str]:
+    return [f"SL6 {i % 10}{_LETTERS[i // 10 % 20]}{_LETTERS[i // 200 % 20]}" for i in range(n)]
+
+
+def populate(keys: List[str]) -> None:
+    start = date.today() + timedelta(days=1)
+    for i, pc in enumerate(keys):
+        schedule = [
+            {"date": (start + timedelta(days=7 * w)).isoformat(), "bins": ["blue", "black" if (i + w) % 2 else "green"]}
+            for w in range(8)
+        ]
+        first = schedule[0]
+        data = {
+            "postcode": pc,
+            "nextCollectionDate": first["date"],
+            "nextCollectionDay": date.fromisoformat(first["date"]).strftime("%A"),
+            "bins": first["bins"],
+            "source": "mock",
+            "cached": False,
+            "fetchedAt": datetime.now(timezone.utc).isoformat(),
+            "noCollections": False,
+        }
+        disk_cache.update_cache(pc, data, schedule=schedule)
+
+
+async def call(path: str, query: str) -> bytes:
+    """One GET through the ASGI app; returns the body."""
+    scope: Dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    chunks: List[bytes] = []
+    status: List[int] = []
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await m.app(scope, receive, send)
+    if status != [200]:
+        raise RuntimeError(f"{path}?{query}: HTTP {status}")
+    return b"".join(chunks)
+
+
+async def drive(queries: List[str], concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    it = iter(queries)
+
+    async def worker() -> None:
+        for q in it:
+            t0 = time.perf_counter()
+            await call("/api/bins", q)
+            latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - t0
+    latencies.sort()
+    return {
+        "rps": len(queries) / wall,
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(0.99 * (len(latencies) - 1))],
+    }
+
+
+async def main(requests: int, keys: int, concurrency: int, rounds: int) -> None:
+    pcs = postcodes(keys)
+    queries = [f"postcode={pcs[i % keys].replace(' ', '+')}" for i in range(requests)]
+    limit = m._HIT_BYTES_MAX or 10000
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the cache and its side stores (access counts, negative cache) out of backend/data
+        disk_cache._DATA_DIR = tmp
+        store = disk_cache.JsonFileBackend(os.path.join(tmp, "cache.json"), flush_ms=250)
+        store.load()
+        disk_cache.set_backend(store)
+        populate(pcs)
+
+        # Same body either way
+        m._HIT_BYTES_MAX = 0
+        before_body = await call("/api/bins", queries[0])
+        m._HIT_BYTES_MAX = limit
+        await call("/api/bins", queries[0])
+        assert await call("/api/bins", queries[0]) == before_body, "pre-rendered body differs"
+
+        print(f"{requests} hits over {keys} keys, {concurrency} concurrent, best of {rounds}")
+        print(f"{'mode':<7} {'req/s':>9} {'p50 us':>8} {'p99 us':>8}")
+        results = {}
+        for mode, enabled in (("before", False), ("after", True)):
+            m._hit_bytes.clear()
+            m._HIT_BYTES_MAX = limit if enabled else 0
+            await drive(queries[: min(len(queries), keys * 2)], concurrency)  # warm up (and render)
+            runs = [await drive(queries, concurrency) for _ in range(rounds)]
+            best = max(runs, key=lambda r: r["rps"])
+            results[mode] = best
+            print(f"{mode:<7} {best['rps']:>9.0f} {best['p50'] * 1e6:>8.0f} {best['p99'] * 1e6:>8.0f}")
+        print(f"speed-up: {results['after']['rps'] / results['before']['rps']:.2f}x")
+        disk_cache.close_access()
+        disk_cache.close_cache()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="/api/bins cache-hit throughput, re-rendered vs pre-rendered")
+    parser.add_argument("--requests", type=int, default=20000, help="hits per round")
+    parser.add_argument("--keys", type=int, default=500, help="distinct postcodes in the cache")
+    parser.add_argument("--concurrency", type=int, default=16, help="requests in flight at once")
+    parser.add_argument("--rounds", type=int, default=3, help="rounds per mode (best is reported)")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.keys, args.concurrency, args.rounds))
@@ -0,0 +1,77 @@
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Parser benchmark over saved RBWM pages (backend/tools/samples/*.html).
+# Reports wall time per page and Python-heap allocations per parse (tracemalloc)
+# for every installed parser backend. Memory allocated inside C parsers
+# (selectolax, lxml) is not visible to tracemalloc.
+
+# Ensure repository root on sys.path so 'backend' package imports cleanly
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.scraper import parse
+
+SAMPLES = Path(__file__).resolve().parent / "samples"
+
+
+def _parser_for(path: Path):
+    if path.name.startswith("addresses"):
+        return parse.parse_addresses
+    return parse.parse_schedule
+
+
+def _time_per_page(fn, html: str, backend: str, iterations: int) -> float:
+    for _ in range(3):
+        fn(html, backend=backend)
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        fn(html, backend=backend)
+    return (time.perf_counter() - t0) / iterations
+
+
+def _allocations(fn, html: str, backend: str) -> tuple[int, int]:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        fn(html, backend=backend)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(max(0, s.count_diff) for s in after.compare_to(before, "lineno"))
+    return peak, blocks
+
+
+def run(iterations: int) -> None:
+    backends = parse.available_backends()
+    print(f"backends: {', '.join(backends)} (default: {parse.BACKEND})")
+    print(f"{'page':<32} {'backend':<11} {'ms/page':>8} {'pages/s':>8} {'peak KiB':>9} {'blocks':>7}")
+    for path in sorted(SAMPLES.glob("*.html")):
+        html = path.read_text(encoding="utf-8")
+        fn = _parser_for(path)
+        baseline = None
+        for backend in backends:
+            per_page = _time_per_page(fn, html, backend, iterations)
+            peak, blocks = _allocations(fn, html, backend)
+            if backend == "bs4":
+                baseline = per_page
+            print(
+                f"{path.name:<32} {backend:<11} {per_page * 1000:>8.3f} {1 / per_page:>8.0f}"
+                f" {peak / 1024:>9.1f} {blocks:>7}"
+            )
+        if baseline is not None:
+            fastest = min(_time_per_page(fn, html, b, iterations) for b in backends)
+            print(f"{'':<32} {'speed-up vs bs4':<20} {baseline / fastest:>5.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse time and allocations per RBWM sample page")
+    parser.add_argument("--iterations", type=int, default=200, help="parses per page and backend")
+    args = parser.parse_args()
+    run(args.iterations)
@@ -0,0 +1,227 @@
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Playwright extraction benchmark: wall time to pull the address list and a
+# schedule out of an already-loaded page.
+#
+# "before" replays the old per-element extraction (a locator call, and so a
+# browser round trip, per link, row and cell); "after" is the scraper's single
+# page.content() + parse. With --browser the pages are served to a real
+# headless Chromium via page.route() from backend/tools/samples; without it a
+# simulated page answers each awaited call after --ipc-ms, which is what a
+# round trip to the browser process costs.
+
+# Ensure repository root on sys.path so 'backend' package imports cleanly
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from bs4 import BeautifulSoup
+
+from backend.scraper import rbwm
+
+SAMPLES = Path(__file__).resolve().parent / "samples"
+ADDRESSES = (SAMPLES / "addresses_SL6_6AH.html").read_text(encoding="utf-8")
+SCHEDULE = (SAMPLES / "schedule_100000012.html").read_text(encoding="utf-8")
+
+
+# --- "before": the per-element extraction the scrapers used to do ---
+
+async def legacy_addresses(page: Any) -> List[rbwm.RBWMAddress]:
+    links = page.locator("a", has_text="Select this address")
+    count = await links.count()
+    results: List[rbwm.RBWMAddress] = []
+    for i in range(count):
+        a = links.nth(i)
+        href = await a.get_attribute("href")
+        if not href or "uprn=" not in href:
+            continue
+        uprn = href.split("uprn=")[-1].split("&")[0]
+        addr_text = ""
+        row = a.locator("xpath=ancestor::tr[1]")
+        if await row.count():
+            first_td = row.locator("td").first
+            if await first_td.count():
+                addr_text = (await first_td.inner_text()).strip()
+        if not addr_text:
+            addr_text = await a.evaluate("el => (el.parentElement && el.parentElement.innerText) || ''")
+            addr_text = addr_text.replace("Select this address", "").strip()
+        results.append(rbwm.RBWMAddress(uprn=uprn, address=addr_text or uprn))
+    return results
+
+
+async def legacy_schedule(page: Any) -> int:
+    container = page.locator(".widget-bin-collections")
+    await container.first.wait_for(timeout=60000)
+    rows = container.locator("table tbody tr")
+    rc = await rows.count()
+    found = 0
+    for i in range(rc):
+        cols = rows.nth(i).locator("td")
+        if await cols.count() < 2:
+            continue
+        await cols.nth(0).inner_text()
+        if rbwm.parse.parse_date((await cols.nth(1).inner_text()).strip()) is not None:
+            found += 1
+    await container.first.inner_text()
+    return found
+
+
+# --- "after": what the scrapers do now ---
+
+async def current_addresses(page: Any) -> List[rbwm.RBWMAddress]:
+    return await rbwm._addresses_from_page(page)
+
+
+async def current_schedule(page: Any) -> int:
+    table = await rbwm._schedule_from_page(page)
+    return sum(len(services) for services in table.services_by_date.values())
+
+
+# --- simulated page: just enough of the Playwright Page/Locator API ---
+
+class _SimLocator:
+    def __init__(self, page: "_SimPage", resolve: Callable[[], list]):
+        self._page = page
+        self._query = resolve
+        self._found: Any = None
+
+    def _resolve(self) -> list:
+        # The DOM is static, so resolve once; only the simulated round trip should cost time
+        if self._found is None:
+            self._found = self._query()
+        return self._found
+
+    def nth(self, i: int) -> "_SimLocator":
+        return _SimLocator(self._page, lambda: self._resolve()[i : i + 1])
+
+    @property
+    def first(self) -> "_SimLocator":
+        return self.nth(0)
+
+    def locator(self, selector: str) -> "_SimLocator":
+        if selector == "xpath=ancestor::tr[1]":
+            return _SimLocator(self._page, lambda: [el.find_parent("tr") for el in self._resolve() if el.find_parent("tr")])
+        return _SimLocator(self._page, lambda: [m for el in self._resolve() for m in el.select(selector)])
+
+    async def count(self) -> int:
+        await self._page.round_trip()
+        return len(self._resolve())
+
+    async def get_attribute(self, name: str) -> Any:
+        await self._page.round_trip()
+        return self._resolve()[0].get(name)
+
+    async def inner_text(self) -> str:
+        await self._page.round_trip()
+        return self._resolve()[0].get_text("\n", strip=True)
+
+    async def evaluate(self, _script: str) -> str:
+        await self._page.round_trip()
+        parent = self._resolve()[0].parent
+        return parent.get_text("\n", strip=True) if parent is not None else ""
+
+    async def wait_for(self, timeout: float = 0) -> None:
+        await self._page.round_trip()
+        if not self._resolve():
+            raise RuntimeError("element not found")
+
+
+class _SimPage:
+    def __init__(self, html: str, latency: float):
+        self._html = html
+        self._soup = BeautifulSoup(html, "html.parser")
+        self._latency = latency
+        self.round_trips = 0
+
+    async def round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self._latency)
+
+    def locator(self, selector: str, has_text: str = "") -> _SimLocator:
+        return _SimLocator(
+            self, lambda: [el for el in self._soup.select(selector) if has_text in el.get_text(" ", strip=True)]
+        )
+
+    async def content(self) -> str:
+        await self.round_trip()
+        return self._html
+
+
+# --- runners ---
+
+CASES = [
+    ("addresses", ADDRESSES, legacy_addresses, current_addresses),
+    ("schedule", SCHEDULE, legacy_schedule, current_schedule),
+]
+
+
+def _report(name: str, shape: str, times: List[float], round_trips: Any) -> None:
+    print(
+        f"{name:<10} {shape:<7} {statistics.median(times) * 1000:>9.1f} {max(times) * 1000:>9.1f} {round_trips!s:>12}"
+    )
+
+
+async def run_simulated(runs: int, latency: float) -> None:
+    print(f"simulated page, {latency * 1000:g} ms per browser round trip, {runs} runs")
+    print(f"{'page':<10} {'shape':<7} {'median ms':>9} {'max ms':>9} {'round trips':>12}")
+    for name, html, before, after in CASES:
+        for shape, fn in (("before", before), ("after", after)):
+            times = []
+            trips = 0
+            for _ in range(runs):
+                page = _SimPage(html, latency)
+                t0 = time.perf_counter()
+                await fn(page)
+                times.append(time.perf_counter() - t0)
+                trips = page.round_trips
+            _report(name, shape, times, trips)
+
+
+async def run_browser(runs: int) -> None:
+    from playwright.async_api import async_playwright
+
+    print(f"headless Chromium, pages served from {SAMPLES.name}/, {runs} runs")
+    print(f"{'page':<10} {'shape':<7} {'median ms':>9} {'max ms':>9} {'round trips':>12}")
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+        context = await browser.new_context()
+        bodies: Dict[str, str] = {}
+
+        async def serve(route: Any) -> None:
+            await route.fulfill(status=200, content_type="text/html; charset=utf-8", body=bodies["current"])
+
+        await context.route("**/bincollections*", serve)
+        page = await context.new_page()
+        try:
+            for name, html, before, after in CASES:
+                bodies["current"] = html
+                await page.goto(rbwm._schedule_url("0"), wait_until="domcontentloaded")
+                for shape, fn in (("before", before), ("after", after)):
+                    await fn(page)
+                    times = []
+                    for _ in range(runs):
+                        t0 = time.perf_counter()
+                        await fn(page)
+                        times.append(time.perf_counter() - t0)
+                    _report(name, shape, times, "-")
+        finally:
+            await context.close()
+            await browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Playwright extraction wall time: per-element vs one page.content()")
+    parser.add_argument("--runs", type=int, default=5, help="extractions per page and shape")
+    parser.add_argument("--ipc-ms", type=float, default=1.0, help="simulated browser round-trip latency")
+    parser.add_argument("--browser", action="store_true", help="use a real headless Chromium instead")
+    args = parser.parse_args()
+    if args.browser:
+        asyncio.run(run_browser(args.runs))
+    else:
+        asyncio.run(run_simulated(args.runs, args.ipc_ms / 1000))
@@ -0,0 +1,146 @@
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Background verification during an RBWM outage: a queued postcode whose sampled
+# schedule fetches all fail (503) must be retried, not recorded as a single
+# route. The fake RBWM then recovers and the retry has to store a real verdict.
+# Runs offline against a mock transport; exits non-zero if a check fails.
+
+os.environ["BINDICATOR_DATASOURCE"] = "rbwm"
+os.environ["BINDICATOR_VERIFY_WORKERS"] = "1"
+os.environ["BINDICATOR_VERIFY_RETRY_SECONDS"] = "0.5"
+os.environ["BINDICATOR_VERIFY_MAX_ATTEMPTS"] = "5"
+os.environ["BINDICATOR_PREFETCH"] = "false"
+os.environ["RBWM_BROWSER_POOL"] = "false"
+os.environ["RBWM_HTTP_WARMUP"] = "false"
+os.environ.setdefault("BINDICATOR_LOG_LEVEL", "CRITICAL")
+# Keep the breaker and rate limiter out of the way; this checks the queue, not the governor
+for _name in ("RBWM_RATE_PER_SEC", "RBWM_RATE_BURST", "RBWM_BREAKER_FAILURES"):
+    os.environ.setdefault(_name, "100000")
+
+# Ensure repository root on sys.path so 'backend' package imports cleanly
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import httpx
+from fastapi.testclient import TestClient
+
+from backend import cache as disk_cache
+from backend import main as m
+from backend.scraper import http_client as rbwm_http
+
+POSTCODE = "SL6 6AH"
+
+ADDRESS_PAGE = (
+    "<table><tbody>"
+    + "".join(
+        f'<tr><td>{n} The Crescent, Maidenhead, SL6 6AH</td>'
+        f'<td><a href="/bincollections?uprn={1000 + n}">Select this address</a></td></tr>'
+        for n in range(1, 9)
+    )
+    + "</tbody></table>"
+)
+
+
+def schedule_page(uprn: int) -> str:
+    # Even and odd UPRNs are on different routes
+    refuse_first = uprn % 2 == 0
+    rows = [
+        ("3rd", "Recycling"),
+        ("3rd", "Refuse" if refuse_first else "Garden Waste"),
+        ("10th", "Recycling"),
+        ("10th", "Garden Waste" if refuse_first else "Refuse"),
+    ]
+    body = "".join(f"<tr><td>{svc}</td><td>{day} November 2099</td></tr>" for day, svc in rows)
+    return (
+        '<div class="widget-bin-collections"><p>Address: 1 The Crescent, Maidenhead SL6 6AH</p>'
+        f"<table><tbody>{body}</tbody></table></div>"
+    )
+
+
+class Upstream:
+    """Fake RBWM: address lists always work, schedules answer 503 while ``down``."""
+
+    def __init__(self) -> None:
+        self.down = True
+        self.schedule_calls = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        uprn = request.url.params.get("uprn")
+        if uprn is None:
+            return httpx.Response(200, text=ADDRESS_PAGE)
+        self.schedule_calls += 1
+        if self.down:
+            return httpx.Response(503, text="Service Unavailable")
+        return httpx.Response(200, text=schedule_page(int(uprn)))
+
+
+def wait_for(client: TestClient, done, timeout: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        q = client.get("/api/verify/queue").json()
+        if done(q) or time.monotonic() > deadline:
+            return q
+        time.sleep(0.05)
+
+
+def check(label: str, ok: bool, failures: list) -> None:
+    print(("PASS " if ok else "FAIL ") + label)
+    if not ok:
+        failures.append(label)
+
+
+def run() -> int:
+    upstream = Upstream()
+    rbwm_http.use_clients(async_client=httpx.AsyncClient(transport=httpx.MockTransport(upstream.handler)))
+    failures: list = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the cache and its side stores (verify jobs, address index, ...) out of backend/data
+        disk_cache._DATA_DIR = tmp
+        disk_cache._CACHE_FILE = os.path.join(tmp, "cache.json")
+        with TestClient(m.app) as client:
+            disk_cache.update_cache(
+                POSTCODE,
+                {
+                    "postcode": POSTCODE,
+                    "nextCollectionDate": "2099-11-03",
+                    "nextCollectionDay": "Tuesday",
+                    "bins": ["blue", "black"],
+                    "source": "rbwm",
+                    "cached": False,
+                    "fetchedAt": datetime.now(timezone.utc).isoformat(),
+                },
+            )
+
+            print("--- Outage: every schedule fetch answers 503 ---")
+            queued = client.post("/api/verify/queue", params={"postcode": POSTCODE}).json()
+            check("postcode queued", queued.get("queued") is True, failures)
+            q = wait_for(client, lambda s: s["failures"] >= 1)
+            entry = disk_cache.get_entry(POSTCODE) or {}
+            check("schedules were requested", upstream.schedule_calls > 0, failures)
+            check("run counted as a failure", q["failures"] >= 1, failures)
+            check("run not counted as completed", q["completed"] == 0, failures)
+            check("job kept for retry", q["pending"] == 1 and q["abandoned"] == 0, failures)
+            check("no mixed_routes stamp", not entry.get("mixed_routes_checked"), failures)
+            check("re-check not throttled", not disk_cache.should_throttle_verify(POSTCODE), failures)
+
+            print("--- Recovery: the retry stores a verdict ---")
+            upstream.down = False
+            q = wait_for(client, lambda s: s["completed"] >= 1)
+            entry = disk_cache.get_entry(POSTCODE) or {}
+            check("retry completed", q["completed"] == 1 and q["pending"] == 0, failures)
+            check("mixed routes recorded", entry.get("mixed_routes") is True, failures)
+        disk_cache.close_access()
+        disk_cache.close_negative()
+        disk_cache.close_cache()
+    print("OK" if not failures else f"{len(failures)} check(s) failed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,247 @@
+"""Background mixed-route verification.
+
+Postcodes waiting for verification are kept in a persistent job store (a
+``verify_jobs`` store next to the cache, JSON or SQLite like the rest) so a
+restart picks up where it left off. ``BINDICATOR_VERIFY_WORKERS`` tasks on the
+app's event loop take jobs one at a time; a postcode is queued at most once, and
+postcodes verified within the last ``BINDICATOR_VERIFY_THROTTLE_HOURS`` are
+skipped. Failed jobs are retried with back-off up to
+``BINDICATOR_VERIFY_MAX_ATTEMPTS`` times.
+"""
+import asyncio
+import collections
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+# Import cache module in a way that works both as a package and as a script
+try:
+    from . import cache as disk_cache  # type: ignore
+except Exception:
+    try:
+        from backend import cache as disk_cache  # type: ignore
+    except Exception:
+        import cache as disk_cache  # type: ignore
+
+log = logging.getLogger("bindicator.verify")
+
+_WORKERS = int(os.getenv("BINDICATOR_VERIFY_WORKERS", "1"))
+_MAX_ATTEMPTS = max(1, int(os.getenv("BINDICATOR_VERIFY_MAX_ATTEMPTS", "3")))
+_RETRY_SECONDS = float(os.getenv("BINDICATOR_VERIFY_RETRY_SECONDS", "300"))
+_THROTTLE_HOURS = int(os.getenv("BINDICATOR_VERIFY_THROTTLE_HOURS", "24"))
+# Completions remembered for the throughput figure
+_RATE_WINDOW_SECONDS = 900.0
+# How long a "verified recently" answer is trusted before the cache entry is read again
+_RECHECK_SECONDS = 600.0
+
+_lock = threading.Lock()
+_store: Optional[disk_cache.CacheBackend] = None
+_queue: Optional["asyncio.Queue[str]"] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_workers: List["asyncio.Task[None]"] = []
+_verify: Optional[Callable[[str], Awaitable[Any]]] = None
+# Postcodes with a job (queued, running or waiting to retry)
+_pending: Set[str] = set()
+_running: Set[str] = set()
+_completions: Deque[float] = collections.deque()
+# Postcode -> monotonic time until which offer() skips it without reading the cache.
+# Kept in expiry order (every entry gets the same lifetime) so expired ones are dropped from the front.
+_recently_checked: Dict[str, float] = {}
+STATS: Dict[str, int] = {
+    "enqueued": 0,
+    "deduplicated": 0,
+    "throttled": 0,
+    "completed": 0,
+    "failures": 0,
+    "abandoned": 0,
+}
+_last: Dict[str, Any] = {"completedAt": None, "error": None}
+
+
+def _count(name: str) -> None:
+    with _lock:
+        STATS[name] += 1
+
+
+def enabled() -> bool:
+    return _WORKERS > 0
+
+
+def _mark_checked(key: str, now: float) -> None:
+    """Skip ``key`` in offer() for a while. Caller holds _lock."""
+    _recently_checked.pop(key, None)
+    _recently_checked[key] = now + _RECHECK_SECONDS
+
+
+def _prune_checked(now: float) -> None:
+    """Drop expired _recently_checked entries. Caller holds _lock."""
+    while _recently_checked:
+        key = next(iter(_recently_checked))
+        if _recently_checked[key] > now:
+            break
+        del _recently_checked[key]
+
+
+def _put(postcode: str) -> None:
+    if _queue is not None:
+        _queue.put_nowait(postcode)
+
+
+def offer(postcode: str) -> bool:
+    """Queue ``postcode`` for verification unless it is already queued or was verified
+    recently. Returns True if a job was added. Safe to call from any thread."""
+    if _queue is None or _store is None:
+        return False
+    key = disk_cache._pretty_postcode(postcode)
+    now = time.monotonic()
+    with _lock:
+        _prune_checked(now)
+        if key in _pending:
+            STATS["deduplicated"] += 1
+            return False
+        if _recently_checked.get(key, 0.0) > now:
+            STATS["throttled"] += 1
+            return False
+    if disk_cache.should_throttle_verify(key, hours=_THROTTLE_HOURS):
+        with _lock:
+            STATS["throttled"] += 1
+            _mark_checked(key, now)
+        return False
+    with _lock:
+        if key in _pending:
+            STATS["deduplicated"] += 1
+            return False
+        _pending.add(key)
+        STATS["enqueued"] += 1
+    _store.put(key, {"postcode": key, "enqueued_at": datetime.now(timezone.utc).isoformat(), "attempts": 0})
+    if _loop is not None:
+        _loop.call_soon_threadsafe(_put, key)
+    log.info("[verify] Queued %s", key)
+    return True
+
+
+def _finish(key: str) -> None:
+    with _lock:
+        _pending.discard(key)
+    if _store is not None:
+        _store.delete([key])
+
+
+async def _work() -> None:
+    assert _queue is not None and _store is not None and _verify is not None
+    while True:
+        key = await _queue.get()
+        try:
+            if disk_cache.should_throttle_verify(key, hours=_THROTTLE_HOURS):
+                # Verified some other way (e.g. the debug endpoint) since it was queued
+                _count("throttled")
+                _finish(key)
+                continue
+            with _lock:
+                _running.add(key)
+            try:
+                await _verify(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                _retry_or_drop(key, exc)
+                continue
+            finally:
+                with _lock:
+                    _running.discard(key)
+            now = time.monotonic()
+            with _lock:
+                STATS["completed"] += 1
+                _completions.append(now)
+                _mark_checked(key, now)
+                _last["completedAt"] = datetime.now(timezone.utc).isoformat()
+            _finish(key)
+        finally:
+            _queue.task_done()
+
+
+def _retry_or_drop(key: str, exc: Exception) -> None:
+    assert _store is not None
+    job = _store.get(key) or {"postcode": key, "attempts": 0}
+    attempts = int(job.get("attempts", 0)) + 1
+    with _lock:
+        STATS["failures"] += 1
+        _last["error"] = f"{key}: {exc}"
+    if attempts >= _MAX_ATTEMPTS:
+        log.warning("[verify] Giving up on %s after %s attempts: %s", key, attempts, exc)
+        _count("abandoned")
+        _finish(key)
+        return
+    delay = _RETRY_SECONDS * 2 ** (attempts - 1)
+    log.warning("[verify] %s failed (attempt %s/%s), retrying in %.0fs: %s", key, attempts, _MAX_ATTEMPTS, delay, exc)
+    _store.put(key, {**job, "attempts": attempts, "last_error": str(exc)})
+    if _loop is not None:
+        _loop.call_later(delay, _put, key)
+
+
+async def start(verify: Callable[[str], Awaitable[Any]]) -> None:
+    """Open the job store, requeue unfinished jobs and start the workers (app lifespan).
+    ``verify(postcode)`` runs one verification and records its result; it must raise if
+    the run failed or was inconclusive (no address schedule fetched), so the job is retried."""
+    global _store, _queue, _loop, _verify
+    if not enabled() or _queue is not None:
+        return
+    store = disk_cache.create_backend("verify_jobs")
+    store.load()
+    _store, _verify = store, verify
+    _loop = asyncio.get_running_loop()
+    _queue = asyncio.Queue()
+    unfinished = sorted(store.items().values(), key=lambda job: str(job.get("enqueued_at") or ""))
+    for job in unfinished:
+        key = str(job.get("postcode") or "")
+        if key and key not in _pending:
+            _pending.add(key)
+            _queue.put_nowait(key)
+    if unfinished:
+        log.info("[verify] Resuming %s queued verification(s)", len(unfinished))
+    _workers.extend(asyncio.create_task(_work()) for _ in range(_WORKERS))
+
+
+async def stop() -> None:
+    global _store, _queue, _loop, _verify
+    workers = list(_workers)
+    _workers.clear()
+    for task in workers:
+        task.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    store, _store = _store, None
+    _queue, _loop, _verify = None, None, None
+    with _lock:
+        # Jobs stay in the store and are picked up again on the next start
+        _pending.clear()
+        _running.clear()
+        _recently_checked.clear()
+    if store is not None:
+        store.close()
+
+
+def stats() -> Dict[str, Any]:
+    now = time.monotonic()
+    queue, store = _queue, _store
+    with _lock:
+        while _completions and now - _completions[0] > _RATE_WINDOW_SECONDS:
+            _completions.popleft()
+        recent = len(_completions)
+        out: Dict[str, Any] = {
+            "enabled": enabled(),
+            "running": queue is not None,
+            "workers": len(_workers),
+            "depth": queue.qsize() if queue is not None else 0,
+            "pending": len(_pending),
+            "inProgress": sorted(_running),
+            "retrying": max(0, len(_pending) - len(_running) - (queue.qsize() if queue is not None else 0)),
+            "completedPerMinute": round(recent / (_RATE_WINDOW_SECONDS / 60), 2),
+            "lastCompletedAt": _last["completedAt"],
+            "lastError": _last["error"],
+            **STATS,
+        }
+    out["stored"] = store.count() if store is not None else 0
+    return out